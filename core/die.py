@@ -7,21 +7,41 @@ class InvalidDieExpression(Exception):
     pass
 
 
-# The Die class doesn't store any data, just has one method: roll.
+# The Die class doesn't store any data, it just rolls (and parses) dice.
 #
 # Usage:
 # total, roll_history = Die.roll('3d6')
 # 
 # Example response:
 # 12, (4,2,6)
+#
+# Die.parse splits an expression without rolling it, for code that rolls the
+# same expression many times (e.g. in bulk with numpy):
+# num_dice, die_sides = Die.parse('3d6')
+# 
+# Example response:
+# 3, 6
+#
+# Die.seed makes every later roll reproducible (e.g. when replaying a
+# recorded session):
+# Die.seed(1234)
 class Die:
     @staticmethod
-    def roll(short_string, minimum_value=1):
+    def seed(value):
+        random.seed(value)
+
+    @staticmethod
+    def parse(short_string):
         try:
             num_dice, die_sides = map(int, short_string.lower().split('d'))
-            if num_dice < 1 or die_sides < 1:
-                raise InvalidDieExpression("Both the number of dice and number of sides must be at least 1.")
-            rolls = [random.randint(minimum_value,die_sides) for _ in range(num_dice)]
-            return sum(rolls), rolls
         except ValueError:
-            raise ValueError("Input must be in XdY format, e.g. '3d20'.")
\ No newline at end of file
+            raise ValueError("Input must be in XdY format, e.g. '3d20'.")
+        if num_dice < 1 or die_sides < 1:
+            raise InvalidDieExpression("Both the number of dice and number of sides must be at least 1.")
+        return num_dice, die_sides
+
+    @staticmethod
+    def roll(short_string, minimum_value=1):
+        num_dice, die_sides = Die.parse(short_string)
+        rolls = [random.randint(minimum_value,die_sides) for _ in range(num_dice)]
+        return sum(rolls), rolls
\ No newline at end of file
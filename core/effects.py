@@ -0,0 +1,236 @@
+"""
+Consumable effects for Thangorodrim.
+
+Consumable.use returns the item's raw effect dict, for example:
+
+{"heal": 20}
+{"restore_mp": 10}
+{"buff": {"stat": "strength", "amount": 2, "duration": 10}}
+{"damage_over_time": {"damage": "1d4", "duration": 5}}
+
+(keys can be combined in one dict). This module turns that dict into
+handler objects once, via compile_effect, and applies them to an actor.
+Items made from the same template share one effect dict, so each template
+is compiled only the first time one of its items is used.
+
+Instant effects (heal, restore_mp) change the actor straight away. Timed
+effects (buffs, damage over time) go into an EffectStore, which keeps every
+active effect on every actor in parallel lists and ticks them all in one
+pass per turn. Nothing looks at effect dict keys on a tick.
+
+An actor is anything with current_hit_points / max_hit_points,
+current_magic_points / max_magic_points and the ability scores, such as a
+Player.
+
+Usage:
+store = EffectStore()
+effect = potion.get("consumable").use(player)
+if effect:
+    apply_effect(player, effect, store)
+
+store.tick()    # once per turn
+"""
+
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+from core.die import Die
+
+# Ability scores a buff may change
+BUFFABLE_STATS = ("strength", "intelligence", "dexterity", "constitution")
+
+# Compiled effects kept before the least recently used is dropped; far more
+# than the game has consumable templates
+MAX_COMPILED_EFFECTS = 256
+
+
+# --- HANDLERS ---
+
+class Heal:
+    """Restore HP, up to the actor's maximum."""
+
+    __slots__ = ("amount",)
+
+    def __init__(self, amount: int):
+        self.amount = amount
+
+    def apply(self, actor, store):
+        actor.current_hit_points = min(actor.max_hit_points, actor.current_hit_points + self.amount)
+
+
+class RestoreMagic:
+    """Restore MP, up to the actor's maximum."""
+
+    __slots__ = ("amount",)
+
+    def __init__(self, amount: int):
+        self.amount = amount
+
+    def apply(self, actor, store):
+        actor.current_magic_points = min(actor.max_magic_points, actor.current_magic_points + self.amount)
+
+
+class Buff:
+    """Raise an ability score for `duration` turns. Buffs from separate uses stack."""
+
+    __slots__ = ("stat", "amount", "duration")
+
+    def __init__(self, stat: str, amount: int, duration: int):
+        self.stat = stat
+        self.amount = amount
+        self.duration = duration
+
+    def apply(self, actor, store):
+        setattr(actor, self.stat, getattr(actor, self.stat) + self.amount)
+        store.add(actor, self.duration, on_expire=self.expire)
+
+    def expire(self, actor):
+        setattr(actor, self.stat, getattr(actor, self.stat) - self.amount)
+
+
+class DamageOverTime:
+    """Deal damage (a fixed amount or a die roll) at every tick for `duration` turns."""
+
+    __slots__ = ("damage", "die", "duration")
+
+    def __init__(self, damage, duration: int):
+        self.duration = duration
+        if isinstance(damage, str):
+            Die.parse(damage)  # reject a bad expression now, not on the first tick
+            self.damage, self.die = 0, damage
+        else:
+            self.damage, self.die = damage, None
+
+    def apply(self, actor, store):
+        store.add(actor, self.duration, on_tick=self.tick)
+
+    def tick(self, actor):
+        damage = self.damage
+        if self.die is not None:
+            damage += Die.roll(self.die)[0]
+        actor.current_hit_points -= damage
+
+
+def _compile_buff(data: Dict[str, Any]) -> Buff:
+    if data["stat"] not in BUFFABLE_STATS:
+        raise ValueError(f"Can't buff '{data['stat']}'; expected one of {', '.join(BUFFABLE_STATS)}.")
+    return Buff(data["stat"], data["amount"], _duration(data))
+
+
+def _duration(data: Dict[str, Any]) -> int:
+    duration = data["duration"]
+    if duration < 1:
+        raise ValueError("Timed effects must last at least one turn.")
+    return duration
+
+
+# Effect dict key -> function building its handler from the key's value
+EFFECT_COMPILERS: Dict[str, Callable[[Any], Any]] = {
+    "heal": Heal,
+    "restore_mp": RestoreMagic,
+    "buff": _compile_buff,
+    "damage_over_time": lambda data: DamageOverTime(data["damage"], _duration(data)),
+}
+
+
+# --- COMPILING ---
+
+class CompiledEffect:
+    """The handlers for one effect dict, applied in order."""
+
+    __slots__ = ("handlers",)
+
+    def __init__(self, handlers: Tuple):
+        self.handlers = handlers
+
+    def apply(self, actor, store: "EffectStore"):
+        for handler in self.handlers:
+            handler.apply(actor, store)
+
+
+# LRU of id(effect dict) -> (effect dict, CompiledEffect). Holding the dict
+# keeps its id from being reused by another object while it is cached.
+_compiled: "OrderedDict[int, Tuple[Dict[str, Any], CompiledEffect]]" = OrderedDict()
+
+
+def compile_effect(effect: Dict[str, Any]) -> CompiledEffect:
+    """Return the CompiledEffect for an effect dict, compiling it on first use.
+
+    Results are cached per dict object (the MAX_COMPILED_EFFECTS most
+    recently used), so an effect dict should not be changed once it has
+    been used. Raises ValueError for unknown effect keys or bad values.
+    """
+    cached = _compiled.get(id(effect))
+    if cached is not None and cached[0] is effect:
+        _compiled.move_to_end(id(effect))
+        return cached[1]
+    handlers = []
+    for key, value in effect.items():
+        if key not in EFFECT_COMPILERS:
+            raise ValueError(f"Unknown effect '{key}'.")
+        handlers.append(EFFECT_COMPILERS[key](value))
+    compiled = CompiledEffect(tuple(handlers))
+    _compiled[id(effect)] = (effect, compiled)
+    while len(_compiled) > MAX_COMPILED_EFFECTS:
+        _compiled.popitem(last=False)
+    return compiled
+
+
+def apply_effect(actor, effect: Dict[str, Any], store: "EffectStore"):
+    """Apply an effect dict (as returned by Consumable.use) to an actor."""
+    compile_effect(effect).apply(actor, store)
+
+
+# --- ACTIVE EFFECTS ---
+
+class EffectStore:
+    """Every active timed effect on every actor, ticked together once per turn.
+
+    Effects are kept in parallel lists (actor, turns remaining, tick
+    callback, expiry callback) rather than as one object per effect.
+    """
+
+    def __init__(self):
+        self.actors: List[Hashable] = []
+        self.remaining: List[int] = []
+        self.on_tick: List[Optional[Callable]] = []
+        self.on_expire: List[Optional[Callable]] = []
+
+    def __len__(self):
+        return len(self.actors)
+
+    def add(self, actor, duration: int, on_tick: Callable = None, on_expire: Callable = None):
+        """Track a timed effect. on_tick(actor) runs every tick, on_expire(actor) once at the end."""
+        self.actors.append(actor)
+        self.remaining.append(duration)
+        self.on_tick.append(on_tick)
+        self.on_expire.append(on_expire)
+
+    def effects_on(self, actor) -> int:
+        """How many timed effects are active on an actor."""
+        return sum(1 for other in self.actors if other is actor)
+
+    def tick(self):
+        """Run every active effect for one turn, then drop the ones that ran out."""
+        actors, remaining, on_tick, on_expire = self.actors, self.remaining, self.on_tick, self.on_expire
+        expired = False
+        for i in range(len(actors)):
+            if on_tick[i] is not None:
+                on_tick[i](actors[i])
+            remaining[i] -= 1
+            if remaining[i] == 0:
+                expired = True
+                if on_expire[i] is not None:
+                    on_expire[i](actors[i])
+        if expired:
+            self._keep([turns > 0 for turns in remaining])
+
+    def remove_actor(self, actor):
+        """Forget an actor's effects without expiring them (e.g. it died)."""
+        self._keep([other is not actor for other in self.actors])
+
+    def _keep(self, keep: List[bool]):
+        self.actors = [a for a, k in zip(self.actors, keep) if k]
+        self.remaining = [r for r, k in zip(self.remaining, keep) if k]
+        self.on_tick = [t for t, k in zip(self.on_tick, keep) if k]
+        self.on_expire = [e for e, k in zip(self.on_expire, keep) if k]
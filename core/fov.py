@@ -0,0 +1,200 @@
+"""
+Field of view for Thangorodrim.
+
+FieldOfView works out which tiles an actor can see from a position, using
+symmetric shadowcasting: the map is scanned row by row outwards from the
+viewer in each of the four quadrants, and walls cast shadows that later
+rows skip. "Symmetric" means that if A can see B then B can see A (when
+neither stands on an opaque tile), which is what lets one calculation
+answer "which of these monsters can see the player?".
+
+Results are VisibilityGrid objects: a bit-packed grid covering just the
+square around the viewer (radius 10 is 441 bits, or 56 bytes). They are
+cached by (position, radius), so an actor's view is computed when it
+moves rather than every frame, and a cached view is only dropped when a
+tile near it changes opacity.
+
+Usage:
+fov = FieldOfView(tile_map)
+view = fov.compute((12, 7), radius=8)
+view.is_visible(15, 9)                      # True/False
+
+fov.seen_by((12, 7), monster_positions, radius=8)   # [True, False, ...]
+"""
+
+from collections import OrderedDict
+from typing import Iterable, List, Optional, Tuple
+
+from core.tilemap import Tile
+
+Position = Tuple[int, int]
+
+_OPAQUE_CODES = {tile.code for tile in Tile if tile.opaque}
+# bytes.translate table: tile code -> 1 if opaque else 0
+_OPAQUE_TABLE = bytes(code in _OPAQUE_CODES for code in range(256))
+
+
+class VisibilityGrid:
+    """Bit-packed visibility for the square of tiles within `radius` of `origin`."""
+
+    __slots__ = ("origin", "radius", "x0", "y0", "size", "bits")
+
+    def __init__(self, origin: Position, radius: int):
+        self.origin = origin
+        self.radius = radius
+        self.x0 = origin[0] - radius
+        self.y0 = origin[1] - radius
+        self.size = 2 * radius + 1
+        self.bits = bytearray((self.size * self.size + 7) // 8)
+
+    def _bit(self, x: int, y: int) -> Optional[int]:
+        bx, by = x - self.x0, y - self.y0
+        if 0 <= bx < self.size and 0 <= by < self.size:
+            return by * self.size + bx
+        return None
+
+    def mark(self, x: int, y: int):
+        bit = self._bit(x, y)
+        if bit is not None:
+            self.bits[bit >> 3] |= 1 << (bit & 7)
+
+    def is_visible(self, x: int, y: int) -> bool:
+        bit = self._bit(x, y)
+        return bit is not None and bool(self.bits[bit >> 3] & (1 << (bit & 7)))
+
+    def visible_tiles(self) -> List[Position]:
+        """Every visible (x, y), row by row."""
+        tiles = []
+        for byte_index, byte in enumerate(self.bits):
+            while byte:
+                low = byte & -byte
+                bit = (byte_index << 3) + low.bit_length() - 1
+                by, bx = divmod(bit, self.size)
+                tiles.append((self.x0 + bx, self.y0 + by))
+                byte ^= low
+        return tiles
+
+    def overlaps(self, x: int, y: int, width: int, height: int) -> bool:
+        """True if the rectangle touches the square this grid covers."""
+        return (x < self.x0 + self.size and self.x0 < x + width and
+                y < self.y0 + self.size and self.y0 < y + height)
+
+
+class FieldOfView:
+    """Cached symmetric shadowcasting over a TileMap."""
+
+    def __init__(self, tile_map, max_cached: int = 256):
+        self.width = tile_map.width
+        self.height = tile_map.height
+        self.tile_map = tile_map
+        self.opaque = tile_map.tiles.translate(_OPAQUE_TABLE)
+        self.max_cached = max_cached
+        self._cache: "OrderedDict[Tuple[int, int, int], VisibilityGrid]" = OrderedDict()
+        tile_map.add_listener(self.on_tiles_changed)
+
+    def on_tiles_changed(self, x: int, y: int, width: int, height: int):
+        """TileMap listener: drop cached views near tiles whose opacity changed."""
+        tiles, w = self.tile_map.tiles, self.width
+        changed = False
+        for row in range(y, y + height):
+            start, end = row * w + x, row * w + x + width
+            fresh = tiles[start:end].translate(_OPAQUE_TABLE)
+            if fresh != self.opaque[start:end]:
+                self.opaque[start:end] = fresh
+                changed = True
+        if changed:
+            for key in [k for k, view in self._cache.items() if view.overlaps(x, y, width, height)]:
+                del self._cache[key]
+
+    def is_opaque(self, x: int, y: int) -> bool:
+        """Opaque tiles block sight; everything off the map counts as opaque."""
+        return not (0 <= x < self.width and 0 <= y < self.height) or self.opaque[y * self.width + x] == 1
+
+    # --- QUERIES ---
+
+    def compute(self, origin: Position, radius: int) -> VisibilityGrid:
+        """Return what can be seen from `origin` within `radius` tiles (cached)."""
+        key = (origin[0], origin[1], radius)
+        view = self._cache.get(key)
+        if view is not None:
+            self._cache.move_to_end(key)
+            return view
+
+        view = self._shadowcast(origin, radius)
+        self._cache[key] = view
+        if len(self._cache) > self.max_cached:
+            self._cache.popitem(last=False)
+        return view
+
+    def seen_by(self, target: Position, viewers: Iterable[Position], radius: int) -> List[bool]:
+        """For each viewer, can it see `target` within `radius`?
+
+        Sight is symmetric, so this computes one view from the target and
+        checks every viewer against it, instead of one view per viewer.
+        Symmetry only holds between non-opaque tiles, though: a viewer
+        standing on an opaque tile (e.g. in a doorway), or every viewer if
+        the target is on one, gets its own view instead.
+        """
+        tx, ty = target
+        if self.is_opaque(tx, ty):
+            return [self.compute(viewer, radius).is_visible(tx, ty) for viewer in viewers]
+        view = self.compute(target, radius)
+        limit = radius * (radius + 1)
+        is_opaque = self.is_opaque
+        return [self.compute((vx, vy), radius).is_visible(tx, ty) if is_opaque(vx, vy) else
+                (vx - tx) ** 2 + (vy - ty) ** 2 <= limit and view.is_visible(vx, vy)
+                for vx, vy in viewers]
+
+    def any_can_see(self, target: Position, viewers: Iterable[Position], radius: int) -> bool:
+        return any(self.seen_by(target, viewers, radius))
+
+    def clear(self):
+        self._cache.clear()
+
+    # --- SHADOWCASTING ---
+
+    def _shadowcast(self, origin: Position, radius: int) -> VisibilityGrid:
+        view = VisibilityGrid(origin, radius)
+        ox, oy = origin
+        width, height = self.width, self.height
+        view.mark(ox, oy)
+        # Tiles within radius * (radius + 1) give rounder circles than radius ** 2
+        limit = radius * (radius + 1)
+        is_opaque = self.is_opaque
+
+        # Each quadrant maps (depth, col) to a map position
+        quadrants = (
+            lambda depth, col: (ox + col, oy - depth),   # north
+            lambda depth, col: (ox + col, oy + depth),   # south
+            lambda depth, col: (ox + depth, oy + col),   # east
+            lambda depth, col: (ox - depth, oy + col),   # west
+        )
+        for transform in quadrants:
+            # Rows are (depth, start slope, end slope); slopes are
+            # (numerator, denominator) pairs with positive denominators.
+            rows = [(1, -1, 1, 1, 1)]
+            while rows:
+                depth, sn, sd, en, ed = rows.pop()
+                if depth > radius:
+                    continue
+                min_col = (2 * depth * sn + sd) // (2 * sd)          # round half up
+                max_col = -((ed - 2 * depth * en) // (2 * ed))       # round half down
+                prev_wall = None
+                for col in range(min_col, max_col + 1):
+                    x, y = transform(depth, col)
+                    wall = is_opaque(x, y)
+                    in_range = depth * depth + col * col <= limit
+                    # Walls show if any part is lit; floors only if their
+                    # centre is, which is what makes the result symmetric.
+                    # (off the map counts as wall for shadows, but isn't marked)
+                    if (in_range and (wall or (col * sd >= depth * sn and col * ed <= depth * en))
+                            and 0 <= x < width and 0 <= y < height):
+                        view.mark(x, y)
+                    if prev_wall and not wall:
+                        sn, sd = 2 * col - 1, 2 * depth
+                    if prev_wall is False and wall:
+                        rows.append((depth + 1, sn, sd, 2 * col - 1, 2 * depth))
+                    prev_wall = wall
+                if prev_wall is False:
+                    rows.append((depth + 1, sn, sd, en, ed))
+        return view
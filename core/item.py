@@ -19,13 +19,17 @@ Template example:
 
 Notes:
 - Components are plain dataclasses and contain no heavy game logic.
-- Effect application (e.g. applying heal) should live in game logic, not here.
+- Effect application (e.g. applying heal) lives in core.effects, not here.
 - This approach simplifies serialization and mix-and-match behavior.
 """
 
+import json
+import os
 from dataclasses import dataclass, field
 from typing import Optional, Dict, Any, List
 
+ITEMS_DATA_FILE = os.path.join(os.path.dirname(__file__), '..', 'data', 'items.json')
+
 @dataclass
 class Component:
     """Marker base class for item components. Extend to add behavior/state."""
@@ -49,7 +53,7 @@ class Consumable(Component):
     """Data for consumable items.
 
     Attributes:
-        effect: A data structure describing the effect (interpreted by game logic).
+        effect: A data structure describing the effect (applied by core.effects.apply_effect).
         charges: Number of uses remaining.
     """
     effect: Dict[str, Any] # description of effect
@@ -59,7 +63,7 @@ class Consumable(Component):
         """Consume one charge and return the effect payload.
 
         Returns False if there are no charges left, otherwise returns the
-        effect dict (the caller applies it).
+        effect dict (the caller applies it, see core.effects.apply_effect).
         """
         # apply effect to user
         if self.charges <= 0:
@@ -144,4 +148,20 @@ def item_from_template(template: Dict[str, Any]) -> Item:
                 name=template["name"],
                 description=template.get("description", ""),
                 weight=template.get("weight", 0.0),
-                components=comp_map)
\ No newline at end of file
+                components=comp_map)
+
+def load_item_templates(filepath: str = ITEMS_DATA_FILE) -> Dict[str, Dict[str, Any]]:
+    """Load item templates from a JSON list and return them keyed by 'id'.
+
+    Raises KeyError if a template has no 'id' and ValueError if two
+    templates share one.
+    """
+    with open(filepath, 'r', encoding='utf-8') as f:
+        templates = json.load(f)
+    registry = {}
+    for template in templates:
+        item_id = template["id"]
+        if item_id in registry:
+            raise ValueError(f"Duplicate item id '{item_id}' in {filepath}.")
+        registry[item_id] = template
+    return registry
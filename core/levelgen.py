@@ -0,0 +1,186 @@
+"""
+Procedural level generation for Thangorodrim.
+
+Levels are generated one square chunk of tiles at a time, so a level can
+be streamed in around the player instead of being built up front (see
+managers.level_streamer). A chunk depends only on the level seed and its
+own chunk coordinates, so it comes out the same whichever process makes
+it, in whatever order, and however often it is regenerated.
+
+Each chunk gets one room, sometimes with a pool of water, and a corridor
+from the room to each edge of the chunk. Where a corridor leaves a chunk
+is worked out from the seed and the edge itself, so the neighbour on the
+other side of the edge puts its corridor in the same place and the two
+join up. The room also gets a few monster spawns (template names from
+data/monsters.json) and, sometimes, a chest (a loot table id).
+
+For shipping between processes a chunk packs into a flat buffer:
+
+  tiles  size * size bytes, tile codes row by row
+  spawns 3 bytes each: x, y (inside the chunk), monster name index
+  loot   3 bytes each: x, y (inside the chunk), loot table index
+
+Usage:
+chunk = generate_chunk(seed, 3, 5, monster_names=["Orc", "Goblin"], loot_tables=["chest_common"])
+tile_map.write_region(chunk.x, chunk.y, chunk.size, chunk.size, chunk.tiles)
+"""
+
+import random
+from dataclasses import dataclass, field
+from typing import List, Optional, Sequence, Tuple
+
+from core.tilemap import Tile
+
+CHUNK_SIZE = 32
+
+MAX_SPAWNS = 4
+MAX_LOOT = 1
+LOOT_CHANCE = 0.25
+POOL_CHANCE = 0.3
+
+# Bytes per packed spawn or loot record
+RECORD_SIZE = 3
+
+
+@dataclass
+class GeneratedChunk:
+    """One generated chunk of a level.
+
+    Attributes:
+        cx, cy: Chunk coordinates (the chunk covers tiles cx*size.. and cy*size..).
+        size: Edge length in tiles.
+        tiles: Tile codes, row by row.
+        spawns: (x, y, monster template name) in level tile coordinates.
+        loot: (x, y, loot table id) in level tile coordinates.
+    """
+    cx: int
+    cy: int
+    size: int
+    tiles: bytes
+    spawns: List[Tuple[int, int, str]] = field(default_factory=list)
+    loot: List[Tuple[int, int, str]] = field(default_factory=list)
+
+    @property
+    def x(self) -> int:
+        return self.cx * self.size
+
+    @property
+    def y(self) -> int:
+        return self.cy * self.size
+
+    def contains(self, x: int, y: int) -> bool:
+        return self.x <= x < self.x + self.size and self.y <= y < self.y + self.size
+
+
+def chunk_rng(seed: int, *key) -> random.Random:
+    """A Random seeded from the level seed and a key, the same in every process."""
+    return random.Random(":".join(str(part) for part in (seed,) + key))
+
+
+def edge_opening(seed: int, kind: str, x: int, y: int, size: int = CHUNK_SIZE) -> int:
+    """Where a corridor crosses an edge, as an offset along it.
+
+    kind is "v" for the vertical edge on the west side of chunk (x, y) and
+    "h" for the horizontal edge on its north side; both chunks sharing the
+    edge get the same answer.
+    """
+    return chunk_rng(seed, "edge", kind, x, y).randint(2, size - 3)
+
+
+def generate_chunk(seed: int, cx: int, cy: int, monster_names: Sequence[str] = (),
+                   loot_tables: Sequence[str] = (), size: int = CHUNK_SIZE,
+                   bounds: Optional[Tuple[int, int]] = None) -> GeneratedChunk:
+    """Generate chunk (cx, cy) of the level with this seed.
+
+    `bounds` is the level size in chunks; corridors aren't dug towards edges
+    on the outside of the level.
+    """
+    rng = chunk_rng(seed, cx, cy)
+    wall, floor, water = Tile.WALL.code, Tile.FLOOR.code, Tile.WATER.code
+    tiles = bytearray([wall]) * (size * size)
+
+    def carve(x0, y0, x1, y1, code):
+        """Fill the inclusive rectangle (x0, y0)-(x1, y1)."""
+        x0, x1 = sorted((x0, x1))
+        y0, y1 = sorted((y0, y1))
+        row = bytes([code]) * (x1 - x0 + 1)
+        for y in range(y0, y1 + 1):
+            tiles[y * size + x0:y * size + x1 + 1] = row
+
+    # The room, never touching the chunk's edges
+    width, height = rng.randint(6, min(14, size - 4)), rng.randint(5, min(12, size - 4))
+    room_x, room_y = rng.randint(2, size - width - 2), rng.randint(2, size - height - 2)
+    carve(room_x, room_y, room_x + width - 1, room_y + height - 1, floor)
+    centre_x, centre_y = room_x + width // 2, room_y + height // 2
+
+    if rng.random() < POOL_CHANCE:
+        pool_w, pool_h = rng.randint(2, width // 2), rng.randint(2, height // 2)
+        pool_x, pool_y = rng.randint(room_x, room_x + width - pool_w), rng.randint(room_y, room_y + height - pool_h)
+        carve(pool_x, pool_y, pool_x + pool_w - 1, pool_y + pool_h - 1, water)
+
+    # Corridors (dug after the pool, so they always reach the room centre)
+    chunks_x, chunks_y = bounds if bounds else (None, None)
+    if cx > 0:
+        y = edge_opening(seed, "v", cx, cy, size)
+        carve(0, y, centre_x, y, floor)
+        carve(centre_x, y, centre_x, centre_y, floor)
+    if chunks_x is None or cx < chunks_x - 1:
+        y = edge_opening(seed, "v", cx + 1, cy, size)
+        carve(centre_x, y, size - 1, y, floor)
+        carve(centre_x, y, centre_x, centre_y, floor)
+    if cy > 0:
+        x = edge_opening(seed, "h", cx, cy, size)
+        carve(x, 0, x, centre_y, floor)
+        carve(x, centre_y, centre_x, centre_y, floor)
+    if chunks_y is None or cy < chunks_y - 1:
+        x = edge_opening(seed, "h", cx, cy + 1, size)
+        carve(x, centre_y, x, size - 1, floor)
+        carve(x, centre_y, centre_x, centre_y, floor)
+
+    # Spawns and loot go on distinct floor tiles of the room
+    spots = [(x, y) for y in range(room_y, room_y + height) for x in range(room_x, room_x + width)
+             if tiles[y * size + x] == floor]
+    rng.shuffle(spots)
+    x0, y0 = cx * size, cy * size
+    spawns = []
+    if monster_names:
+        for x, y in spots[:rng.randint(0, MAX_SPAWNS)]:
+            spawns.append((x0 + x, y0 + y, rng.choice(monster_names)))
+    loot = []
+    if loot_tables and rng.random() < LOOT_CHANCE:
+        for x, y in spots[len(spawns):len(spawns) + MAX_LOOT]:
+            loot.append((x0 + x, y0 + y, rng.choice(loot_tables)))
+    return GeneratedChunk(cx, cy, size, bytes(tiles), spawns, loot)
+
+
+# --- PACKING ---
+
+def chunk_buffer_size(size: int = CHUNK_SIZE) -> int:
+    """Bytes needed to pack one chunk of this size."""
+    return size * size + RECORD_SIZE * (MAX_SPAWNS + MAX_LOOT)
+
+
+def pack_chunk(chunk: GeneratedChunk, buffer, monster_names: Sequence[str],
+               loot_tables: Sequence[str]) -> Tuple[int, int]:
+    """Write a chunk into `buffer` (e.g. a shared memory block); returns (spawns, loot)."""
+    area = chunk.size * chunk.size
+    buffer[:area] = chunk.tiles
+    offset = area
+    for records, names in ((chunk.spawns, monster_names), (chunk.loot, loot_tables)):
+        for x, y, name in records:
+            buffer[offset:offset + RECORD_SIZE] = bytes((x - chunk.x, y - chunk.y, names.index(name)))
+            offset += RECORD_SIZE
+    return len(chunk.spawns), len(chunk.loot)
+
+
+def unpack_chunk(buffer, cx: int, cy: int, counts: Tuple[int, int], monster_names: Sequence[str],
+                 loot_tables: Sequence[str], size: int = CHUNK_SIZE) -> GeneratedChunk:
+    """Read back a chunk written by pack_chunk (the tiles are copied out of `buffer`)."""
+    area = size * size
+    x0, y0 = cx * size, cy * size
+    records = bytes(buffer[area:area + RECORD_SIZE * (counts[0] + counts[1])])
+    decoded = [(x0 + records[i], y0 + records[i + 1], records[i + 2])
+               for i in range(0, len(records), RECORD_SIZE)]
+    spawns = [(x, y, monster_names[index]) for x, y, index in decoded[:counts[0]]]
+    loot = [(x, y, loot_tables[index]) for x, y, index in decoded[counts[0]:]]
+    return GeneratedChunk(cx, cy, size, bytes(buffer[:area]), spawns, loot)
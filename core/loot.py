@@ -0,0 +1,221 @@
+"""
+Loot tables for Thangorodrim.
+
+Loot tables live in data/loot_tables.json and say what a chest or a
+monster can drop. Each entry has a weight and is one of:
+
+- an item id from data/items.json, with an optional quantity die,
+- another loot table (rolled in its place),
+- nothing (an entry with only a weight).
+
+{
+  "id": "chest_common",
+  "rolls": 2,
+  "entries": [
+    { "item": "potion_healing_small", "weight": 50, "quantity": "1d4" },
+    { "item": "dagger_steel", "weight": 20 },
+    { "table": "weapons_elvish", "weight": 2 },
+    { "weight": 28 }
+  ]
+}
+
+Each table is compiled into an AliasSampler when it is loaded (Vose's
+alias method), so picking an entry costs one random number and one list
+lookup however many entries the table has, instead of a walk along the
+cumulative weights.
+
+roll_loot(table, n) rolls a table n times in one go: all the draws are
+tallied per entry first, nested tables are rolled once for everything that
+landed on them, and only then are the Items built with item_from_template.
+Stackable items come out as full stacks.
+
+Usage:
+tables = load_loot_tables()
+drop = roll_loot(tables["chest_common"])
+hoard = roll_loot(tables["boss_orc_captain"], n=3)
+"""
+
+import json
+import os
+import random
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence
+
+from core.die import Die
+from core.item import Item, item_from_template, load_item_templates
+
+LOOT_TABLES_DATA_FILE = os.path.join(os.path.dirname(__file__), '..', 'data', 'loot_tables.json')
+
+
+class AliasSampler:
+    """Draw indices in proportion to a list of weights in O(1) per draw."""
+
+    __slots__ = ("size", "probability", "alias")
+
+    def __init__(self, weights: Sequence[float]):
+        size = len(weights)
+        total = sum(weights)
+        if size == 0 or total <= 0 or any(weight < 0 for weight in weights):
+            raise ValueError("Weights must be non-negative with a positive total.")
+
+        # Scale so the average weight is 1, then pair each under-full column
+        # with an over-full one that tops it up.
+        scaled = [weight * size / total for weight in weights]
+        small = [i for i, value in enumerate(scaled) if value < 1]
+        large = [i for i, value in enumerate(scaled) if value >= 1]
+        probability = [1.0] * size
+        alias = list(range(size))
+        while small and large:
+            low, high = small.pop(), large.pop()
+            probability[low] = scaled[low]
+            alias[low] = high
+            scaled[high] += scaled[low] - 1
+            (small if scaled[high] < 1 else large).append(high)
+
+        self.size = size
+        self.probability = probability
+        self.alias = alias
+
+    def sample(self, rng=random) -> int:
+        return self.sample_many(1, rng)[0]
+
+    def sample_many(self, count: int, rng=random) -> List[int]:
+        """Draw `count` indices. `rng` is anything with a random() method."""
+        size, probability, alias, uniform = self.size, self.probability, self.alias, rng.random
+        picks = []
+        for _ in range(count):
+            # One uniform number picks the column (integer part) and the
+            # side of the column (fractional part).
+            u = uniform() * size
+            column = int(u)
+            if column == size:
+                column -= 1
+            picks.append(column if u - column < probability[column] else alias[column])
+        return picks
+
+
+@dataclass(eq=False)
+class LootEntry:
+    """One weighted line of a loot table.
+
+    Attributes:
+        weight: Relative chance of this entry.
+        template: Item template to drop, or None.
+        quantity: Die expression for how many drop (None means exactly one).
+        table: Nested LootTable to roll instead, or None.
+    """
+    weight: float
+    template: Optional[Dict[str, Any]] = None
+    quantity: Optional[str] = None
+    table: Optional["LootTable"] = None
+
+
+class LootTable:
+    """A compiled loot table: its entries plus an AliasSampler over their weights."""
+
+    def __init__(self, table_id: str, entries: List[LootEntry], rolls: int = 1):
+        if rolls < 1:
+            raise ValueError(f"Loot table '{table_id}' must roll at least once.")
+        self.id = table_id
+        self.entries = entries
+        self.rolls = rolls
+        self.sampler = AliasSampler([entry.weight for entry in entries])
+
+    def __repr__(self):
+        return f"LootTable({self.id!r}, {len(self.entries)} entries, rolls={self.rolls})"
+
+
+def load_loot_tables(filepath: str = LOOT_TABLES_DATA_FILE,
+                     item_templates: Optional[Dict[str, Dict[str, Any]]] = None) -> Dict[str, LootTable]:
+    """Load and compile every loot table in a JSON file, keyed by 'id'.
+
+    Item ids are looked up in `item_templates` (data/items.json by default).
+    Raises ValueError for duplicate ids, unknown items or tables, bad
+    quantity dice, quantities on entries that aren't items and tables
+    that contain themselves.
+    """
+    if item_templates is None:
+        item_templates = load_item_templates()
+    with open(filepath, 'r', encoding='utf-8') as f:
+        raw_tables = {}
+        for data in json.load(f):
+            if data["id"] in raw_tables:
+                raise ValueError(f"Duplicate loot table id '{data['id']}' in {filepath}.")
+            raw_tables[data["id"]] = data
+
+    tables: Dict[str, LootTable] = {}
+
+    def compile_table(table_id: str, path: List[str]) -> LootTable:
+        if table_id in tables:
+            return tables[table_id]
+        if table_id in path:
+            raise ValueError(f"Loot table '{table_id}' contains itself: {' -> '.join(path + [table_id])}.")
+        if table_id not in raw_tables:
+            raise ValueError(f"Unknown loot table '{table_id}' referenced by '{path[-1]}'.")
+        data = raw_tables[table_id]
+        entries = []
+        for raw in data["entries"]:
+            entry = LootEntry(weight=raw["weight"], quantity=raw.get("quantity"))
+            if entry.quantity is not None and "item" not in raw:
+                raise ValueError(f"Only item entries can have a quantity (loot table '{table_id}').")
+            if "item" in raw:
+                if raw["item"] not in item_templates:
+                    raise ValueError(f"Unknown item '{raw['item']}' in loot table '{table_id}'.")
+                entry.template = item_templates[raw["item"]]
+            elif "table" in raw:
+                entry.table = compile_table(raw["table"], path + [table_id])
+            if entry.quantity is not None:
+                Die.parse(entry.quantity)
+            entries.append(entry)
+        tables[table_id] = LootTable(table_id, entries, rolls=data.get("rolls", 1))
+        return tables[table_id]
+
+    for table_id in raw_tables:
+        compile_table(table_id, [])
+    return tables
+
+
+def roll_loot(table: LootTable, n: int = 1) -> List[Item]:
+    """Roll a loot table `n` times and return every Item dropped.
+
+    Entries are drawn with the `random` module and quantities rolled with
+    Die.roll, so Die.seed() makes drops reproducible.
+    """
+    tally: Dict[LootEntry, int] = {}
+    _tally_draws(table, n * table.rolls, tally)
+    items = []
+    for entry, draws in tally.items():
+        items.extend(_make_items(entry.template, _roll_quantity(entry.quantity, draws)))
+    return items
+
+
+def _tally_draws(table: LootTable, draws: int, tally: Dict[LootEntry, int]):
+    """Count how many of `draws` land on each item entry, following nested tables."""
+    for index, hits in Counter(table.sampler.sample_many(draws)).items():
+        entry = table.entries[index]
+        if entry.table is not None:
+            _tally_draws(entry.table, hits * entry.table.rolls, tally)
+        elif entry.template is not None:
+            tally[entry] = tally.get(entry, 0) + hits
+
+
+def _roll_quantity(quantity: Optional[str], draws: int) -> int:
+    """Total quantity over `draws` drops of an entry, rolling its die once per drop."""
+    if quantity is None:
+        return draws
+    return sum(Die.roll(quantity)[0] for _ in range(draws))
+
+
+def _make_items(template: Dict[str, Any], quantity: int) -> List[Item]:
+    """Build `quantity` of an item: full stacks if it's stackable, else one Item each."""
+    if "stackable" not in template:
+        return [item_from_template(template) for _ in range(quantity)]
+    items = []
+    max_stack = template["stackable"].get("max_stack", 99)
+    while quantity > 0:
+        item = item_from_template(template)
+        item.get("stackable").quantity = min(quantity, max_stack)
+        quantity -= max_stack
+        items.append(item)
+    return items
@@ -0,0 +1,298 @@
+"""
+Monster templates and the MonsterPopulation store for Thangorodrim.
+
+Monster types are described by templates in data/monsters.json:
+
+{
+  "Name": "Orc",
+  "HealthDie": "2d8",
+  "DamageDie": "1d6",
+  "Regen": 1,
+  "Stats": { "strength": 13, "intelligence": 7, "dexterity": 10, "constitution": 12 }
+}
+
+A level holds hundreds of monsters, so they are not individual objects.
+MonsterPopulation keeps one NumPy array per attribute (position, HP, stats,
+AI state, status timers, movement intent) with one row per monster slot,
+and each tick updates every monster with a handful of vectorized
+operations instead of a Python loop.
+
+A monster is referred to by its slot index. Slots of dead monsters are
+reused by later spawns.
+"""
+
+import json
+import os
+from dataclasses import dataclass, field
+from enum import IntEnum
+from math import floor
+from typing import Dict, List
+
+import numpy as np
+
+from core.die import Die
+from core.tilemap import Tile
+
+MONSTERS_DATA_FILE = os.path.join(os.path.dirname(__file__), '..', 'data', 'monsters.json')
+
+# Column order of MonsterPopulation.stats
+STATS = ("strength", "intelligence", "dexterity", "constitution")
+
+
+class AIState(IntEnum):
+    IDLE = 0
+    WANDER = 1
+    CHASE = 2
+    FLEE = 3
+
+
+class Status(IntEnum):
+    # Column index into MonsterPopulation.status (turns remaining)
+    STUNNED = 0
+    POISONED = 1
+    SLOWED = 2
+
+
+@dataclass
+class MonsterTemplate:
+    """Data for one kind of monster, as loaded from data/monsters.json.
+
+    Attributes:
+        name: Display name, also used to look the template up.
+        health_die: Die expression rolled for max HP at spawn.
+        damage_die: Die expression for the monster's basic attack.
+        regen: HP regained per tick.
+        stats: Ability scores keyed by the names in STATS.
+    """
+    name: str
+    health_die: str = "1d8"
+    damage_die: str = "1d4"
+    regen: int = 0
+    stats: Dict[str, int] = field(default_factory=dict)
+
+
+def template_from_json(data: Dict) -> MonsterTemplate:
+    """Build a MonsterTemplate from one data/monsters.json entry.
+
+    Raises KeyError if 'Name' is missing.
+    """
+    return MonsterTemplate(name=data["Name"],
+                           health_die=data.get("HealthDie", "1d8"),
+                           damage_die=data.get("DamageDie", "1d4"),
+                           regen=data.get("Regen", 0),
+                           stats=dict(data.get("Stats", {})))
+
+
+def load_monster_templates(filepath: str = MONSTERS_DATA_FILE) -> List[MonsterTemplate]:
+    """Load every monster template from a JSON file."""
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return [template_from_json(entry) for entry in json.load(f)]
+
+
+# Lookup table: tile code -> walkable
+_WALKABLE_BY_CODE = np.zeros(256, dtype=bool)
+for _tile in Tile:
+    _WALKABLE_BY_CODE[_tile.code] = _tile.walkable
+
+
+def walkable_grid(tile_map) -> np.ndarray:
+    """Return a (height, width) boolean array of walkable tiles for a TileMap."""
+    codes = np.frombuffer(tile_map.tiles, dtype=np.uint8).reshape(tile_map.height, tile_map.width)
+    return _WALKABLE_BY_CODE[codes]
+
+
+class MonsterPopulation:
+    """Struct-of-arrays storage for every monster on a level.
+
+    Attributes (all indexed by slot, valid up to `count`):
+        x, y: Tile position.
+        hp, max_hp: Current and maximum hit points.
+        regen: HP regained per tick.
+        stats: Ability scores, one column per entry in STATS.
+        template: Index into `templates`.
+        ai_state: An AIState value.
+        status: Turns remaining for each Status, one column per Status.
+        intent: Requested (dx, dy) step for the next tick.
+        alive: False for empty or dead slots.
+    """
+
+    def __init__(self, templates: List[MonsterTemplate], capacity: int = 256, seed=None):
+        self.templates = list(templates)
+        self.template_index = {t.name: i for i, t in enumerate(self.templates)}
+        self.rng = np.random.default_rng(seed)
+        self.count = 0
+        self._free: List[int] = []
+        self._allocate(max(1, capacity))
+
+    def _allocate(self, capacity: int):
+        self.capacity = capacity
+        self.x = np.zeros(capacity, dtype=np.int32)
+        self.y = np.zeros(capacity, dtype=np.int32)
+        self.hp = np.zeros(capacity, dtype=np.int32)
+        self.max_hp = np.zeros(capacity, dtype=np.int32)
+        self.regen = np.zeros(capacity, dtype=np.int32)
+        self.stats = np.zeros((capacity, len(STATS)), dtype=np.int16)
+        self.template = np.zeros(capacity, dtype=np.int16)
+        self.ai_state = np.zeros(capacity, dtype=np.uint8)
+        self.status = np.zeros((capacity, len(Status)), dtype=np.int16)
+        self.intent = np.zeros((capacity, 2), dtype=np.int8)
+        self.alive = np.zeros(capacity, dtype=bool)
+
+    def _grow(self, needed: int):
+        """Resize every array (doubling) so `needed` slots fit."""
+        capacity = self.capacity
+        while capacity < needed:
+            capacity *= 2
+        old = {name: getattr(self, name) for name in ("x", "y", "hp", "max_hp", "regen", "stats",
+                                                      "template", "ai_state", "status", "intent", "alive")}
+        self._allocate(capacity)
+        for name, array in old.items():
+            getattr(self, name)[:len(array)] = array
+
+    def __len__(self):
+        return int(np.count_nonzero(self.alive[:self.count]))
+
+    # --- SPAWNING ---
+
+    def spawn(self, template_name: str, x: int, y: int, rng: np.random.Generator = None) -> int:
+        """Spawn one monster and return its slot."""
+        return int(self.spawn_many(template_name, [x], [y], rng)[0])
+
+    def spawn_many(self, template_name: str, xs, ys, rng: np.random.Generator = None) -> np.ndarray:
+        """Spawn one monster per (x, y) pair and return their slots.
+
+        Hit points are rolled with `rng`, or the population's own rng if
+        none is given.
+
+        Raises KeyError if the template name is unknown.
+        """
+        index = self.template_index[template_name]
+        template = self.templates[index]
+        xs = np.asarray(xs, dtype=np.int32)
+        ys = np.asarray(ys, dtype=np.int32)
+        n = len(xs)
+
+        reused = [self._free.pop() for _ in range(min(n, len(self._free)))]
+        fresh = n - len(reused)
+        if self.count + fresh > self.capacity:
+            self._grow(self.count + fresh)
+        slots = np.array(reused + list(range(self.count, self.count + fresh)), dtype=np.int64)
+        self.count += fresh
+
+        stats = np.array([template.stats.get(name, 10) for name in STATS], dtype=np.int16)
+        con_mod = floor((template.stats.get("constitution", 10) - 10) / 2)
+        num_dice, die_sides = Die.parse(template.health_die)
+        rng = self.rng if rng is None else rng
+        rolled = rng.integers(1, die_sides + 1, size=(n, num_dice)).sum(axis=1)
+        hp = np.maximum(1, rolled + con_mod)
+
+        self.x[slots] = xs
+        self.y[slots] = ys
+        self.hp[slots] = hp
+        self.max_hp[slots] = hp
+        self.regen[slots] = template.regen
+        self.stats[slots] = stats
+        self.template[slots] = index
+        self.ai_state[slots] = AIState.IDLE
+        self.status[slots] = 0
+        self.intent[slots] = 0
+        self.alive[slots] = True
+        return slots
+
+    def kill(self, slot: int):
+        if self.alive[slot]:
+            self.alive[slot] = False
+            self._free.append(int(slot))
+
+    # --- BATCH OPERATIONS ---
+
+    def alive_slots(self) -> np.ndarray:
+        return np.flatnonzero(self.alive[:self.count])
+
+    def damage(self, slots, amounts) -> np.ndarray:
+        """Subtract HP from many monsters at once; returns the slots that died."""
+        slots = np.asarray(slots, dtype=np.int64)
+        np.subtract.at(self.hp, slots, amounts)
+        dead = np.unique(slots[(self.hp[slots] <= 0) & self.alive[slots]])
+        for slot in dead:
+            self.kill(slot)
+        return dead
+
+    def set_intents(self, slots, dx, dy):
+        """Request a one-tile step for each slot, applied on the next tick."""
+        self.intent[slots, 0] = dx
+        self.intent[slots, 1] = dy
+
+    def tick(self, walkable: np.ndarray = None):
+        """Advance every monster by one tick.
+
+        Regenerates HP, counts status timers down, and moves monsters that
+        have an intent and aren't stunned. If a `walkable` grid (see
+        walkable_grid) is given, moves into walls, off the map, onto a
+        standing monster, or onto a tile another monster claimed first are
+        dropped. Intents are cleared afterwards.
+        """
+        n = self.count
+        alive = self.alive[:n]
+
+        # Regeneration
+        hp = self.hp[:n]
+        np.minimum(hp + self.regen[:n], self.max_hp[:n], out=hp, where=alive)
+
+        # Status timers
+        status = self.status[:n]
+        np.maximum(status - 1, 0, out=status)
+
+        # Movement
+        intent = self.intent[:n]
+        moving = alive & (status[:, Status.STUNNED] == 0) & intent.any(axis=1)
+        if moving.any():
+            self._move(np.flatnonzero(moving), walkable)
+        intent[:] = 0
+
+    def _move(self, movers: np.ndarray, walkable):
+        x, y = self.x, self.y
+        n = self.count
+        nx = x[movers] + self.intent[movers, 0]
+        ny = y[movers] + self.intent[movers, 1]
+
+        if walkable is not None:
+            height, width = walkable.shape
+            ok = (nx >= 0) & (nx < width) & (ny >= 0) & (ny < height)
+            ok[ok] = walkable[ny[ok], nx[ok]]
+            movers, nx, ny = movers[ok], nx[ok], ny[ok]
+            # On a known map, tiles are indexed directly in an occupancy grid
+            targets = ny.astype(np.int64) * width + nx
+            positions = y[:n].astype(np.int64) * width + x[:n]
+            occupancy = np.zeros(height * width, dtype=bool)
+        else:
+            targets = _position_keys(nx, ny)
+            positions = _position_keys(x[:n], y[:n])
+            occupancy = None
+
+        while len(movers):
+            # Monsters that aren't moving block their tile
+            standing = self.alive[:n].copy()
+            standing[movers] = False
+            if occupancy is not None:
+                occupancy[:] = False
+                occupancy[positions[standing]] = True
+                free = ~occupancy[targets]
+            else:
+                free = ~np.isin(targets, positions[standing])
+            # When several monsters want the same tile, the lowest slot gets it
+            first = np.zeros(len(movers), dtype=bool)
+            first[np.unique(targets, return_index=True)[1]] = True
+            accepted = free & first
+            if accepted.all():
+                break
+            # Blocked monsters stay put, which may block others: try again
+            movers, nx, ny, targets = movers[accepted], nx[accepted], ny[accepted], targets[accepted]
+
+        x[movers] = nx
+        y[movers] = ny
+
+
+def _position_keys(xs, ys) -> np.ndarray:
+    """Pack (x, y) pairs into single int64 keys for fast membership tests."""
+    return (np.asarray(xs, dtype=np.int64) << 32) | (np.asarray(ys, dtype=np.int64) & 0xFFFFFFFF)
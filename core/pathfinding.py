@@ -0,0 +1,445 @@
+"""
+Grid pathfinding for Thangorodrim.
+
+Pathfinder answers "how do I get from here to there?" for the player and
+for monsters on a TileMap. Movement is 8-directional; diagonal steps cost
+sqrt(2) and may not cut the corner of a wall.
+
+Three things keep it cheap when hundreds of monsters are chasing the
+player:
+
+- NavGrid: a compact one-byte-per-tile walkability grid built once per map
+  and patched (only the changed rectangle) when tiles change.
+- Jump point search: A* that skips over the long runs of open floor that
+  plain A* would push onto its open list one tile at a time.
+- PathCache: found paths are cached by (start, goal) and indexed by the
+  regions (square blocks of tiles) they pass through, or squeeze past on
+  a diagonal step, so blocking a tile only drops the paths that went
+  through that region.
+
+Requests can also be queued during a tick and resolved together with
+Pathfinder.resolve(). Requests that share a goal (e.g. every monster
+chasing the player) are answered by a single backwards Dijkstra search
+from the goal, instead of one search per monster.
+
+Usage:
+pathfinder = Pathfinder(tile_map)
+path = pathfinder.find_path((1, 1), (20, 14))   # [(1, 1), (2, 2), ...] or None
+
+pathfinder.request(slot, (x, y), player_position)   # for each monster
+paths = pathfinder.resolve()                          # {slot: path or None}
+"""
+
+import heapq
+from collections import OrderedDict, defaultdict
+from math import sqrt
+from typing import Dict, Hashable, List, Optional, Set, Tuple
+
+from core.tilemap import Tile
+
+Position = Tuple[int, int]
+Path = List[Position]
+
+SQRT2 = sqrt(2)
+
+# bytes.translate table: tile code -> 1 if walkable else 0
+_WALKABLE_CODES = {tile.code for tile in Tile if tile.walkable}
+_WALKABLE_TABLE = bytes(code in _WALKABLE_CODES for code in range(256))
+
+# Neighbour offsets, straight moves first
+DIRECTIONS = ((1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (1, -1), (-1, 1), (-1, -1))
+
+
+def octile(ax: int, ay: int, bx: int, by: int) -> float:
+    """Exact path length between two points on an empty 8-directional grid."""
+    dx, dy = abs(ax - bx), abs(ay - by)
+    return (dx + dy) + (SQRT2 - 2) * min(dx, dy)
+
+
+class NavGrid:
+    """One byte per tile (1 = walkable), kept in sync with a TileMap.
+
+    The grid is stored flat with a one-tile border of blocked cells around
+    the map, so searches can step to any neighbour by adding an offset to
+    an index without bounds checks. Use index()/position() to convert.
+
+    Other objects can listen for changes: listeners are called with
+    (x, y, width, height, opened) where `opened` is True if any tile in
+    the rectangle went from blocked to walkable.
+    """
+
+    def __init__(self, tile_map):
+        self.width = tile_map.width
+        self.height = tile_map.height
+        self.stride = self.width + 2
+        self.tile_map = tile_map
+        self.cells = bytearray(self.stride * (self.height + 2))
+        self._listeners = []
+        self._copy_rect(0, 0, self.width, self.height)
+        tile_map.add_listener(self.on_tiles_changed)
+
+        stride = self.stride
+        # (offset, cost, offsets of the two tiles a diagonal squeezes between)
+        self.steps = tuple((dy * stride + dx, SQRT2 if dx and dy else 1.0,
+                            (dx, dy * stride) if dx and dy else None)
+                           for dx, dy in DIRECTIONS)
+
+    def add_listener(self, callback):
+        self._listeners.append(callback)
+
+    def index(self, x: int, y: int) -> int:
+        return (y + 1) * self.stride + x + 1
+
+    def position(self, index: int) -> Position:
+        y, x = divmod(index, self.stride)
+        return x - 1, y - 1
+
+    def _copy_rect(self, x, y, width, height) -> Tuple[bool, bool]:
+        """Refresh a rectangle from the tile map; returns (changed, opened)."""
+        tiles, cells, w = self.tile_map.tiles, self.cells, self.width
+        changed = opened = False
+        for row in range(y, y + height):
+            fresh = tiles[row * w + x:row * w + x + width].translate(_WALKABLE_TABLE)
+            start = self.index(x, row)
+            old = cells[start:start + width]
+            if fresh != old:
+                changed = True
+                opened = opened or any(new and not was for new, was in zip(fresh, old))
+                cells[start:start + width] = fresh
+        return changed, opened
+
+    def on_tiles_changed(self, x, y, width, height):
+        changed, opened = self._copy_rect(x, y, width, height)
+        if changed:
+            for callback in self._listeners:
+                callback(x, y, width, height, opened)
+
+    def walkable(self, x: int, y: int) -> bool:
+        return 0 <= x < self.width and 0 <= y < self.height and self.cells[self.index(x, y)] == 1
+
+    def neighbours(self, x: int, y: int):
+        """Yield (nx, ny, cost) for every legal step out of (x, y)."""
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return
+        cells, i = self.cells, self.index(x, y)
+        for (dx, dy), (offset, cost, squeeze) in zip(DIRECTIONS, self.steps):
+            if cells[i + offset] and (squeeze is None or (cells[i + squeeze[0]] and cells[i + squeeze[1]])):
+                yield x + dx, y + dy, cost
+
+
+class PathCache:
+    """LRU cache of paths keyed by (start, goal), indexed by region."""
+
+    def __init__(self, region_size: int = 16, max_paths: int = 2048):
+        self.region_size = region_size
+        self.max_paths = max_paths
+        self._paths: "OrderedDict[Tuple[Position, Position], Optional[Path]]" = OrderedDict()
+        self._regions: Dict[Tuple[int, int], Set[Tuple[Position, Position]]] = defaultdict(set)
+        self._key_regions: Dict[Tuple[Position, Position], Set[Tuple[int, int]]] = {}
+
+    def __len__(self):
+        return len(self._paths)
+
+    def __contains__(self, key):
+        return key in self._paths
+
+    def get(self, start: Position, goal: Position) -> Optional[Path]:
+        """Return the cached path (None for 'no path'). Raises KeyError on a miss."""
+        key = (start, goal)
+        path = self._paths[key]
+        self._paths.move_to_end(key)
+        return path
+
+    def put(self, start: Position, goal: Position, path: Optional[Path]):
+        key = (start, goal)
+        self._discard(key)
+        size = self.region_size
+        # A failed search depends on the walls anywhere, so 'no path' is only
+        # dropped by clear(), which is what opening a tile triggers.
+        regions = set()
+        if path:
+            regions = {(x // size, y // size) for x, y in path}
+            # A diagonal step also needs the two tiles it squeezes between,
+            # which can be in a neighbouring region
+            for (x0, y0), (x1, y1) in zip(path, path[1:]):
+                if x0 != x1 and y0 != y1:
+                    regions.add((x1 // size, y0 // size))
+                    regions.add((x0 // size, y1 // size))
+        self._paths[key] = path
+        self._key_regions[key] = regions
+        for region in regions:
+            self._regions[region].add(key)
+        if len(self._paths) > self.max_paths:
+            self._discard(next(iter(self._paths)))
+
+    def _discard(self, key):
+        if key in self._paths:
+            del self._paths[key]
+            for region in self._key_regions.pop(key):
+                keys = self._regions[region]
+                keys.discard(key)
+                if not keys:
+                    del self._regions[region]
+
+    def invalidate_rect(self, x: int, y: int, width: int, height: int):
+        """Drop every path passing through a region that overlaps the rectangle."""
+        size = self.region_size
+        for ry in range(y // size, (y + height - 1) // size + 1):
+            for rx in range(x // size, (x + width - 1) // size + 1):
+                for key in list(self._regions.get((rx, ry), ())):
+                    self._discard(key)
+
+    def clear(self):
+        self._paths.clear()
+        self._regions.clear()
+        self._key_regions.clear()
+
+
+class Pathfinder:
+    """Jump point search with a path cache and batched requests for one map."""
+
+    def __init__(self, tile_map, region_size: int = 16, max_paths: int = 2048,
+                 shared_goal_threshold: int = 4):
+        self.grid = NavGrid(tile_map)
+        self.cells, self.stride = self.grid.cells, self.grid.stride
+        self.cache = PathCache(region_size, max_paths)
+        self.shared_goal_threshold = shared_goal_threshold
+        self._requests: Dict[Hashable, Tuple[Position, Position]] = {}
+        self.grid.add_listener(self.on_grid_changed)
+
+    def on_grid_changed(self, x, y, width, height, opened):
+        if opened:
+            # A new opening can make a shorter route anywhere (or make an
+            # unreachable goal reachable), so nothing cached is trustworthy.
+            self.cache.clear()
+        else:
+            self.cache.invalidate_rect(x, y, width, height)
+
+    # --- SINGLE REQUESTS ---
+
+    def find_path(self, start: Position, goal: Position) -> Optional[Path]:
+        """Return the tiles from start to goal (both included), or None if unreachable."""
+        start, goal = tuple(start), tuple(goal)
+        if (start, goal) in self.cache:
+            return self.cache.get(start, goal)
+        path = self._jump_point_search(start, goal)
+        self.cache.put(start, goal, path)
+        return path
+
+    # --- BATCHED REQUESTS ---
+
+    def request(self, key: Hashable, start: Position, goal: Position):
+        """Queue a path request for `key` (e.g. a monster slot) until resolve()."""
+        self._requests[key] = (tuple(start), tuple(goal))
+
+    def resolve(self) -> Dict[Hashable, Optional[Path]]:
+        """Answer every queued request and clear the queue."""
+        requests, self._requests = self._requests, {}
+        results = {}
+        by_goal: Dict[Position, Dict[Hashable, Position]] = defaultdict(dict)
+        for key, (start, goal) in requests.items():
+            if (start, goal) in self.cache:
+                results[key] = self.cache.get(start, goal)
+            else:
+                by_goal[goal][key] = start
+
+        for goal, starts in by_goal.items():
+            if len(set(starts.values())) >= self.shared_goal_threshold:
+                paths = self._paths_to_goal(goal, set(starts.values()))
+                for start, path in paths.items():
+                    self.cache.put(start, goal, path)
+                for key, start in starts.items():
+                    results[key] = paths[start]
+            else:
+                for key, start in starts.items():
+                    results[key] = self.find_path(start, goal)
+        return results
+
+    # --- SEARCHES ---
+
+    def _jump_straight(self, i: int, step: int, side: int, goal: int) -> Optional[int]:
+        """Scan from cell i in a straight line until a jump point, the goal or a wall.
+
+        `step` is the index offset of one move and `side` the offset to the
+        cells beside the line. A cell is a jump point when a cell beside it
+        is open but the cell beside the previous one was blocked.
+        """
+        cells = self.cells
+        while True:
+            i += step
+            if not cells[i]:
+                return None
+            if i == goal:
+                return i
+            if ((cells[i - side] and not cells[i - side - step]) or
+                    (cells[i + side] and not cells[i + side - step])):
+                return i
+
+    def _jump(self, i: int, dx: int, dy: int, goal: int) -> Optional[int]:
+        """Step from cell i in direction (dx, dy) until a jump point, the goal or a wall."""
+        stride = self.stride
+        if dx and dy:
+            cells = self.cells
+            step_y = dy * stride
+            while True:
+                # No squeezing between two blocked tiles
+                if not (cells[i + dx] and cells[i + step_y]):
+                    return None
+                i += dx + step_y
+                if not cells[i]:
+                    return None
+                if i == goal:
+                    return i
+                # A diagonal run stops wherever a straight run would find something
+                if (self._jump_straight(i, dx, stride, goal) is not None or
+                        self._jump_straight(i, step_y, 1, goal) is not None):
+                    return i
+        if dx:
+            return self._jump_straight(i, dx, stride, goal)
+        return self._jump_straight(i, dy * stride, 1, goal)
+
+    def _pruned_directions(self, i: int, parent: Optional[int]):
+        """Directions worth jumping in from cell i, given the cell we came from."""
+        cells, stride = self.cells, self.stride
+        if parent is None:
+            return [DIRECTIONS[n] for n, (offset, _, squeeze) in enumerate(self.grid.steps)
+                    if cells[i + offset] and (squeeze is None or (cells[i + squeeze[0]] and cells[i + squeeze[1]]))]
+
+        (x, y), (px, py) = self.grid.position(i), self.grid.position(parent)
+        dx, dy = (x > px) - (x < px), (y > py) - (y < py)
+        directions = []
+        if dx and dy:
+            vertical, horizontal = cells[i + dy * stride], cells[i + dx]
+            if vertical:
+                directions.append((0, dy))
+            if horizontal:
+                directions.append((dx, 0))
+            if vertical and horizontal:
+                directions.append((dx, dy))
+        elif dx:
+            ahead, up, down = cells[i + dx], cells[i - stride], cells[i + stride]
+            if ahead:
+                directions.append((dx, 0))
+                if up:
+                    directions.append((dx, -1))
+                if down:
+                    directions.append((dx, 1))
+            if up:
+                directions.append((0, -1))
+            if down:
+                directions.append((0, 1))
+        else:
+            ahead, left, right = cells[i + dy * stride], cells[i - 1], cells[i + 1]
+            if ahead:
+                directions.append((0, dy))
+                if left:
+                    directions.append((-1, dy))
+                if right:
+                    directions.append((1, dy))
+            if left:
+                directions.append((-1, 0))
+            if right:
+                directions.append((1, 0))
+        return directions
+
+    def _jump_point_search(self, start: Position, goal: Position) -> Optional[Path]:
+        grid = self.grid
+        if not (grid.walkable(*start) and grid.walkable(*goal)):
+            return None
+        if start == goal:
+            return [start]
+
+        gx, gy = goal
+        start_i, goal_i = grid.index(*start), grid.index(*goal)
+        g_score = {start_i: 0.0}
+        parents: Dict[int, Optional[int]] = {start_i: None}
+        open_heap = [(octile(*start, gx, gy), 0.0, start_i)]
+        closed = set()
+
+        while open_heap:
+            _, g, node = heapq.heappop(open_heap)
+            if node in closed:
+                continue
+            if node == goal_i:
+                return self._expand(node, parents)
+            closed.add(node)
+            x, y = grid.position(node)
+            for dx, dy in self._pruned_directions(node, parents[node]):
+                jump_point = self._jump(node, dx, dy, goal_i)
+                if jump_point is None or jump_point in closed:
+                    continue
+                jx, jy = grid.position(jump_point)
+                new_g = g + octile(x, y, jx, jy)
+                if new_g < g_score.get(jump_point, float("inf")):
+                    g_score[jump_point] = new_g
+                    parents[jump_point] = node
+                    heapq.heappush(open_heap, (new_g + octile(jx, jy, gx, gy), new_g, jump_point))
+        return None
+
+    def _expand(self, node: int, parents: Dict[int, Optional[int]]) -> Path:
+        """Turn a chain of jump points into every tile along the way."""
+        jump_points = []
+        while node is not None:
+            jump_points.append(self.grid.position(node))
+            node = parents[node]
+        jump_points.reverse()
+
+        path = [jump_points[0]]
+        for tx, ty in jump_points[1:]:
+            x, y = path[-1]
+            dx, dy = (tx > x) - (tx < x), (ty > y) - (ty < y)
+            while (x, y) != (tx, ty):
+                x, y = x + dx, y + dy
+                path.append((x, y))
+        return path
+
+    def _paths_to_goal(self, goal: Position, starts: Set[Position]) -> Dict[Position, Optional[Path]]:
+        """One backwards Dijkstra from the goal, stopping once every start is settled.
+
+        Moves are symmetric, so following each settled start's parents
+        leads back to the goal along a shortest path.
+        """
+        grid = self.grid
+        results: Dict[Position, Optional[Path]] = {start: None for start in starts}
+        if not grid.walkable(*goal):
+            return results
+
+        cells, steps = grid.cells, grid.steps
+        goal_i = grid.index(*goal)
+        towards_goal: Dict[int, Optional[int]] = {goal_i: None}
+        dist = {goal_i: 0.0}
+        heap = [(0.0, goal_i)]
+        remaining = {grid.index(*start) for start in starts if grid.walkable(*start)}
+        while heap and remaining:
+            d, node = heapq.heappop(heap)
+            if d > dist[node]:
+                continue
+            remaining.discard(node)
+            for offset, cost, squeeze in steps:
+                n = node + offset
+                if not cells[n] or (squeeze and not (cells[node + squeeze[0]] and cells[node + squeeze[1]])):
+                    continue
+                nd = d + cost
+                if nd < dist.get(n, float("inf")):
+                    dist[n] = nd
+                    towards_goal[n] = node
+                    heapq.heappush(heap, (nd, n))
+
+        for start in starts:
+            node = grid.index(*start) if grid.walkable(*start) else None
+            if node is None or node in remaining or node not in towards_goal:
+                continue
+            path = []
+            while node is not None:
+                path.append(grid.position(node))
+                node = towards_goal[node]
+            results[start] = path
+        return results
+
+
+def first_step(path: Optional[Path]) -> Tuple[int, int]:
+    """The (dx, dy) of the first move along a path, or (0, 0) if there isn't one."""
+    if not path or len(path) < 2:
+        return 0, 0
+    (x0, y0), (x1, y1) = path[0], path[1]
+    return x1 - x0, y1 - y0
@@ -62,9 +62,9 @@ class Player:
         dexterity, _ = Die.roll('4d5')
         constitution, _ = Die.roll('4d5')
 
-        max_hp = cls.set_hit_points(cls, 1, constitution, archetype.health_die)
-        max_mp = cls.set_magic_points(cls, 1, intelligence,archetype.magic_die)
-        max_carry = cls.set_carry(cls, 1, strength)
+        max_hp = cls.roll_level_gains(1, constitution, archetype.health_die)
+        max_mp = cls.roll_level_gains(1, intelligence, archetype.magic_die)
+        max_carry = cls.calculate_max_carry(1, strength)
 
         player_data = {
             'name': name,
@@ -110,15 +110,11 @@ class Player:
         If called when the player already has HP from previous levels, it only rolls
         for levels that haven't been accounted for yet.
         """
-        con_mod = floor((constitution - 10) / 2)
         starting_level = getattr(self, "level", 0)
         total_hp = getattr(self, "max_hit_points", 0)
 
         # Only roll for levels gained beyond current level
-        for _ in range(starting_level + 1, new_level + 1):
-            total, _ = Die.roll(base_die)
-            hp_gain = max(1, total + con_mod)
-            total_hp += hp_gain
+        total_hp += self.roll_level_gains(new_level - starting_level, constitution, base_die)
 
         self.level = new_level
         self.max_hit_points = total_hp
@@ -133,15 +129,11 @@ class Player:
         If called when the player already has MP from previous levels, it only rolls
         for levels that haven't been accounted for yet.
         """
-        int_mod = floor((intelligence - 10) / 2)
         starting_level = getattr(self, "level", 0)
         total_mp = getattr(self, "max_magic_points", 0)
 
         # Only roll for levels gained beyond current level
-        for _ in range(starting_level + 1, new_level + 1):
-            total, _ = Die.roll(base_die)
-            mp_gain = max(1, total + int_mod)
-            total_mp += mp_gain
+        total_mp += self.roll_level_gains(new_level - starting_level, intelligence, base_die)
 
         self.level = new_level
         self.max_magic_points = total_mp
@@ -184,6 +176,19 @@ class Player:
 
     # --- HELPER METHODS ---
 
+    @staticmethod
+    def roll_level_gains(levels, ability_score, base_die):
+        '''
+        Helper method to roll the HP/MP gained over `levels` levels.
+        Each level rolls `base_die`, adds the ability modifier, and gains at least 1.
+        '''
+        modifier = floor((ability_score - 10) / 2)
+        total = 0
+        for _ in range(levels):
+            roll, _ = Die.roll(base_die)
+            total += max(1, roll + modifier)
+        return total
+
     @staticmethod
     def calculate_max_carry(new_level, strength):
         '''
@@ -0,0 +1,177 @@
+"""
+Turn scheduling for Thangorodrim.
+
+Turn order between the player and monsters works on a shared game clock
+measured in integer "ticks". Every actor has a speed, and an action takes
+ACTION_COST * NORMAL_SPEED / speed ticks, so an actor twice as fast as
+normal acts twice as often.
+
+TurnScheduler keeps actors in a heap keyed by the tick of their next
+action, so finding who acts next never means scanning every actor:
+
+- add / reschedule / remove are O(log n),
+- next_batch() pops every actor due at the earliest tick in one go.
+
+Actors handed out by next_batch() are pushed back only once: either by an
+explicit reschedule() or, failing that, one normal action later when the
+clock next advances.
+
+Removed or rescheduled actors leave a stale entry in the heap that is
+skipped when it reaches the top (the lazy deletion approach from the
+heapq documentation); the heap is rebuilt if stale entries pile up.
+
+Usage:
+scheduler = TurnScheduler()
+scheduler.add(player, player_speed(player))
+scheduler.add(orc_slot, speed_from_dexterity(12))
+
+tick, actors = scheduler.next_batch()   # everyone acting at the earliest tick
+for actor in actors:
+    ...                                   # act; by default the next turn is one action away
+    scheduler.reschedule(actor, cost=200) # or charge a slow action
+"""
+
+import heapq
+from itertools import count
+from math import floor
+from typing import Dict, Hashable, List, Optional, Tuple
+
+NORMAL_SPEED = 100
+ACTION_COST = 100
+MIN_SPEED = 25
+
+# Speed gained per point of dexterity modifier
+SPEED_PER_DEX_MOD = 10
+
+
+def speed_from_dexterity(dexterity: int, bonus: int = 0) -> int:
+    """Speed for an actor with this dexterity (plus any bonus to it)."""
+    dex_mod = floor((dexterity + bonus - 10) / 2)
+    return max(MIN_SPEED, NORMAL_SPEED + dex_mod * SPEED_PER_DEX_MOD)
+
+
+def player_speed(player) -> int:
+    """Speed for a Player: dexterity plus the archetype's dexterity bonus."""
+    return speed_from_dexterity(player.dexterity, player.archetype.bonuses.get("dexterity", 0))
+
+
+def action_delay(speed: int, cost: int = ACTION_COST) -> int:
+    """Ticks until the next turn after an action costing `cost` at `speed`."""
+    return max(1, round(cost * NORMAL_SPEED / speed))
+
+
+class TurnScheduler:
+    """Priority queue of actors keyed by the tick of their next action.
+
+    Actors can be any hashable (a Player, a monster slot...). Actors due at
+    the same tick come out in the order they were (re)scheduled.
+    """
+
+    def __init__(self):
+        self.now = 0
+        self._heap: List[list] = []
+        self._entries: Dict[Hashable, list] = {}
+        self._speeds: Dict[Hashable, int] = {}
+        self._sequence = count()
+        self._stale = 0
+        # Actors from the last batch that haven't been rescheduled yet
+        self._pending: Dict[Hashable, None] = {}
+
+    def __len__(self):
+        return len(self._entries) + len(self._pending)
+
+    def __contains__(self, actor):
+        return actor in self._entries or actor in self._pending
+
+    # --- QUEUE OPERATIONS ---
+
+    def add(self, actor: Hashable, speed: int, delay: Optional[int] = None):
+        """Start scheduling an actor; its first turn is one action from now by default.
+
+        Raises ValueError if the actor is already scheduled.
+        """
+        if actor in self:
+            raise ValueError(f"{actor!r} is already scheduled.")
+        self._speeds[actor] = speed
+        self._push(actor, self.now + (action_delay(speed) if delay is None else delay))
+
+    def reschedule(self, actor: Hashable, cost: int = ACTION_COST, delay: Optional[int] = None):
+        """Move an actor's next turn to after an action of `cost` (or an explicit delay).
+
+        Raises KeyError if the actor isn't scheduled.
+        """
+        speed = self._speeds[actor]
+        if actor in self._pending:
+            del self._pending[actor]
+        else:
+            self._invalidate(actor)
+        self._push(actor, self.now + (action_delay(speed, cost) if delay is None else delay))
+
+    def remove(self, actor: Hashable):
+        """Stop scheduling an actor (e.g. a monster died). Raises KeyError if it isn't scheduled."""
+        if actor in self._pending:
+            del self._pending[actor]
+        else:
+            self._invalidate(actor)
+        del self._speeds[actor]
+
+    def set_speed(self, actor: Hashable, speed: int):
+        """Change an actor's speed from its next reschedule on. Raises KeyError if unknown."""
+        if actor not in self._speeds:
+            raise KeyError(actor)
+        self._speeds[actor] = speed
+
+    def next_time(self) -> Optional[int]:
+        """The tick of the next turn, or None if nobody is scheduled."""
+        self._flush_pending()
+        self._drop_stale_top()
+        return self._heap[0][0] if self._heap else None
+
+    def next_batch(self) -> Tuple[Optional[int], List[Hashable]]:
+        """Advance the clock to the next turn and return every actor due then.
+
+        Unless reschedule() is called for them first, the returned actors
+        take their next turn one normal action later.
+        """
+        time = self.next_time()
+        if time is None:
+            return None, []
+        self.now = time
+        actors = []
+        while self._heap and self._heap[0][0] == time:
+            entry = heapq.heappop(self._heap)
+            if entry[2] is None:
+                self._stale -= 1
+                continue
+            actors.append(entry[2])
+        for actor in actors:
+            del self._entries[actor]
+            self._pending[actor] = None
+        return time, actors
+
+    # --- INTERNALS ---
+
+    def _flush_pending(self):
+        """Give actors that weren't rescheduled after their turn a normal action."""
+        for actor in self._pending:
+            self._push(actor, self.now + action_delay(self._speeds[actor]))
+        self._pending.clear()
+
+    def _push(self, actor, time):
+        entry = [time, next(self._sequence), actor]
+        self._entries[actor] = entry
+        heapq.heappush(self._heap, entry)
+
+    def _invalidate(self, actor):
+        entry = self._entries.pop(actor)
+        entry[2] = None
+        self._stale += 1
+        if self._stale > 64 and self._stale > len(self._heap) // 2:
+            self._heap = [e for e in self._heap if e[2] is not None]
+            heapq.heapify(self._heap)
+            self._stale = 0
+
+    def _drop_stale_top(self):
+        while self._heap and self._heap[0][2] is None:
+            heapq.heappop(self._heap)
+            self._stale -= 1
@@ -0,0 +1,99 @@
+'''The TileMap class: the grid of tiles a level is made of'''
+
+from enum import Enum
+
+
+class Tile(Enum):
+    # Code, Label, Walkable, Opaque
+    FLOOR = (0, "Floor", True, False)
+    WALL = (1, "Wall", False, True)
+    DOOR = (2, "Door", True, True)
+    WATER = (3, "Water", False, False)
+
+    def __init__(self, code, label, walkable, opaque):
+        self.code = code
+        self.label = label
+        self.walkable = walkable
+        self.opaque = opaque
+
+    @classmethod
+    def from_code(cls, code):
+        return _TILES_BY_CODE[code]
+
+
+_TILES_BY_CODE = {tile.code: tile for tile in Tile}
+
+
+# The TileMap stores one byte (the Tile code) per cell, row by row.
+#
+# Anything that keeps data derived from the tiles (the renderer's cached
+# chunks, navigation grids, visibility caches...) registers a listener and
+# gets told which rectangle changed:
+#
+# tile_map.add_listener(callback)   # callback(x, y, width, height)
+class TileMap:
+    def __init__(self, width, height, fill=Tile.WALL):
+        if width < 1 or height < 1:
+            raise ValueError("A TileMap must be at least 1x1.")
+        self.width = width
+        self.height = height
+        self.tiles = bytearray([fill.code]) * (width * height)
+        self._listeners = []
+
+    # --- LISTENERS ---
+
+    def add_listener(self, callback):
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback):
+        self._listeners.remove(callback)
+
+    def _notify(self, x, y, width, height):
+        for callback in self._listeners:
+            callback(x, y, width, height)
+
+    # --- TILE ACCESS ---
+
+    def in_bounds(self, x, y):
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def get(self, x, y):
+        '''Return the Tile at (x, y). Raises IndexError when out of bounds.'''
+        if not self.in_bounds(x, y):
+            raise IndexError(f"({x}, {y}) is outside the {self.width}x{self.height} map.")
+        return _TILES_BY_CODE[self.tiles[y * self.width + x]]
+
+    def set(self, x, y, tile):
+        '''Change a single tile, notifying listeners only if it actually changed.'''
+        if not self.in_bounds(x, y):
+            raise IndexError(f"({x}, {y}) is outside the {self.width}x{self.height} map.")
+        index = y * self.width + x
+        if self.tiles[index] != tile.code:
+            self.tiles[index] = tile.code
+            self._notify(x, y, 1, 1)
+
+    def fill_rect(self, x, y, width, height, tile):
+        '''Set every tile in a rectangle (clipped to the map) with one notification.'''
+        x0, y0 = max(0, x), max(0, y)
+        x1, y1 = min(self.width, x + width), min(self.height, y + height)
+        if x0 >= x1 or y0 >= y1:
+            return
+        row = bytes([tile.code]) * (x1 - x0)
+        for row_y in range(y0, y1):
+            start = row_y * self.width + x0
+            self.tiles[start:start + (x1 - x0)] = row
+        self._notify(x0, y0, x1 - x0, y1 - y0)
+
+    def write_region(self, x, y, width, height, codes):
+        '''Copy a width x height block of tile codes (row by row) into the map.
+
+        The block must fit entirely inside the map.
+        '''
+        if width * height != len(codes):
+            raise ValueError("Region size doesn't match the number of tile codes.")
+        if not (self.in_bounds(x, y) and self.in_bounds(x + width - 1, y + height - 1)):
+            raise IndexError("Region does not fit inside the map.")
+        for row in range(height):
+            start = (y + row) * self.width + x
+            self.tiles[start:start + width] = codes[row * width:(row + 1) * width]
+        self._notify(x, y, width, height)
@@ -0,0 +1,108 @@
+"""
+Resolution-independent rendering for Thangorodrim.
+
+Scenes always draw into a surface of one fixed LOGICAL size (1024x768 by
+default), whatever the size of the window. Once per frame RenderTarget
+scales that surface into the window, keeping its aspect ratio and
+letterboxing the rest:
+
+- "integer" scaling uses the largest whole-number factor that fits, with
+  nearest-neighbour sampling, so pixel art stays crisp;
+- "smooth" scaling fills as much of the window as possible with
+  smoothscale.
+
+Fonts, backgrounds and tile chunks are therefore rasterised once at the
+logical size, not again for every window size. The scaled surface is
+allocated once per window size and reused every frame; a resize only
+rebuilds that.
+
+Mouse positions in events are in window pixels; map_event / to_logical
+convert them to logical pixels before scenes see them.
+
+Usage:
+target = RenderTarget((1024, 768), window.get_size(), mode="smooth")
+scene.draw()                 # the scene's screen is target.surface
+target.present(window)
+"""
+
+from typing import Optional, Tuple
+
+import pygame
+
+SCALE_MODES = ("integer", "smooth")
+
+Size = Tuple[int, int]
+
+
+def fit(logical: Size, window: Size, mode: str) -> Tuple[Size, Tuple[int, int]]:
+    """Where the logical surface goes in the window: (scaled size, top-left offset).
+
+    Integer scaling falls back to fractional scaling when the window is
+    smaller than the logical size.
+    """
+    lw, lh = logical
+    ww, wh = window
+    factor = min(ww / lw, wh / lh)
+    if mode == "integer" and factor >= 1:
+        factor = int(factor)
+    size = (max(1, round(lw * factor)), max(1, round(lh * factor)))
+    return size, ((ww - size[0]) // 2, (wh - size[1]) // 2)
+
+
+class RenderTarget:
+    """A fixed-size surface for scenes, scaled into the window once per frame."""
+
+    def __init__(self, logical_size: Size, window_size: Size, mode: str = "smooth",
+                 border_colour=(0, 0, 0)):
+        if mode not in SCALE_MODES:
+            raise ValueError(f"Unknown scale mode '{mode}'; expected one of {', '.join(SCALE_MODES)}.")
+        self.logical_size = tuple(logical_size)
+        self.mode = mode
+        self.border_colour = border_colour
+        self.surface = pygame.Surface(self.logical_size)
+        self.scaled: Optional[object] = None
+        self.resize(window_size)
+
+    def resize(self, window_size: Size):
+        """Recompute the layout and reallocate the scaled surface for a new window size."""
+        self.window_size = tuple(window_size)
+        self.scaled_size, self.offset = fit(self.logical_size, self.window_size, self.mode)
+        # At 1:1 the logical surface is blitted as it is
+        self.scaled = None if self.scaled_size == self.logical_size else pygame.Surface(self.scaled_size)
+        self.borders_dirty = True
+
+    @property
+    def scale(self) -> float:
+        return self.scaled_size[0] / self.logical_size[0]
+
+    def present(self, window):
+        """Scale this frame into the window (call before pygame.display.flip)."""
+        if self.borders_dirty:
+            window.fill(self.border_colour)
+            self.borders_dirty = False
+        if self.scaled is None:
+            window.blit(self.surface, self.offset)
+            return
+        if self.mode == "smooth":
+            pygame.transform.smoothscale(self.surface, self.scaled_size, self.scaled)
+        else:
+            pygame.transform.scale(self.surface, self.scaled_size, self.scaled)
+        window.blit(self.scaled, self.offset)
+
+    # --- INPUT ---
+
+    def to_logical(self, position: Tuple[int, int]) -> Tuple[int, int]:
+        """Convert a window position to logical pixels, clamped to the logical surface."""
+        scale = self.scale
+        x = int((position[0] - self.offset[0]) / scale)
+        y = int((position[1] - self.offset[1]) / scale)
+        return (min(max(x, 0), self.logical_size[0] - 1), min(max(y, 0), self.logical_size[1] - 1))
+
+    def map_event(self, event):
+        """Return the event with its mouse position (if any) in logical pixels."""
+        if not hasattr(event, "pos"):
+            return event
+        attributes = dict(event.dict, pos=self.to_logical(event.pos))
+        if "rel" in attributes:
+            attributes["rel"] = (round(event.rel[0] / self.scale), round(event.rel[1] / self.scale))
+        return pygame.event.Event(event.type, attributes)
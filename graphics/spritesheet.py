@@ -0,0 +1,228 @@
+"""
+Sprite sheets and animations for Thangorodrim.
+
+A sprite sheet is one image holding a grid of equally sized frames. The
+layout of each sheet (frame size and which cells make up which animation)
+is described in data/spritesheets.json:
+
+{
+  "human": {
+    "image": "human.png",
+    "frame_width": 128,
+    "frame_height": 128,
+    "animations": {
+      "walk_down": { "frames": [[0,1],[0,0],[0,2],[0,0]], "frame_ms": 150 }
+    }
+  }
+}
+
+Frames are cut out of the sheet once, as subsurfaces, when the sheet is
+loaded. Animations only hold references to those frames, and every entity
+that shares a sheet (e.g. every Human on the map) shares the same frames.
+Per-entity state lives in a tiny AnimationState object.
+
+Scaled and flipped copies of frames are kept in a FrameCache, so a frame is
+transformed once rather than once per entity per draw.
+"""
+
+import json
+import os
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional, Tuple
+
+import pygame
+
+SPRITESHEETS_DATA_FILE = os.path.join("data", "spritesheets.json")
+SPRITESHEETS_DIR = os.path.join("assets", "spritesheets")
+
+# Sheet used for any race that doesn't have its own artwork yet.
+DEFAULT_SHEET = "human"
+
+
+@dataclass(frozen=True)
+class Animation:
+    """An immutable sequence of frames shared by every entity using it.
+
+    Attributes:
+        name: Animation name from the layout descriptor (e.g. 'walk_down').
+        frames: Frame surfaces, in playback order.
+        frame_ms: How long each frame is shown, in milliseconds.
+        loop: Whether playback wraps around or holds on the last frame.
+    """
+    name: str
+    frames: Tuple[object, ...]
+    frame_ms: int = 100
+    loop: bool = True
+
+    @property
+    def duration_ms(self) -> int:
+        return self.frame_ms * len(self.frames)
+
+    def frame_index(self, elapsed_ms: float) -> int:
+        """Return the index of the frame shown `elapsed_ms` after starting."""
+        index = int(elapsed_ms // self.frame_ms)
+        if self.loop:
+            return index % len(self.frames)
+        return min(index, len(self.frames) - 1)
+
+    def frame_at(self, elapsed_ms: float):
+        """Return the frame surface shown `elapsed_ms` after starting."""
+        return self.frames[self.frame_index(elapsed_ms)]
+
+
+class SpriteSheet:
+    """A sheet image sliced into frames according to a layout descriptor.
+
+    Only the cells referenced by an animation are sliced, and each cell is
+    sliced exactly once even if several animations use it.
+    """
+
+    def __init__(self, name: str, surface, layout: Dict):
+        self.name = name
+        self.surface = surface
+        self.frame_width = layout["frame_width"]
+        self.frame_height = layout["frame_height"]
+
+        self.frames: Dict[Tuple[int, int], object] = {}
+        self.animations: Dict[str, Animation] = {}
+        for anim_name, anim in layout.get("animations", {}).items():
+            frames = tuple(self.frame(col, row) for col, row in anim["frames"])
+            self.animations[anim_name] = Animation(name=anim_name,
+                                                   frames=frames,
+                                                   frame_ms=anim.get("frame_ms", 100),
+                                                   loop=anim.get("loop", True))
+
+    def frame(self, col: int, row: int):
+        """Return the subsurface for the cell at (col, row), slicing it on first use."""
+        key = (col, row)
+        if key not in self.frames:
+            rect = (col * self.frame_width, row * self.frame_height,
+                    self.frame_width, self.frame_height)
+            self.frames[key] = self.surface.subsurface(rect)
+        return self.frames[key]
+
+    def animation(self, name: str) -> Animation:
+        """Return the named animation. Raises KeyError if the sheet doesn't define it."""
+        return self.animations[name]
+
+
+class AnimationState:
+    """Per-entity playback state: which animation, and how far into it.
+
+    This is the only animation data an entity owns; the frames themselves
+    belong to the shared Animation.
+    """
+
+    __slots__ = ("animation", "elapsed_ms")
+
+    def __init__(self, animation: Animation):
+        self.animation = animation
+        self.elapsed_ms = 0.0
+
+    def play(self, animation: Animation):
+        """Switch to `animation`, restarting only if it's a different one."""
+        if animation is not self.animation:
+            self.animation = animation
+            self.elapsed_ms = 0.0
+
+    def update(self, dt_ms: float):
+        self.elapsed_ms += dt_ms
+
+    @property
+    def finished(self) -> bool:
+        return not self.animation.loop and self.elapsed_ms >= self.animation.duration_ms
+
+    @property
+    def frame(self):
+        return self.animation.frame_at(self.elapsed_ms)
+
+
+class FrameCache:
+    """Least-recently-used cache of scaled and/or flipped frames.
+
+    Keys are (frame, size, flip_x, flip_y) so every entity asking for the
+    same variant of the same shared frame gets the same surface back.
+    Once `max_entries` variants are cached the least recently used one is
+    evicted.
+    """
+
+    def __init__(self, max_entries: int = 512):
+        self.max_entries = max_entries
+        self._variants: "OrderedDict[Tuple, object]" = OrderedDict()
+
+    def __len__(self):
+        return len(self._variants)
+
+    def get(self, frame, size: Optional[Tuple[int, int]] = None,
+            flip_x: bool = False, flip_y: bool = False):
+        """Return `frame` scaled to `size` and flipped as requested.
+
+        The untransformed frame is returned as-is and never cached.
+        """
+        if size is None and not flip_x and not flip_y:
+            return frame
+
+        key = (frame, size, flip_x, flip_y)
+        variant = self._variants.get(key)
+        if variant is not None:
+            self._variants.move_to_end(key)
+            return variant
+
+        variant = frame
+        if size is not None:
+            variant = pygame.transform.scale(variant, size)
+        if flip_x or flip_y:
+            variant = pygame.transform.flip(variant, flip_x, flip_y)
+
+        self._variants[key] = variant
+        if len(self._variants) > self.max_entries:
+            self._variants.popitem(last=False)
+        return variant
+
+    def clear(self):
+        self._variants.clear()
+
+
+class SpriteLibrary:
+    """Loads sprite sheets on demand and hands out the shared instances.
+
+    Usage:
+    library = SpriteLibrary()
+    sheet = library.for_race(Race.ELF)
+    state = AnimationState(sheet.animation("idle_down"))
+    """
+
+    def __init__(self, data_file: str = SPRITESHEETS_DATA_FILE,
+                 sheets_dir: str = SPRITESHEETS_DIR, cache_size: int = 512, assets=None):
+        with open(data_file, 'r', encoding='utf-8') as f:
+            self.layouts = json.load(f)
+        self.sheets_dir = sheets_dir
+        # Optional AssetManager; sheet images are then read from the asset pack
+        self.assets = assets
+        self.sheets: Dict[str, SpriteSheet] = {}
+        self.cache = FrameCache(cache_size)
+
+    def sheet(self, name: str) -> SpriteSheet:
+        """Return the named sheet, loading and slicing it the first time."""
+        if name not in self.sheets:
+            layout = self.layouts[name]
+            if self.assets is not None:
+                surface = self.assets.image("spritesheets/" + layout["image"])
+            else:
+                surface = pygame.image.load(os.path.join(self.sheets_dir, layout["image"]))
+            # convert_alpha needs a display; without one keep the decoded surface
+            if pygame.display.get_surface() is not None:
+                surface = surface.convert_alpha()
+            self.sheets[name] = SpriteSheet(name, surface, layout)
+        return self.sheets[name]
+
+    def for_race(self, race) -> SpriteSheet:
+        """Return the sheet shared by every entity of `race`."""
+        name = race.name.lower()
+        return self.sheet(name if name in self.layouts else DEFAULT_SHEET)
+
+
+def draw_sprites(target, sprites: Iterable[Tuple[object, Tuple[int, int]]]):
+    """Blit many (surface, position) pairs onto `target` in a single call."""
+    target.blits(sprites, doreturn=False)
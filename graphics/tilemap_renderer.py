@@ -0,0 +1,157 @@
+"""
+Chunked tile map rendering for Thangorodrim.
+
+Blitting every visible tile every frame costs one blit per tile: a
+1024x768 window of 32px tiles is ~800 blits per frame, and more once
+tiles get decorations. Instead the map is split into square chunks of
+tiles. Each chunk is rendered once into its own surface and kept until a
+tile inside it changes (the renderer listens to the TileMap for that).
+A frame is then just one blit per chunk that overlaps the camera.
+
+Chunk surfaces are kept in a least-recently-used cache so memory stays
+bounded on large maps: chunks that scroll far off screen are dropped and
+re-rendered if the camera comes back.
+"""
+
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+import pygame
+
+from core.tilemap import Tile
+
+TILE_SIZE = 32
+CHUNK_TILES = 16
+
+# Placeholder colours used for tiles that don't have artwork yet.
+TILE_COLOURS = {
+    Tile.FLOOR: (72, 62, 54),
+    Tile.WALL: (34, 30, 40),
+    Tile.DOOR: (110, 74, 40),
+    Tile.WATER: (30, 60, 110),
+}
+
+
+class Camera:
+    """The part of the world (in pixels) that is currently on screen."""
+
+    def __init__(self, width: int, height: int, x: int = 0, y: int = 0):
+        self.width = width
+        self.height = height
+        self.x = x
+        self.y = y
+
+    def move(self, dx: int, dy: int, world_width: int, world_height: int):
+        self.x += dx
+        self.y += dy
+        self.clamp(world_width, world_height)
+
+    def center_on(self, px: int, py: int, world_width: int, world_height: int):
+        self.x = px - self.width // 2
+        self.y = py - self.height // 2
+        self.clamp(world_width, world_height)
+
+    def clamp(self, world_width: int, world_height: int):
+        """Keep the camera inside the world (or pinned to 0 if the world is smaller)."""
+        self.x = max(0, min(self.x, world_width - self.width))
+        self.y = max(0, min(self.y, world_height - self.height))
+
+
+class ChunkedTileRenderer:
+    """Draws a TileMap through cached, pre-rendered chunk surfaces.
+
+    Attributes:
+        tile_map: The map being drawn.
+        tile_size: Tile edge length in pixels.
+        chunk_tiles: Chunk edge length in tiles.
+        tile_images: Optional Tile -> surface mapping; tiles without an image
+            are filled with their TILE_COLOURS entry.
+        max_chunks: Number of chunk surfaces kept before the least recently
+            drawn one is dropped.
+    """
+
+    def __init__(self, tile_map, tile_size: int = TILE_SIZE, chunk_tiles: int = CHUNK_TILES,
+                 tile_images: Optional[Dict[Tile, object]] = None, max_chunks: int = 64):
+        self.tile_map = tile_map
+        self.tile_size = tile_size
+        self.chunk_tiles = chunk_tiles
+        self.chunk_pixels = tile_size * chunk_tiles
+        self.tile_images = tile_images or {}
+        self.max_chunks = max_chunks
+
+        self.chunks: "OrderedDict[Tuple[int, int], object]" = OrderedDict()
+        self.dirty = set()
+        self.chunks_rendered = 0  # running total, handy when profiling
+
+        tile_map.add_listener(self.on_tiles_changed)
+
+    @property
+    def world_size(self) -> Tuple[int, int]:
+        return self.tile_map.width * self.tile_size, self.tile_map.height * self.tile_size
+
+    def on_tiles_changed(self, x: int, y: int, width: int, height: int):
+        """TileMap listener: mark every cached chunk overlapping the rectangle dirty."""
+        n = self.chunk_tiles
+        for cy in range(y // n, (y + height - 1) // n + 1):
+            for cx in range(x // n, (x + width - 1) // n + 1):
+                if (cx, cy) in self.chunks:
+                    self.dirty.add((cx, cy))
+
+    def visible_chunks(self, camera: Camera):
+        """Yield (cx, cy) for every chunk that overlaps the camera."""
+        n = self.chunk_pixels
+        max_cx = (self.tile_map.width - 1) // self.chunk_tiles
+        max_cy = (self.tile_map.height - 1) // self.chunk_tiles
+        first_cx, first_cy = max(0, camera.x // n), max(0, camera.y // n)
+        last_cx = min(max_cx, (camera.x + camera.width - 1) // n)
+        last_cy = min(max_cy, (camera.y + camera.height - 1) // n)
+        for cy in range(first_cy, last_cy + 1):
+            for cx in range(first_cx, last_cx + 1):
+                yield cx, cy
+
+    def chunk_surface(self, cx: int, cy: int):
+        """Return the pre-rendered surface for a chunk, (re)rendering it if needed."""
+        key = (cx, cy)
+        surface = self.chunks.get(key)
+        if surface is None:
+            surface = pygame.Surface((self.chunk_pixels, self.chunk_pixels))
+            self._render_chunk(surface, cx, cy)
+            self.chunks[key] = surface
+            if len(self.chunks) > self.max_chunks:
+                evicted, _ = self.chunks.popitem(last=False)
+                self.dirty.discard(evicted)
+        else:
+            self.chunks.move_to_end(key)
+            if key in self.dirty:
+                self._render_chunk(surface, cx, cy)
+        self.dirty.discard(key)
+        return surface
+
+    def _render_chunk(self, surface, cx: int, cy: int):
+        tile_map = self.tile_map
+        size = self.tile_size
+        x0, y0 = cx * self.chunk_tiles, cy * self.chunk_tiles
+        x1 = min(x0 + self.chunk_tiles, tile_map.width)
+        y1 = min(y0 + self.chunk_tiles, tile_map.height)
+
+        surface.fill((0, 0, 0))
+        images = []
+        for y in range(y0, y1):
+            row = y * tile_map.width
+            for x in range(x0, x1):
+                tile = Tile.from_code(tile_map.tiles[row + x])
+                position = ((x - x0) * size, (y - y0) * size)
+                image = self.tile_images.get(tile)
+                if image is not None:
+                    images.append((image, position))
+                else:
+                    surface.fill(TILE_COLOURS[tile], (position[0], position[1], size, size))
+        if images:
+            surface.blits(images, doreturn=False)
+        self.chunks_rendered += 1
+
+    def draw(self, target, camera: Camera):
+        """Blit the chunks overlapping the camera onto `target`."""
+        n = self.chunk_pixels
+        target.blits([(self.chunk_surface(cx, cy), (cx * n - camera.x, cy * n - camera.y))
+                      for cx, cy in self.visible_chunks(camera)], doreturn=False)
@@ -1,35 +1,103 @@
+import argparse
+import os
+import random
 import pygame
 import sys
-from managers.scene_manager import SceneManager
+from core.die import Die
+from graphics.render_target import RenderTarget
+from managers.replay import Recorder, Replay, frame_stats, print_stats, run_frames
+from managers.scene_manager import GameState, SceneManager
 
 # Global constants
+# Scenes always draw at the logical resolution; it is scaled to the window
+LOGICAL_WIDTH = 1024
+LOGICAL_HEIGHT = 768
 WINDOW_WIDTH = 1024
 WINDOW_HEIGHT = 768
+SCALE_MODE = "smooth"  # or "integer" for crisp pixel art
 FPS = 60
 GAME_TITLE = "Thangorodrim"
 
-def main():
-    pygame.init()
+BACKGROUND_COLOUR = (20, 20, 40)
+
+def create_window():
+    # Only start the pygame modules the game uses (pygame.init() would also
+    # start audio and joysticks), and show the window before any scene loads
+    pygame.display.init()
+    pygame.font.init()
     pygame.display.set_caption(GAME_TITLE)
-    
-    screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+
+    screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.RESIZABLE)
+    screen.fill(BACKGROUND_COLOUR)
+    pygame.display.flip()
+    return screen
+
+def create_render_target(window):
+    return RenderTarget((LOGICAL_WIDTH, LOGICAL_HEIGHT), window.get_size(), SCALE_MODE)
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=GAME_TITLE)
+    parser.add_argument("--record", metavar="FILE", help="record this session's input to FILE")
+    parser.add_argument("--replay", metavar="FILE",
+                        help="replay a recorded session headless, as fast as possible, and print frame timings")
+    parser.add_argument("--seed", type=int, help="seed for dice rolls (random by default)")
+    return parser.parse_args(argv)
+
+def replay(path):
+    # No window and no frame cap: replays are for profiling
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    recording = Replay(path)
+    Die.seed(recording.seed)
+
+    window = create_window()
+    render_target = create_render_target(window)
+    # Wait for streamed level chunks, so every replay sees the same level on the same frame
+    scene_manager = SceneManager(render_target.surface,
+                                 scene_options={GameState.PLAYING: {"wait_for_chunks": True}})
+    frame_times = run_frames(recording.frames, scene_manager, present=lambda: render_target.present(window))
+    scene_manager.close()
+    print_stats(frame_stats(frame_times))
+    pygame.quit()
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.replay:
+        replay(args.replay)
+        return
+
+    seed = args.seed if args.seed is not None else random.SystemRandom().getrandbits(32)
+    Die.seed(seed)
+    recorder = Recorder(args.record, seed) if args.record else None
+
+    window = create_window()
+    render_target = create_render_target(window)
     clock = pygame.time.Clock()
-    scene_manager = SceneManager(screen)
+    scene_manager = SceneManager(render_target.surface)
     
     running = True
     while running:
-        events = pygame.event.get()
+        # Scenes only ever see logical coordinates
+        events = [render_target.map_event(event) for event in pygame.event.get()]
         for event in events:
             if event.type == pygame.QUIT:
                 running = False
-            scene_manager.handle_events(events)
+            elif event.type == pygame.VIDEORESIZE:
+                window = pygame.display.get_surface()
+                render_target.resize(window.get_size())
+        if recorder:
+            recorder.record_frame(events)
+        scene_manager.handle_events(events)
         
         running = running and scene_manager.update()
         scene_manager.draw()
         
+        render_target.present(window)
         pygame.display.flip()
         clock.tick(FPS)
 
+    scene_manager.close()
+    if recorder:
+        recorder.save()
     pygame.quit()
     sys.exit()
 
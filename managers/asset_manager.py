@@ -0,0 +1,190 @@
+"""
+Asset loading for Thangorodrim.
+
+Assets (fonts, images, sprite sheets) can be shipped either as loose files
+under assets/ or packed into a single archive, assets.pack, built with:
+
+python -m tools.build_asset_pack
+
+The pack is one file: a fixed header, every asset's bytes back to back,
+and a JSON index (name -> offset, size, format) at the end. AssetPack
+memory-maps it, so opening an asset is a slice of the mapping instead of a
+file open, and nothing is read from disk until pygame touches the bytes:
+
+- images packed as raw RGBA (--raw-images) become surfaces with
+  pygame.image.frombuffer, which uses the mapped pixels directly and skips
+  decoding the JPEG/PNG,
+- other images and fonts are handed to pygame as read-only file-like views
+  of the mapping.
+
+AssetManager uses the pack when it exists and falls back to the loose
+files otherwise, so development doesn't need a rebuild after every change.
+Asset names are paths relative to assets/ with forward slashes, e.g.
+"fonts/aniron.bold.ttf".
+
+Usage:
+assets = get_asset_manager()      # shared by every scene
+font = assets.font("fonts/aniron.bold.ttf", 72)
+background = assets.image("images/title_bg.jpg")
+"""
+
+import io
+import json
+import mmap
+import os
+import struct
+from typing import Dict, Optional, Tuple
+
+import pygame
+
+ASSETS_DIR = "assets"
+ASSET_PACK_FILE = "assets.pack"
+
+PACK_MAGIC = b"TGPK"
+PACK_VERSION = 1
+# magic, version, index offset, index size
+PACK_HEADER = struct.Struct("<4sIQQ")
+
+
+class AssetPackError(Exception):
+    pass
+
+
+class BufferReader(io.RawIOBase):
+    """A read-only, seekable file-like object over a memoryview (no copying)."""
+
+    def __init__(self, view: memoryview):
+        self.view = view
+        self.position = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def readinto(self, buffer):
+        chunk = self.view[self.position:self.position + len(buffer)]
+        size = len(chunk)
+        buffer[:size] = chunk
+        self.position += size
+        return size
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self.position
+        elif whence == io.SEEK_END:
+            offset += len(self.view)
+        self.position = max(0, offset)
+        return self.position
+
+    def tell(self):
+        return self.position
+
+
+class AssetPack:
+    """A memory-mapped asset pack.
+
+    Raises AssetPackError if the file isn't a pack this version can read.
+    """
+
+    def __init__(self, path: str = ASSET_PACK_FILE):
+        self.path = path
+        with open(path, 'rb') as f:
+            # Copy-on-write: reads come straight from the file, and drawing
+            # onto a surface made with frombuffer copies only the pages it
+            # touches (a read-only mapping would crash pygame on the write)
+            self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+        self.view = memoryview(self.map)
+        try:
+            magic, version, index_offset, index_size = PACK_HEADER.unpack_from(self.map, 0)
+        except struct.error:
+            self.close()
+            raise AssetPackError(f"{path} is too short to be an asset pack.")
+        if magic != PACK_MAGIC or version != PACK_VERSION:
+            self.close()
+            raise AssetPackError(f"{path} is not a version {PACK_VERSION} asset pack.")
+        self.index: Dict[str, Dict] = json.loads(bytes(self.view[index_offset:index_offset + index_size]))
+
+    def __contains__(self, name: str):
+        return name in self.index
+
+    def __len__(self):
+        return len(self.index)
+
+    def entry(self, name: str) -> Dict:
+        """Index entry for an asset: offset, size, format (and width/height for raw images)."""
+        return self.index[name]
+
+    def data(self, name: str) -> memoryview:
+        """The asset's bytes as a view into the mapping. Raises KeyError if it isn't packed."""
+        entry = self.index[name]
+        return self.view[entry["offset"]:entry["offset"] + entry["size"]]
+
+    def open(self, name: str) -> BufferReader:
+        return BufferReader(self.data(name))
+
+    def close(self):
+        try:
+            self.view.release()
+            self.map.close()
+        except BufferError:
+            # Surfaces made with frombuffer still use the mapping; it is
+            # unmapped once the last of them is gone.
+            pass
+
+
+class AssetManager:
+    """Loads and caches fonts and images from the asset pack, or from assets/."""
+
+    def __init__(self, assets_dir: str = ASSETS_DIR, pack_path: Optional[str] = ASSET_PACK_FILE):
+        self.assets_dir = assets_dir
+        self.pack = AssetPack(pack_path) if pack_path and os.path.exists(pack_path) else None
+        self.images: Dict[str, object] = {}
+        self.fonts: Dict[Tuple[str, int], object] = {}
+
+    def image(self, name: str):
+        """Return the surface for an image asset, loading it on first use."""
+        if name not in self.images:
+            if self.pack is not None and name in self.pack:
+                entry = self.pack.entry(name)
+                if entry["format"] == "rgba":
+                    surface = pygame.image.frombuffer(self.pack.data(name), (entry["width"], entry["height"]), "RGBA")
+                else:
+                    surface = pygame.image.load(self.pack.open(name), name)
+            else:
+                surface = pygame.image.load(self._loose_path(name))
+            self.images[name] = surface
+        return self.images[name]
+
+    def font(self, name: str, size: int):
+        """Return a pygame Font for a font asset at `size`, loading it on first use."""
+        key = (name, size)
+        if key not in self.fonts:
+            if self.pack is not None and name in self.pack:
+                self.fonts[key] = pygame.font.Font(self.pack.open(name), size)
+            else:
+                self.fonts[key] = pygame.font.Font(self._loose_path(name), size)
+        return self.fonts[key]
+
+    def _loose_path(self, name: str) -> str:
+        return os.path.join(self.assets_dir, *name.split("/"))
+
+    def close(self):
+        """Drop cached assets and unmap the pack."""
+        self.images.clear()
+        self.fonts.clear()
+        if self.pack is not None:
+            self.pack.close()
+            self.pack = None
+
+
+_shared: Optional[AssetManager] = None
+
+
+def get_asset_manager() -> AssetManager:
+    """The AssetManager shared by every scene, created on first use."""
+    global _shared
+    if _shared is None:
+        _shared = AssetManager()
+    return _shared
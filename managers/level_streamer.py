@@ -0,0 +1,205 @@
+"""
+Streaming level generation for Thangorodrim.
+
+Generating a whole large level when a game starts would mean a long load
+screen. LevelStreamer instead generates level chunks (see core.levelgen)
+in a pool of worker processes, a few chunks ahead of the player:
+
+- update(x, y) is called every frame with the player's tile position. It
+  collects finished chunks, writes their tiles into the TileMap, and
+  queues every missing chunk within `prefetch_radius` chunks of the
+  player, nearest first.
+- Workers pack their chunk into one of a fixed set of shared memory
+  blocks, so only the block's name and two counts go through the process
+  pool's pipe, not the chunk itself.
+- Finished chunks are loaded in the order they were queued, whatever
+  order the workers finish them in. With wait_for_chunks=True, update()
+  also blocks until every chunk it queued is loaded, so the level is in
+  the same state on the same frame every run (e.g. when replaying a
+  recorded session).
+- At most `max_resident` chunks are kept. Past that, the least recently
+  wanted chunk is unloaded: its tiles go back to rock and
+  on_chunk_unloaded lets the game drop its monsters and loot. It is
+  generated again, identically, if the player comes back.
+
+on_chunk_loaded(chunk) gets each GeneratedChunk as it arrives, with its
+monster spawns and loot.
+
+Usage:
+streamer = LevelStreamer(tile_map, seed, monster_names, loot_tables, on_chunk_loaded=spawn)
+streamer.load_now(*streamer.chunk_at(start_x, start_y))   # the player's own chunk, right away
+streamer.update(player_x, player_y)                      # every frame
+streamer.close()
+"""
+
+import weakref
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from core.levelgen import CHUNK_SIZE, GeneratedChunk, chunk_buffer_size, generate_chunk, pack_chunk, unpack_chunk
+from core.tilemap import Tile
+
+ChunkKey = Tuple[int, int]
+
+
+def generate_into_shared_memory(block_name: str, seed: int, cx: int, cy: int, monster_names: Sequence[str],
+                                loot_tables: Sequence[str], size: int, bounds: Tuple[int, int]) -> Tuple[int, int]:
+    """Worker entry point: generate a chunk and pack it into the named shared memory block."""
+    # Pool workers share the parent's resource tracker, so attaching here
+    # doesn't make the block's lifetime depend on the worker
+    block = shared_memory.SharedMemory(name=block_name)
+    try:
+        chunk = generate_chunk(seed, cx, cy, monster_names, loot_tables, size, bounds)
+        return pack_chunk(chunk, block.buf, monster_names, loot_tables)
+    finally:
+        block.close()
+
+
+def _release_blocks(blocks: List[shared_memory.SharedMemory]):
+    for block in blocks:
+        block.close()
+        block.unlink()
+    blocks.clear()
+
+
+class LevelStreamer:
+    """Generates a level's chunks around the player in background processes.
+
+    Attributes:
+        tile_map: The level's TileMap; its size must be a whole number of chunks.
+        seed: Level seed passed to core.levelgen.generate_chunk.
+        prefetch_radius: Chunks in every direction around the player to have ready.
+        max_resident: Chunks kept before the least recently wanted is unloaded.
+        wait_for_chunks: If True, update() blocks until the chunks it queues are loaded.
+        loaded: Loaded chunks, least recently wanted first.
+    """
+
+    def __init__(self, tile_map, seed: int, monster_names: Sequence[str] = (), loot_tables: Sequence[str] = (),
+                 chunk_size: int = CHUNK_SIZE, prefetch_radius: int = 2, max_resident: int = 81,
+                 workers: Optional[int] = None, max_in_flight: int = 8, wait_for_chunks: bool = False,
+                 on_chunk_loaded: Callable[[GeneratedChunk], None] = None,
+                 on_chunk_unloaded: Callable[[GeneratedChunk], None] = None):
+        if tile_map.width % chunk_size or tile_map.height % chunk_size:
+            raise ValueError(f"The map must be a whole number of {chunk_size}-tile chunks.")
+        if max_resident < (2 * prefetch_radius + 1) ** 2:
+            raise ValueError("max_resident must be able to hold every prefetched chunk.")
+        self.tile_map = tile_map
+        self.seed = seed
+        self.monster_names = tuple(monster_names)
+        self.loot_tables = tuple(loot_tables)
+        self.chunk_size = chunk_size
+        self.bounds = (tile_map.width // chunk_size, tile_map.height // chunk_size)
+        self.prefetch_radius = prefetch_radius
+        self.max_resident = max_resident
+        self.wait_for_chunks = wait_for_chunks
+        self.on_chunk_loaded = on_chunk_loaded
+        self.on_chunk_unloaded = on_chunk_unloaded
+
+        self.loaded: "OrderedDict[ChunkKey, GeneratedChunk]" = OrderedDict()
+        self.pending: Dict[ChunkKey, Tuple[Future, shared_memory.SharedMemory]] = {}
+
+        # workers=0 generates in this process, a few chunks per update
+        self.in_process = workers == 0
+        self.max_in_flight = max_in_flight
+        self.executor = None if self.in_process else ProcessPoolExecutor(max_workers=workers)
+        self._blocks: List[shared_memory.SharedMemory] = []
+        if self.executor is not None:
+            self._blocks = [shared_memory.SharedMemory(create=True, size=chunk_buffer_size(chunk_size))
+                            for _ in range(max_in_flight)]
+        self.free_blocks = list(self._blocks)
+        self._finalizer = weakref.finalize(self, _release_blocks, self._blocks)
+
+    def chunk_at(self, x: int, y: int) -> ChunkKey:
+        """The chunk containing tile (x, y)."""
+        return x // self.chunk_size, y // self.chunk_size
+
+    def wanted_chunks(self, x: int, y: int) -> List[ChunkKey]:
+        """Chunks within prefetch_radius of tile (x, y), nearest first."""
+        pcx, pcy = self.chunk_at(x, y)
+        r = self.prefetch_radius
+        chunks = [(cx, cy)
+                  for cy in range(max(0, pcy - r), min(self.bounds[1], pcy + r + 1))
+                  for cx in range(max(0, pcx - r), min(self.bounds[0], pcx + r + 1))]
+        chunks.sort(key=lambda c: max(abs(c[0] - pcx), abs(c[1] - pcy)))
+        return chunks
+
+    # --- STREAMING ---
+
+    def load_now(self, cx: int, cy: int) -> GeneratedChunk:
+        """Generate a chunk in this process and load it straight away (e.g. where the player starts)."""
+        if (cx, cy) not in self.loaded:
+            self._load(generate_chunk(self.seed, cx, cy, self.monster_names, self.loot_tables,
+                                      self.chunk_size, self.bounds))
+        return self.loaded[(cx, cy)]
+
+    def update(self, x: int, y: int):
+        """Load finished chunks and queue the ones still missing around tile (x, y)."""
+        self._collect()
+        wanted = self.wanted_chunks(x, y)
+        queued = 0
+        for key in wanted:
+            if key not in self.loaded and key not in self.pending:
+                if self.in_process:
+                    if queued < self.max_in_flight:
+                        self.load_now(*key)
+                        queued += 1
+                elif self.free_blocks:
+                    self._submit(key)
+        if self.wait_for_chunks:
+            self.wait()
+        # Mark the wanted chunks most recently used (nearest last) before trimming
+        for key in reversed(wanted):
+            if key in self.loaded:
+                self.loaded.move_to_end(key)
+        while len(self.loaded) > self.max_resident:
+            _, chunk = self.loaded.popitem(last=False)
+            self._unload(chunk)
+
+    def wait(self):
+        """Block until every queued chunk has been generated, then load them."""
+        for future, _ in list(self.pending.values()):
+            future.result()
+        self._collect()
+
+    def close(self):
+        """Stop the workers and free the shared memory."""
+        if self.executor is not None:
+            self.executor.shutdown(wait=True, cancel_futures=True)
+            self.executor = None
+        self.pending.clear()
+        self.free_blocks.clear()
+        self._finalizer()
+
+    # --- INTERNALS ---
+
+    def _submit(self, key: ChunkKey):
+        block = self.free_blocks.pop()
+        future = self.executor.submit(generate_into_shared_memory, block.name, self.seed, key[0], key[1],
+                                      self.monster_names, self.loot_tables, self.chunk_size, self.bounds)
+        self.pending[key] = (future, block)
+
+    def _collect(self):
+        # Oldest first, stopping at the first unfinished chunk, so chunks
+        # (and their monsters) arrive in the same order every run
+        for key, (future, _) in list(self.pending.items()):
+            if not future.done():
+                break
+            future, block = self.pending.pop(key)
+            counts = future.result()
+            chunk = unpack_chunk(block.buf, key[0], key[1], counts, self.monster_names,
+                                 self.loot_tables, self.chunk_size)
+            self.free_blocks.append(block)
+            self._load(chunk)
+
+    def _load(self, chunk: GeneratedChunk):
+        self.tile_map.write_region(chunk.x, chunk.y, chunk.size, chunk.size, chunk.tiles)
+        self.loaded[(chunk.cx, chunk.cy)] = chunk
+        if self.on_chunk_loaded:
+            self.on_chunk_loaded(chunk)
+
+    def _unload(self, chunk: GeneratedChunk):
+        self.tile_map.fill_rect(chunk.x, chunk.y, chunk.size, chunk.size, Tile.WALL)
+        if self.on_chunk_unloaded:
+            self.on_chunk_unloaded(chunk)
@@ -0,0 +1,134 @@
+"""
+Input recording and replay for Thangorodrim.
+
+A recording is everything needed to play a session again exactly: the
+seed given to Die.seed at startup and, for every frame, the list of
+events the scenes received. It is saved as gzipped JSON:
+
+{
+  "version": 1,
+  "seed": 1234,
+  "frames": [[], [[1024, {"pos": [512, 300], "rel": [3, 0], "buttons": [0, 0, 0]}]], ...]
+}
+
+Events are recorded after their mouse positions have been mapped to
+logical pixels (see graphics.render_target), so a recording replays the
+same way whatever the window size. Frames without events cost two bytes
+before compression.
+
+Replaying feeds the frames back through SceneManager.handle_events,
+update and draw as fast as possible, timing every frame, so a real play
+session can be profiled and its frame times compared between builds.
+
+Usage:
+python main.py --record session.replay.gz
+python main.py --replay session.replay.gz
+"""
+
+import gzip
+import json
+import statistics
+import time
+from typing import Callable, Dict, List, Optional, Sequence
+
+import pygame
+
+REPLAY_VERSION = 1
+
+
+def event_to_json(event) -> List:
+    """[type, attributes] for an event, keeping only attributes JSON can hold."""
+    attributes = {name: list(value) if isinstance(value, tuple) else value
+                  for name, value in event.dict.items()
+                  if _is_plain(value)}
+    return [event.type, attributes]
+
+
+def event_from_json(data: List):
+    event_type, attributes = data
+    return pygame.event.Event(event_type, {name: tuple(value) if isinstance(value, list) else value
+                                           for name, value in attributes.items()})
+
+
+def _is_plain(value) -> bool:
+    if isinstance(value, (list, tuple)):
+        return all(isinstance(item, (int, float, str, bool)) for item in value)
+    return value is None or isinstance(value, (int, float, str, bool))
+
+
+class Recorder:
+    """Collects the events of every frame and writes them out with save()."""
+
+    def __init__(self, path: str, seed: int):
+        self.path = path
+        self.seed = seed
+        self.frames: List[List] = []
+
+    def record_frame(self, events: Sequence):
+        self.frames.append([event_to_json(event) for event in events])
+
+    def save(self):
+        data = {"version": REPLAY_VERSION, "seed": self.seed, "frames": self.frames}
+        with gzip.open(self.path, 'wt', encoding='utf-8') as f:
+            json.dump(data, f, separators=(",", ":"))
+
+
+class Replay:
+    """A loaded recording: its seed and the events of every frame.
+
+    Raises ValueError if the file was written by a different replay version.
+    """
+
+    def __init__(self, path: str):
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get("version") != REPLAY_VERSION:
+            raise ValueError(f"{path} is not a version {REPLAY_VERSION} replay.")
+        self.seed = data["seed"]
+        self.frames = [[event_from_json(event) for event in frame] for frame in data["frames"]]
+
+    def __len__(self):
+        return len(self.frames)
+
+
+def run_frames(frames: Sequence[Sequence], scene_manager, present: Optional[Callable] = None) -> List[float]:
+    """Play recorded frames through a SceneManager as fast as possible.
+
+    Stops early on a QUIT event or when the scenes ask to exit, as the game
+    would. `present` is called after each draw (e.g. to scale and flip).
+    Returns how long each frame took, in seconds.
+    """
+    frame_times = []
+    clock = time.perf_counter
+    for events in frames:
+        start = clock()
+        scene_manager.handle_events(events)
+        running = scene_manager.update()
+        scene_manager.draw()
+        if present is not None:
+            present()
+        frame_times.append(clock() - start)
+        if not running or any(event.type == pygame.QUIT for event in events):
+            break
+    return frame_times
+
+
+def frame_stats(frame_times: Sequence[float]) -> Dict[str, float]:
+    """Summary of frame times in milliseconds (plus frames and average FPS)."""
+    ms = sorted(t * 1000 for t in frame_times)
+    if not ms:
+        return {"frames": 0}
+    percentiles = statistics.quantiles(ms, n=100, method="inclusive") if len(ms) > 1 else ms * 99
+    total = sum(ms)
+    return {"frames": len(ms), "total_ms": total, "mean_ms": total / len(ms),
+            "median_ms": statistics.median(ms), "p95_ms": percentiles[94], "p99_ms": percentiles[98],
+            "max_ms": ms[-1], "fps": len(ms) * 1000 / total if total else float("inf")}
+
+
+def print_stats(stats: Dict[str, float]):
+    if not stats["frames"]:
+        print("Replay had no frames.")
+        return
+    print(f"{stats['frames']} frames in {stats['total_ms']:.1f} ms ({stats['fps']:.1f} FPS)")
+    print(f"mean {stats['mean_ms']:.2f} ms, median {stats['median_ms']:.2f} ms, "
+          f"p95 {stats['p95_ms']:.2f} ms, p99 {stats['p99_ms']:.2f} ms, max {stats['max_ms']:.2f} ms")
@@ -1,4 +1,4 @@
-from scenes.title_screen import TitleScreen
+import importlib
 from enum import Enum
 
 class GameState(Enum):
@@ -7,39 +7,88 @@ class GameState(Enum):
     OPTIONS = "options"
     LOADING = "loading"
 
+# Where each state's scene lives: (module, class). Scene modules are only
+# imported when their scene is first needed, which keeps startup fast.
+SCENE_CLASSES = {
+    GameState.TITLE: ("scenes.title_screen", "TitleScreen"),
+    GameState.PLAYING: ("scenes.playing_screen", "PlayingScreen"),
+    # Add other scenes as they're created
+}
+
+class SceneRegistry(dict):
+    """Scenes by GameState; each is imported and built the first time it's looked up.
+
+    scene_options maps a GameState to extra keyword arguments for its scene.
+    """
+
+    def __init__(self, screen, scene_classes=SCENE_CLASSES, scene_options=None):
+        super().__init__()
+        self.screen = screen
+        self.scene_classes = scene_classes
+        self.scene_options = scene_options or {}
+
+    def __missing__(self, state):
+        module_name, class_name = self.scene_classes[state]
+        scene_class = getattr(importlib.import_module(module_name), class_name)
+        scene = self[state] = scene_class(self.screen, **self.scene_options.get(state, {}))
+        return scene
+
+    def get(self, state, default=None):
+        if state in self or state in self.scene_classes:
+            return self[state]
+        return default
+
 class SceneManager:
-    def __init__(self, screen):
+    def __init__(self, screen, scene_options=None):
         self.screen = screen
         self.current_state = GameState.TITLE
-        self.scenes = {
-            GameState.TITLE: TitleScreen(screen)
-            # Add other scenes as they're created
-        }
+        self.scenes = SceneRegistry(screen, scene_options=scene_options)
 
     def handle_events(self, events):
-        for event in events:
-            if self.current_state == GameState.TITLE:
-                self.scenes[self.current_state].handle_event(event)
+        scene = self.scenes.get(self.current_state)
+        if scene:
+            for event in events:
+                scene.handle_event(event)
 
     def update(self):
-        if self.current_state == GameState.TITLE:
-            action = self.scenes[self.current_state].update()
+        scene = self.scenes.get(self.current_state)
+        if scene:
+            action = scene.update()
             return self.handle_action(action)
         return True
 
     def handle_action(self, action):
         if not action:
             return True
-            
+
+        previous_state = self.current_state
         if action == "new_game":
             self.current_state = GameState.PLAYING
         elif action == "load_game":
             self.current_state = GameState.LOADING
         elif action == "options":
             self.current_state = GameState.OPTIONS
+        elif action == "title":
+            self.current_state = GameState.TITLE
         elif action == "exit":
             return False
+        if self.current_state != previous_state:
+            self.leave(previous_state)
         return True
 
+    def leave(self, state):
+        """Tear down the scene for a state that was left, if it holds resources (has close())."""
+        scene = dict.get(self.scenes, state)  # without building a scene that was never used
+        if hasattr(scene, "close"):
+            scene.close()
+            del self.scenes[state]
+
+    def close(self):
+        """Tear down every scene, e.g. when the game exits."""
+        for state in list(self.scenes):
+            self.leave(state)
+
     def draw(self):
-        self.scenes[self.current_state].draw()
\ No newline at end of file
+        scene = self.scenes.get(self.current_state)
+        if scene:
+            scene.draw()
@@ -0,0 +1,117 @@
+import random
+
+import numpy as np
+import pygame
+
+from core.levelgen import CHUNK_SIZE
+from core.monsters import MonsterPopulation, load_monster_templates
+from core.tilemap import TileMap
+from graphics.tilemap_renderer import TILE_SIZE, Camera, ChunkedTileRenderer
+from managers.level_streamer import LevelStreamer
+
+# Size of a level, in tiles. Only the chunks around the camera are generated.
+LEVEL_WIDTH = 512
+LEVEL_HEIGHT = 512
+LEVEL_WORKERS = 2  # leave the other cores to the game loop
+LEVEL_LOOT_TABLES = ("chest_common",)
+CAMERA_SPEED = 16  # pixels per frame while an arrow key is held
+
+CAMERA_KEYS = {
+    pygame.K_LEFT: (-1, 0),
+    pygame.K_RIGHT: (1, 0),
+    pygame.K_UP: (0, -1),
+    pygame.K_DOWN: (0, 1),
+}
+
+
+class PlayingScreen:
+    def __init__(self, screen, tile_map=None, seed=None, wait_for_chunks=False):
+        self.screen = screen
+        self.camera = None  # sized from the screen on first draw
+        self.held_keys = set()
+        self.current_action = None
+        self.loot = {}  # (x, y) -> loot table id of a chest
+        # Chunks whose monsters have been spawned. A chunk that is unloaded
+        # and generated again doesn't spawn them twice, as some may have
+        # wandered into a neighbouring chunk that is still loaded.
+        self.spawned_chunks = set()
+
+        if tile_map is not None:
+            # A fixed map, with nothing streamed in
+            self.tile_map = tile_map
+            self.streamer = None
+            self.monsters = None
+            self.start = (tile_map.width // 2, tile_map.height // 2)
+        else:
+            # Drawn from the dice RNG, so a replay gets the same level
+            seed = random.getrandbits(32) if seed is None else seed
+            templates = load_monster_templates()
+            self.tile_map = TileMap(LEVEL_WIDTH, LEVEL_HEIGHT)
+            self.monsters = MonsterPopulation(templates, seed=seed)
+            self.streamer = LevelStreamer(self.tile_map, seed,
+                                          monster_names=[t.name for t in templates],
+                                          loot_tables=LEVEL_LOOT_TABLES,
+                                          workers=LEVEL_WORKERS,
+                                          wait_for_chunks=wait_for_chunks,
+                                          on_chunk_loaded=self.on_chunk_loaded,
+                                          on_chunk_unloaded=self.on_chunk_unloaded)
+            # Only the starting chunk is generated before the first frame
+            start_chunk = (LEVEL_WIDTH // CHUNK_SIZE // 2, LEVEL_HEIGHT // CHUNK_SIZE // 2)
+            chunk = self.streamer.load_now(*start_chunk)
+            self.start = (chunk.x + chunk.size // 2, chunk.y + chunk.size // 2)
+        self.renderer = ChunkedTileRenderer(self.tile_map)
+
+    def on_chunk_loaded(self, chunk):
+        # Rolled from the chunk's own seed, so a chunk's monsters are the
+        # same whenever it arrives
+        if (chunk.cx, chunk.cy) not in self.spawned_chunks:
+            self.spawned_chunks.add((chunk.cx, chunk.cy))
+            rng = np.random.default_rng([self.streamer.seed, chunk.cx, chunk.cy])
+            for x, y, name in chunk.spawns:
+                self.monsters.spawn(name, x, y, rng)
+        for x, y, table_id in chunk.loot:
+            self.loot[(x, y)] = table_id
+
+    def on_chunk_unloaded(self, chunk):
+        slots = self.monsters.alive_slots()
+        x, y = self.monsters.x[slots], self.monsters.y[slots]
+        inside = (x >= chunk.x) & (x < chunk.x + chunk.size) & (y >= chunk.y) & (y < chunk.y + chunk.size)
+        for slot in slots[inside]:
+            self.monsters.kill(slot)
+        for position in [p for p in self.loot if chunk.contains(*p)]:
+            del self.loot[position]
+
+    def close(self):
+        """Stop the level's worker processes and free their shared memory."""
+        if self.streamer is not None:
+            self.streamer.close()
+            self.streamer = None
+
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_ESCAPE:
+                self.current_action = "title"
+            if event.key in CAMERA_KEYS:
+                self.held_keys.add(event.key)
+        elif event.type == pygame.KEYUP:
+            self.held_keys.discard(event.key)
+
+    def update(self):
+        if self.camera and self.held_keys:
+            dx = sum(CAMERA_KEYS[k][0] for k in self.held_keys) * CAMERA_SPEED
+            dy = sum(CAMERA_KEYS[k][1] for k in self.held_keys) * CAMERA_SPEED
+            self.camera.move(dx, dy, *self.renderer.world_size)
+        if self.camera and self.streamer:
+            self.streamer.update((self.camera.x + self.camera.width // 2) // TILE_SIZE,
+                                 (self.camera.y + self.camera.height // 2) // TILE_SIZE)
+
+        action = self.current_action
+        self.current_action = None
+        return action
+
+    def draw(self):
+        if self.camera is None:
+            self.camera = Camera(self.screen.get_width(), self.screen.get_height())
+            self.camera.center_on(self.start[0] * TILE_SIZE, self.start[1] * TILE_SIZE, *self.renderer.world_size)
+        self.screen.fill((0, 0, 0))
+        self.renderer.draw(self.screen, self.camera)
@@ -1,18 +1,19 @@
 import pygame
-import os
 import sys
+from managers.asset_manager import get_asset_manager
 
 class TitleScreen:
-    def __init__(self, screen):
+    def __init__(self, screen, assets=None):
         self.screen = screen
+        self.assets = assets or get_asset_manager()
         self.screen_width = screen.get_width()
         self.screen_height = screen.get_height()
         
-        # Load fonts
-        font_path = os.path.join("assets", "fonts", "aniron.bold.ttf")
+        # Load fonts (from the asset pack if there is one)
+        font_name = "fonts/aniron.bold.ttf"
         try:
-            self.title_font = pygame.font.Font(font_path, 72)
-            self.button_font = pygame.font.Font(font_path, 36)
+            self.title_font = self.assets.font(font_name, 72)
+            self.button_font = self.assets.font(font_name, 36)
         except:
             print("Error loading Aniron font. Falling back to default.")
             self.title_font = pygame.font.Font(None, 72)
@@ -27,19 +28,25 @@ class TitleScreen:
             {"text": "Exit", "rect": None, "action": self.exit_game}
         ]
 
-        # Load background image (placeholder until you add the actual image)
+        # The background is loaded after the first frame is on screen (see update)
         self.background = None
+        self.background_loaded = False
+        self.frames_drawn = 0
+
+        self.current_action = None  # Add this line to track the current action
+        self.mouse_pos = (-1, -1)  # in screen (logical) coordinates, from MOUSEMOTION events
+
+    def load_background(self):
+        self.background_loaded = True
         try:
-            bg_path = os.path.join("assets", "images", "title_bg.jpg")
-            self.background = pygame.image.load(bg_path)
+            self.background = self.assets.image("images/title_bg.jpg")
             self.background = pygame.transform.scale(self.background, (self.screen_width, self.screen_height))
         except FileNotFoundError:
             print("Background image not found. Using solid color.")
             raise
 
-        self.current_action = None  # Add this line to track the current action
-
     def draw(self):
+        self.frames_drawn += 1
         # Draw background
         if self.background:
             self.screen.blit(self.background, (0, 0))
@@ -59,8 +66,7 @@ class TitleScreen:
             button["rect"] = text_rect  # Store the rect for click detection
             
             # Draw button highlight if mouse is over it
-            mouse_pos = pygame.mouse.get_pos()
-            if text_rect.collidepoint(mouse_pos):
+            if text_rect.collidepoint(self.mouse_pos):
                 pygame.draw.rect(self.screen, (100, 100, 100), text_rect.inflate(20, 10), border_radius=5)
                 text_surface = self.button_font.render(button["text"], True, (255, 255, 255))
             
@@ -68,6 +74,8 @@ class TitleScreen:
             button_y += 70
 
     def handle_event(self, event):
+        if event.type == pygame.MOUSEMOTION:
+            self.mouse_pos = event.pos
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:  # Left click
             for button in self.buttons:
                 if button["rect"] and button["rect"].collidepoint(event.pos):
@@ -90,6 +98,9 @@ class TitleScreen:
         sys.exit()
 
     def update(self):
+        if self.frames_drawn and not self.background_loaded:
+            self.load_background()
+
         # Return and reset the current action
         action = self.current_action
         self.current_action = None
@@ -0,0 +1,48 @@
+"""
+Shared fixtures for the benchmark suite.
+
+The fixtures here build the inputs for the hot paths once per test so the
+timed region only covers the call being measured.
+"""
+
+import json
+import os
+
+import pytest
+
+from core.item import item_from_template
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), '..', '..', 'data')
+TESTDATA_DIR = os.path.join(os.path.dirname(__file__), '..', 'testdata')
+
+ARAGORN_DATA_FILE = os.path.join(TESTDATA_DIR, 'aragorn.json')
+ITEMS_DATA_FILE = os.path.join(DATA_DIR, 'items.json')
+
+
+@pytest.fixture
+def aragorn_file():
+    """Path to the sample saved player used by Player.from_file benchmarks."""
+    return ARAGORN_DATA_FILE
+
+
+@pytest.fixture
+def aragorn_data():
+    """A fresh copy of the sample saved player as a dictionary."""
+    with open(ARAGORN_DATA_FILE, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+@pytest.fixture(scope="session")
+def item_templates():
+    """All item templates shipped in data/items.json."""
+    with open(ITEMS_DATA_FILE, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+@pytest.fixture
+def make_inventory(item_templates):
+    """Factory returning a list of `size` items cycled from the item templates."""
+    def _make(size):
+        count = len(item_templates)
+        return [item_from_template(item_templates[i % count]) for i in range(size)]
+    return _make
@@ -0,0 +1,24 @@
+"""
+Benchmarks for core.archetypes.Archetype.
+
+Archetype.bonuses merges the race and class bonus tables on every access,
+so it is timed across every Race/CharacterClass combination.
+"""
+from itertools import product
+
+from core.archetypes import Archetype
+from core.classes import CharacterClass
+from core.races import Race
+
+
+def test_bench_archetype_bonuses(benchmark):
+    """Time reading bonuses for every race/class pairing."""
+    benchmark.group = "archetype"
+    archetypes = [Archetype(race, char_class) for race, char_class in product(Race, CharacterClass)]
+
+    def read_bonuses():
+        return [a.bonuses for a in archetypes]
+
+    bonuses = benchmark(read_bonuses)
+
+    assert len(bonuses) == len(Race) * len(CharacterClass)
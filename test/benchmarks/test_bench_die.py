@@ -0,0 +1,19 @@
+"""
+Benchmarks for core.die.Die.roll.
+
+Covers the expressions the game actually rolls (ability scores, hit/magic
+dice, weapon damage) plus a large pool to expose per-die overhead.
+"""
+import pytest
+
+from core.die import Die
+
+
+@pytest.mark.parametrize("expression", ["1d6", "4d5", "2d8", "100d6"])
+def test_bench_die_roll(benchmark, expression):
+    """Time a single Die.roll for common expressions."""
+    benchmark.group = "die_roll"
+    total, rolls = benchmark(Die.roll, expression)
+
+    assert len(rolls) == int(expression.split('d')[0])
+    assert total == sum(rolls)
@@ -0,0 +1,32 @@
+"""
+Benchmarks for core.effects.EffectStore.
+
+Timed effects on every actor are ticked once per turn, so a tick is timed
+with 100 to 10,000 active effects.
+"""
+from types import SimpleNamespace
+
+import pytest
+
+from core.effects import EffectStore, apply_effect
+
+EFFECT_COUNTS = [100, 1_000, 10_000]
+
+POISON = {"damage_over_time": {"damage": "1d4", "duration": 1_000_000}}
+BLESSING = {"buff": {"stat": "strength", "amount": 2, "duration": 1_000_000}}
+
+
+@pytest.mark.parametrize("count", EFFECT_COUNTS)
+def test_bench_effect_tick(benchmark, count):
+    """Time one tick of `count` active effects, half poison and half buffs."""
+    benchmark.group = "effect_tick_scaling"
+    benchmark.extra_info["effects"] = count
+
+    store = EffectStore()
+    for i in range(count):
+        actor = SimpleNamespace(current_hit_points=10 ** 9, max_hit_points=10 ** 9, strength=10)
+        apply_effect(actor, POISON if i % 2 else BLESSING, store)
+
+    benchmark(store.tick)
+
+    assert len(store) == count
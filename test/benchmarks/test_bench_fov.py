@@ -0,0 +1,50 @@
+"""
+Benchmarks for core.fov.FieldOfView.
+
+Times an uncached shadowcast at a few radii and the batched "which of
+these monsters can see the player" query for growing monster counts.
+"""
+import random
+
+import pytest
+
+from core.fov import FieldOfView
+from core.tilemap import Tile, TileMap
+
+
+@pytest.fixture(scope="module")
+def cave_map():
+    rng = random.Random(0)
+    tile_map = TileMap(256, 256, fill=Tile.FLOOR)
+    for _ in range(6000):
+        tile_map.set(rng.randrange(256), rng.randrange(256), Tile.WALL)
+    return tile_map
+
+
+@pytest.mark.parametrize("radius", [8, 16, 32])
+def test_bench_shadowcast(benchmark, cave_map, radius):
+    """Time computing a view from scratch."""
+    benchmark.group = "fov_compute"
+    fov = FieldOfView(cave_map)
+
+    def compute():
+        fov.clear()
+        return fov.compute((128, 128), radius)
+
+    view = benchmark(compute)
+
+    assert view.is_visible(128, 128)
+
+
+@pytest.mark.parametrize("monsters", [10, 100, 1_000])
+def test_bench_seen_by(benchmark, cave_map, monsters):
+    """Time asking whether any of N monsters can see the player (view cached)."""
+    benchmark.group = "fov_seen_by"
+    benchmark.extra_info["monsters"] = monsters
+    fov = FieldOfView(cave_map)
+    rng = random.Random(1)
+    positions = [(rng.randrange(108, 148), rng.randrange(108, 148)) for _ in range(monsters)]
+
+    seen = benchmark(fov.seen_by, (128, 128), positions, 12)
+
+    assert len(seen) == monsters
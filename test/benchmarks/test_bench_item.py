@@ -0,0 +1,38 @@
+"""
+Benchmarks for core.item.item_from_template.
+
+Times building items from every shipped template as well as a synthetic
+template that exercises all of the component factories at once.
+"""
+from core.item import item_from_template
+
+FULL_TEMPLATE = {
+    "id": "potion_healing_small",
+    "name": "Small Healing Potion",
+    "description": "Restores a small amount of HP.",
+    "weight": 0.5,
+    "consumable": {"effect": {"heal": 20}, "charges": 3},
+    "stackable": {"quantity": 3, "max_stack": 20},
+    "equippable": {"slot": "hand", "attack_bonus": 1, "defense_bonus": 0},
+    "weapon": {"damage_die": "1d6", "range": 1},
+}
+
+
+def test_bench_item_from_template_all_components(benchmark):
+    """Time building an item that carries every component type."""
+    benchmark.group = "item_from_template"
+    item = benchmark(item_from_template, FULL_TEMPLATE)
+
+    assert len(item.components) == 4
+
+
+def test_bench_item_from_template_registry(benchmark, item_templates):
+    """Time instantiating one item from each template in data/items.json."""
+    benchmark.group = "item_from_template"
+
+    def build_all():
+        return [item_from_template(t) for t in item_templates]
+
+    items = benchmark(build_all)
+
+    assert len(items) == len(item_templates)
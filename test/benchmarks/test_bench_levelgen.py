@@ -0,0 +1,27 @@
+"""
+Benchmarks for core.levelgen.
+
+The chunk under the player is generated on the main thread when a level
+starts, so generating (and packing) one chunk is timed.
+"""
+from core.levelgen import chunk_buffer_size, generate_chunk, pack_chunk
+
+MONSTERS = ["Orc", "Goblin", "Cave Troll"]
+LOOT = ["chest_common"]
+
+
+def test_bench_generate_chunk(benchmark):
+    """Time generating one chunk with spawns and loot."""
+    chunk = benchmark(generate_chunk, 42, 8, 8, MONSTERS, LOOT)
+
+    assert len(chunk.tiles) == chunk.size * chunk.size
+
+
+def test_bench_pack_chunk(benchmark):
+    """Time packing a chunk into a shared-memory-sized buffer."""
+    chunk = generate_chunk(42, 8, 8, MONSTERS, LOOT)
+    buffer = bytearray(chunk_buffer_size())
+
+    counts = benchmark(pack_chunk, chunk, buffer, MONSTERS, LOOT)
+
+    assert counts == (len(chunk.spawns), len(chunk.loot))
@@ -0,0 +1,41 @@
+"""
+Benchmarks for core.loot.
+
+Drawing from a loot table should cost the same whatever the table's size,
+so sampling is timed for tables of 10 to 10,000 entries, alongside a bulk
+roll of the shipped boss table.
+"""
+import random
+
+import pytest
+
+from core.die import Die
+from core.item import load_item_templates
+from core.loot import AliasSampler, load_loot_tables, roll_loot
+
+TABLE_SIZES = [10, 1_000, 10_000]
+DRAWS = 10_000
+
+
+@pytest.mark.parametrize("size", TABLE_SIZES)
+def test_bench_alias_sampling(benchmark, size):
+    """Time 10,000 draws from a table of `size` weighted entries."""
+    benchmark.group = "loot_sampling_scaling"
+    benchmark.extra_info["entries"] = size
+
+    rng = random.Random(0)
+    sampler = AliasSampler([rng.randint(1, 100) for _ in range(size)])
+
+    picks = benchmark(sampler.sample_many, DRAWS, rng)
+
+    assert len(picks) == DRAWS
+
+
+def test_bench_roll_boss_loot(benchmark):
+    """Time rolling 1,000 boss drops in one batched call."""
+    table = load_loot_tables(item_templates=load_item_templates())["boss_orc_captain"]
+    Die.seed(0)
+
+    items = benchmark(roll_loot, table, 1_000)
+
+    assert items
@@ -0,0 +1,35 @@
+"""
+Benchmarks for core.monsters.MonsterPopulation.
+
+A tick should stay cheap as the number of monsters on a level grows, so
+it is timed for populations of 100 to 10,000 monsters that all want to move.
+"""
+import numpy as np
+import pytest
+
+from core.monsters import MonsterPopulation, load_monster_templates, walkable_grid
+from core.tilemap import Tile, TileMap
+
+POPULATION_SIZES = [100, 1_000, 10_000]
+
+
+@pytest.mark.parametrize("size", POPULATION_SIZES)
+def test_bench_monster_tick(benchmark, size):
+    """Time one tick with every monster regenerating and moving."""
+    benchmark.group = "monster_tick_scaling"
+    benchmark.extra_info["population"] = size
+
+    tile_map = TileMap(256, 256, fill=Tile.FLOOR)
+    walkable = walkable_grid(tile_map)
+    population = MonsterPopulation(load_monster_templates(), capacity=size, seed=0)
+    rng = np.random.default_rng(0)
+    slots = population.spawn_many("Orc", rng.integers(0, 256, size), rng.integers(0, 256, size))
+    steps = rng.integers(-1, 2, size=(size, 2))
+
+    def tick():
+        population.set_intents(slots, steps[:, 0], steps[:, 1])
+        population.tick(walkable)
+
+    benchmark(tick)
+
+    assert len(population) == size
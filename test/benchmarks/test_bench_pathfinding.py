@@ -0,0 +1,59 @@
+"""
+Benchmarks for core.pathfinding.Pathfinder.
+
+Uses a 256x256 map of walled rooms joined by doorways. The cache is
+cleared inside the timed call so each round measures a real search.
+"""
+import random
+
+import pytest
+
+from core.pathfinding import Pathfinder
+from core.tilemap import Tile, TileMap
+
+
+@pytest.fixture(scope="module")
+def rooms_map():
+    tile_map = TileMap(256, 256, fill=Tile.FLOOR)
+    for k in range(20, 256, 24):
+        tile_map.fill_rect(0, k, 256, 1, Tile.WALL)
+        tile_map.fill_rect(k, 0, 1, 256, Tile.WALL)
+    for k in range(20, 256, 24):
+        for gap in range(10, 256, 24):
+            tile_map.set(gap, k, Tile.FLOOR)
+            tile_map.set(k, gap, Tile.FLOOR)
+    return tile_map
+
+
+def test_bench_find_path_across_map(benchmark, rooms_map):
+    """Time a corner-to-corner jump point search."""
+    benchmark.group = "pathfinding"
+    pathfinder = Pathfinder(rooms_map)
+
+    def search():
+        pathfinder.cache.clear()
+        return pathfinder.find_path((2, 2), (250, 250))
+
+    path = benchmark(search)
+
+    assert path[-1] == (250, 250)
+
+
+@pytest.mark.parametrize("actors", [10, 100, 500])
+def test_bench_resolve_shared_goal(benchmark, rooms_map, actors):
+    """Time resolving many actors chasing one goal from nearby rooms."""
+    benchmark.group = "pathfinding_batch"
+    benchmark.extra_info["actors"] = actors
+    pathfinder = Pathfinder(rooms_map)
+    rng = random.Random(0)
+    starts = [(rng.randrange(90, 170), rng.randrange(90, 170)) for _ in range(actors)]
+
+    def resolve():
+        pathfinder.cache.clear()
+        for slot, start in enumerate(starts):
+            pathfinder.request(slot, start, (128, 128))
+        return pathfinder.resolve()
+
+    paths = benchmark(resolve)
+
+    assert len(paths) == actors
@@ -0,0 +1,44 @@
+"""
+Benchmarks for core.player.Player.
+
+Covers:
+- rolling a new character with Player.new_player,
+- reloading a saved game with Player.from_file,
+- current_carry_weight across inventories of 10 to 100,000 items, so that
+  a change in how the total scales shows up in the group comparison.
+"""
+import pytest
+
+from core.player import Player
+
+INVENTORY_SIZES = [10, 100, 1_000, 10_000, 100_000]
+
+
+def test_bench_new_player(benchmark):
+    """Time rolling a brand new character."""
+    benchmark.group = "player_create"
+    player = benchmark(Player.new_player, name="Bilbo", character_class="BURGLAR", race="HOBBIT")
+
+    assert player.level == 1
+
+
+def test_bench_player_from_file(benchmark, aragorn_file):
+    """Time loading a saved character from disk."""
+    benchmark.group = "player_create"
+    player = benchmark(Player.from_file, aragorn_file)
+
+    assert player.player_name == "Aragorn"
+
+
+@pytest.mark.parametrize("size", INVENTORY_SIZES)
+def test_bench_current_carry_weight(benchmark, aragorn_data, make_inventory, size):
+    """Time summing carry weight as the inventory grows."""
+    benchmark.group = "carry_weight_scaling"
+    benchmark.extra_info["inventory_size"] = size
+
+    aragorn_data['inventory'] = make_inventory(size)
+    player = Player.from_json(aragorn_data)
+
+    total = benchmark(player.current_carry_weight)
+
+    assert total == pytest.approx(sum(item.weight for item in player.inventory))
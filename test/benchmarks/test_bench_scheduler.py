@@ -0,0 +1,36 @@
+"""
+Benchmarks for core.scheduler.TurnScheduler.
+
+Times a full round of turns (every actor acting once and being charged a
+varying action cost) as the number of actors grows.
+"""
+import random
+
+import pytest
+
+from core.scheduler import TurnScheduler
+
+ACTOR_COUNTS = [100, 1_000, 10_000]
+
+
+@pytest.mark.parametrize("actors", ACTOR_COUNTS)
+def test_bench_scheduler_round(benchmark, actors):
+    """Time draining one round of turns for N actors with mixed speeds."""
+    benchmark.group = "scheduler_scaling"
+    benchmark.extra_info["actors"] = actors
+    rng = random.Random(0)
+    scheduler = TurnScheduler()
+    for actor in range(actors):
+        scheduler.add(actor, rng.choice([50, 80, 100, 120, 150]))
+    costs = [rng.choice([100, 100, 150]) for _ in range(actors)]
+
+    def one_round():
+        acted = 0
+        while acted < actors:
+            _, batch = scheduler.next_batch()
+            for actor in batch:
+                scheduler.reschedule(actor, cost=costs[actor])
+            acted += len(batch)
+        return acted
+
+    assert benchmark(one_round) >= actors
@@ -0,0 +1,124 @@
+"""
+Tests for managers.asset_manager and tools.build_asset_pack.
+
+These unit tests verify:
+- a built pack indexes every file under the assets directory, except
+  dotfiles, hidden directories and editor backups,
+- packed bytes are served as views of the mapping and BufferReader seeks like a file,
+- AssetManager uses frombuffer for raw images, file-like views for everything else,
+  and falls back to loose files when there is no pack,
+- surfaces made from a raw pack can be drawn on without touching the pack file.
+"""
+import io
+import types
+
+import pygame
+import pytest
+
+from managers import asset_manager as asset_manager_module
+from managers.asset_manager import AssetManager, AssetPack, AssetPackError, BufferReader
+from tools import build_asset_pack
+
+
+@pytest.fixture
+def assets_dir(tmp_path):
+    root = tmp_path / "assets"
+    (root / "fonts").mkdir(parents=True)
+    (root / "images").mkdir()
+    (root / "fonts" / "test.ttf").write_bytes(b"font-bytes")
+    (root / "images" / "bg.jpg").write_bytes(b"jpeg-bytes")
+    return root
+
+
+@pytest.fixture
+def fake_pygame(monkeypatch):
+    calls = []
+    image = types.SimpleNamespace(
+        load=lambda source, namehint="": calls.append(("load", source)) or "surface",
+        frombuffer=lambda data, size, fmt: calls.append(("frombuffer", bytes(data), size, fmt)) or "raw-surface")
+    font = types.SimpleNamespace(Font=lambda source, size: calls.append(("font", source, size)) or "font")
+    monkeypatch.setattr(asset_manager_module, "pygame", types.SimpleNamespace(image=image, font=font))
+    return calls
+
+
+def test_build_and_read_pack(assets_dir, tmp_path):
+    pack_path = str(tmp_path / "assets.pack")
+    index = build_asset_pack.build_pack(str(assets_dir), pack_path)
+    assert sorted(index) == ["fonts/test.ttf", "images/bg.jpg"]
+
+    pack = AssetPack(pack_path)
+    assert len(pack) == 2
+    assert isinstance(pack.data("images/bg.jpg"), memoryview)
+    assert bytes(pack.data("fonts/test.ttf")) == b"font-bytes"
+    assert pack.entry("fonts/test.ttf")["offset"] % build_asset_pack.ALIGNMENT == 0
+    pack.close()
+
+
+def test_hidden_files_are_not_packed(assets_dir):
+    (assets_dir / ".DS_Store").write_bytes(b"finder")
+    (assets_dir / "images" / ".bg.jpg.swp").write_bytes(b"vim")
+    (assets_dir / "images" / "bg.jpg~").write_bytes(b"backup")
+    (assets_dir / ".cache").mkdir()
+    (assets_dir / ".cache" / "thumb.png").write_bytes(b"thumb")
+
+    names = [name for name, _ in build_asset_pack.find_assets(str(assets_dir))]
+    assert names == ["fonts/test.ttf", "images/bg.jpg"]
+
+
+def test_not_a_pack(tmp_path):
+    path = tmp_path / "assets.pack"
+    path.write_bytes(b"definitely not a pack, but long enough to have a header")
+    with pytest.raises(AssetPackError):
+        AssetPack(str(path))
+
+
+def test_buffer_reader_reads_and_seeks():
+    reader = BufferReader(memoryview(b"abcdef"))
+    assert reader.read(2) == b"ab"
+    reader.seek(-1, io.SEEK_END)
+    assert reader.read() == b"f"
+    reader.seek(1)
+    assert reader.tell() == 1
+    assert reader.read(10) == b"bcdef"
+
+
+def test_manager_loads_from_pack(assets_dir, tmp_path, fake_pygame, monkeypatch):
+    monkeypatch.setattr(build_asset_pack, "decode_rgba", lambda path: (b"\x01\x02\x03\x04" * 2, 2, 1))
+    pack_path = str(tmp_path / "assets.pack")
+    build_asset_pack.build_pack(str(assets_dir), pack_path, raw_images=True)
+
+    assets = AssetManager(str(assets_dir), pack_path)
+    assert assets.image("images/bg.jpg") == "raw-surface"
+    assert assets.image("images/bg.jpg") == "raw-surface"
+    assets.font("fonts/test.ttf", 12)
+
+    assert fake_pygame[0] == ("frombuffer", b"\x01\x02\x03\x04" * 2, (2, 1), "RGBA")
+    kind, source, size = fake_pygame[1]
+    assert kind == "font" and size == 12 and source.read() == b"font-bytes"
+    assert len(fake_pygame) == 2
+
+
+def test_manager_falls_back_to_loose_files(assets_dir, tmp_path, fake_pygame):
+    assets = AssetManager(str(assets_dir), str(tmp_path / "missing.pack"))
+    assert assets.pack is None
+    assets.image("images/bg.jpg")
+    assert fake_pygame == [("load", str(assets_dir / "images" / "bg.jpg"))]
+
+
+def test_raw_pack_surfaces_are_writable(tmp_path):
+    root = tmp_path / "assets"
+    (root / "images").mkdir(parents=True)
+    source = pygame.Surface((4, 2), pygame.SRCALPHA)
+    source.fill((10, 20, 30, 255))
+    pygame.image.save(source, str(root / "images" / "tile.png"))
+    pack_path = str(tmp_path / "assets.pack")
+    build_asset_pack.build_pack(str(root), pack_path, raw_images=True)
+    packed = (tmp_path / "assets.pack").read_bytes()
+
+    assets = AssetManager(str(root), pack_path)
+    surface = assets.image("images/tile.png")
+    surface.fill((200, 0, 0, 255))
+    assert surface.get_at((3, 1)) == (200, 0, 0, 255)
+    del surface
+    assets.close()
+    assert (tmp_path / "assets.pack").read_bytes() == packed
@@ -0,0 +1,55 @@
+"""
+Tests for tools.balance_sim.
+
+These unit tests verify:
+- the matchup matrix covers every race, class, weapon and monster,
+- results are reproducible for a seed, whatever the number of workers,
+- win-rate confidence intervals and time-to-kill summaries are sane.
+"""
+from core.classes import CharacterClass
+from core.races import Race
+from tools.balance_sim import MatchupResult, build_matchups, simulate
+
+
+def test_build_matchups_covers_matrix():
+    """Without filters every Race x CharacterClass x weapon x monster is present."""
+    matchups = build_matchups()
+    races = {m.race for m in matchups}
+    classes = {m.character_class for m in matchups}
+
+    assert races == {r.name for r in Race}
+    assert classes == {c.name for c in CharacterClass}
+    assert all(m.damage_die for m in matchups)
+
+    filtered = build_matchups(races=["ELF"], monsters=["Orc"])
+    assert {(m.race, m.monster.name) for m in filtered} == {("ELF", "Orc")}
+
+
+def test_simulate_is_reproducible_across_worker_counts():
+    """The same seed gives identical results in-process and in a process pool."""
+    matchups = build_matchups(races=["HOBBIT"], classes=["BURGLAR"], weapons=["dagger_steel"])
+    local = simulate(matchups, trials=60, workers=1, seed=7, batch_size=25)
+    pooled = simulate(matchups, trials=60, workers=2, seed=7, batch_size=25)
+
+    assert [(r.wins, r.kill_rounds) for r in local] == [(r.wins, r.kill_rounds) for r in pooled]
+    assert all(r.trials == 60 for r in local)
+    assert all(len(r.kill_rounds) == r.wins for r in local)
+
+
+def test_result_statistics():
+    """Wilson interval brackets the win rate and TTK stats summarise kill rounds."""
+    matchup = build_matchups(races=["ELF"], classes=["RANGER"], weapons=["sword_steel"], monsters=["Orc"])[0]
+    result = MatchupResult(matchup, trials=100, wins=80, kill_rounds=[2] * 40 + [4] * 40)
+
+    low, high = result.win_rate_interval()
+    assert low < 0.8 < high
+    assert 0.0 <= low and high <= 1.0
+
+    ttk = result.ttk_summary()
+    assert ttk["mean"] == 3
+    assert ttk["mean_low"] < 3 < ttk["mean_high"]
+    assert ttk["median"] == 3
+
+    empty = MatchupResult(matchup)
+    assert empty.win_rate_interval() == (0.0, 1.0)
+    assert empty.ttk_summary()["mean"] is None
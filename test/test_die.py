@@ -56,4 +56,20 @@ def test_die_roll_minimum_value_respected(mock_randint):
     assert rolls == [3, 3, 3]
     assert total == 9
     assert mock_randint.call_count == 3
-    assert mock_randint.call_args_list == [call(3, 6), call(3, 6), call(3, 6)]
\ No newline at end of file
+    assert mock_randint.call_args_list == [call(3, 6), call(3, 6), call(3, 6)]
+
+def test_die_parse():
+    """Die.parse splits valid expressions and rejects invalid ones like roll does."""
+    assert Die.parse("3d6") == (3, 6)
+    assert Die.parse("1D20") == (1, 20)
+    with pytest.raises(ValueError):
+        Die.parse("d6")
+    with pytest.raises(InvalidDieExpression):
+        Die.parse("0d6")
+
+def test_die_seed_repeats_rolls():
+    """Seeding makes the same sequence of rolls come out again."""
+    Die.seed(99)
+    first = [Die.roll('3d6') for _ in range(5)]
+    Die.seed(99)
+    assert [Die.roll('3d6') for _ in range(5)] == first
@@ -0,0 +1,109 @@
+"""
+Tests for core.effects.
+
+These unit tests verify:
+- instant effects heal and restore MP without going over the maximum,
+- buffs raise a stat and wear off after their duration,
+- damage over time hits every tick and then stops,
+- effect dicts are compiled once, the cache stays bounded, and unknown
+  effects are rejected,
+- damage dice are rolled through Die, so Die.seed makes them repeatable.
+"""
+from types import SimpleNamespace
+
+import pytest
+
+from core import effects
+from core.die import Die
+from core.effects import EffectStore, apply_effect, compile_effect
+from core.item import item_from_template
+
+
+def make_actor():
+    return SimpleNamespace(current_hit_points=10, max_hit_points=30,
+                           current_magic_points=0, max_magic_points=5,
+                           strength=12, intelligence=10, dexterity=10, constitution=10)
+
+
+def test_heal_and_restore_are_capped():
+    actor, store = make_actor(), EffectStore()
+    apply_effect(actor, {"heal": 15, "restore_mp": 10}, store)
+    assert actor.current_hit_points == 25
+    assert actor.current_magic_points == 5
+    apply_effect(actor, {"heal": 15}, store)
+    assert actor.current_hit_points == 30
+    assert len(store) == 0
+
+
+def test_buff_wears_off():
+    actor, store = make_actor(), EffectStore()
+    apply_effect(actor, {"buff": {"stat": "strength", "amount": 3, "duration": 2}}, store)
+    assert actor.strength == 15
+    store.tick()
+    assert actor.strength == 15
+    store.tick()
+    assert actor.strength == 12
+    assert len(store) == 0
+
+
+def test_damage_over_time():
+    actor, other, store = make_actor(), make_actor(), EffectStore()
+    apply_effect(actor, {"damage_over_time": {"damage": 2, "duration": 3}}, store)
+    apply_effect(other, {"damage_over_time": {"damage": "1d1", "duration": 1}}, store)
+    for _ in range(5):
+        store.tick()
+    assert actor.current_hit_points == 4
+    assert other.current_hit_points == 9
+
+
+def test_remove_actor_drops_effects_without_expiring():
+    actor, other, store = make_actor(), make_actor(), EffectStore()
+    buff = {"buff": {"stat": "dexterity", "amount": 2, "duration": 5}}
+    apply_effect(actor, buff, store)
+    apply_effect(other, buff, store)
+    store.remove_actor(actor)
+    assert store.effects_on(actor) == 0
+    assert store.effects_on(other) == 1
+    assert actor.dexterity == 12
+
+
+def test_consumable_effect_compiled_once():
+    """Items from one template share an effect dict, so they share one compiled effect."""
+    template = {"id": "potion", "name": "Potion", "consumable": {"effect": {"heal": 5}}}
+    first = item_from_template(template).get("consumable").use(None)
+    second = item_from_template(template).get("consumable").use(None)
+    assert compile_effect(first) is compile_effect(second)
+
+
+def test_compiled_effect_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(effects, "MAX_COMPILED_EFFECTS", 4)
+    kept = {"heal": 1}
+    compiled = compile_effect(kept)
+    for amount in range(10):
+        compile_effect({"heal": amount})
+        compile_effect(kept)
+    assert len(effects._compiled) <= 4
+    assert compile_effect(kept) is compiled
+
+
+def test_damage_dice_follow_die_seed():
+    def poison_damage():
+        actor, store = make_actor(), EffectStore()
+        actor.current_hit_points = 1000
+        apply_effect(actor, {"damage_over_time": {"damage": "2d6", "duration": 5}}, store)
+        for _ in range(5):
+            store.tick()
+        return 1000 - actor.current_hit_points
+
+    Die.seed(42)
+    first = poison_damage()
+    Die.seed(42)
+    assert poison_damage() == first
+
+
+@pytest.mark.parametrize("effect", [{"teleport": 1},
+                                    {"buff": {"stat": "luck", "amount": 1, "duration": 2}},
+                                    {"damage_over_time": {"damage": "1d4", "duration": 0}}])
+def test_bad_effects_rejected(effect):
+    with pytest.raises(ValueError):
+        compile_effect(effect)
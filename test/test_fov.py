@@ -0,0 +1,125 @@
+"""
+Tests for core.fov.
+
+These unit tests verify:
+- walls block sight and are themselves visible,
+- tiles off the edge of the map are never visible,
+- visibility is symmetric between floor tiles (on random maps),
+- views are cached, and dropped only when nearby opacity changes,
+- the batched seen_by query agrees with per-viewer views, including viewers
+  and targets standing in (opaque) doorways.
+"""
+import random
+
+from core.fov import FieldOfView, VisibilityGrid
+from core.tilemap import Tile, TileMap
+
+
+def random_map(seed, width=30, height=30, wall_chance=0.25, door_chance=0.0):
+    rng = random.Random(seed)
+    tile_map = TileMap(width, height, fill=Tile.FLOOR)
+    for y in range(height):
+        for x in range(width):
+            roll = rng.random()
+            if roll < wall_chance:
+                tile_map.set(x, y, Tile.WALL)
+            elif roll < wall_chance + door_chance:
+                tile_map.set(x, y, Tile.DOOR)
+    return tile_map
+
+
+def test_walls_block_sight():
+    """A wall hides what's behind it but is visible itself."""
+    tile_map = TileMap(11, 11, fill=Tile.FLOOR)
+    tile_map.set(5, 3, Tile.WALL)
+    view = FieldOfView(tile_map).compute((5, 5), radius=5)
+
+    assert view.is_visible(5, 5)
+    assert view.is_visible(5, 3)
+    assert not view.is_visible(5, 2)
+    assert not view.is_visible(5, 0)
+    assert view.is_visible(0, 5)
+    # outside the radius circle
+    assert not view.is_visible(0, 0)
+
+
+def test_nothing_off_the_map_is_visible():
+    tile_map = TileMap(10, 10, fill=Tile.FLOOR)
+    fov = FieldOfView(tile_map)
+    for origin in [(0, 0), (9, 9), (0, 5)]:
+        tiles = fov.compute(origin, 3).visible_tiles()
+        assert origin in tiles
+        assert all(0 <= x < 10 and 0 <= y < 10 for x, y in tiles), origin
+    assert not fov.compute((0, 0), 3).is_visible(-1, -1)
+
+
+def test_visibility_is_symmetric():
+    """If floor tile A sees floor tile B, then B sees A."""
+    for seed in range(5):
+        tile_map = random_map(seed)
+        fov = FieldOfView(tile_map)
+        rng = random.Random(seed)
+        floor = [(x, y) for y in range(30) for x in range(30) if tile_map.get(x, y) is Tile.FLOOR]
+        for _ in range(200):
+            a, b = rng.choice(floor), rng.choice(floor)
+            assert fov.compute(a, 8).is_visible(*b) == fov.compute(b, 8).is_visible(*a), (seed, a, b)
+
+
+def test_cache_and_invalidation():
+    """Views are reused until a tile inside their square changes opacity."""
+    tile_map = TileMap(40, 10, fill=Tile.FLOOR)
+    fov = FieldOfView(tile_map)
+    near = fov.compute((5, 5), 4)
+    far = fov.compute((30, 5), 4)
+    assert fov.compute((5, 5), 4) is near
+
+    # Same opacity (floor -> water): nothing is dropped
+    tile_map.set(6, 5, Tile.WATER)
+    assert fov.compute((5, 5), 4) is near
+
+    tile_map.set(6, 5, Tile.WALL)
+    fresh = fov.compute((5, 5), 4)
+    assert fresh is not near
+    assert not fresh.is_visible(8, 5)
+    assert fov.compute((30, 5), 4) is far
+
+
+def test_seen_by_matches_individual_views():
+    """The batched query gives the same answers as each viewer's own view."""
+    tile_map = random_map(42)
+    fov = FieldOfView(tile_map)
+    floor = [(x, y) for y in range(30) for x in range(30) if tile_map.get(x, y) is Tile.FLOOR]
+    player = floor[len(floor) // 2]
+    monsters = floor[::7]
+
+    batched = fov.seen_by(player, monsters, radius=6)
+    individual = [fov.compute(m, 6).is_visible(*player) for m in monsters]
+
+    assert batched == individual
+    assert fov.any_can_see(player, monsters, 6) == any(individual)
+
+
+def test_seen_by_with_viewers_in_doorways():
+    """Doors are walkable but opaque, so sight from a doorway isn't symmetric; seen_by still agrees."""
+    for seed in range(5):
+        tile_map = random_map(seed, wall_chance=0.15, door_chance=0.1)
+        fov = FieldOfView(tile_map)
+        rng = random.Random(seed)
+        walkable = [(x, y) for y in range(30) for x in range(30) if tile_map.get(x, y).walkable]
+        doors = [p for p in walkable if tile_map.get(*p) is Tile.DOOR]
+        viewers = doors + rng.sample(walkable, 40)
+        for target in rng.sample(walkable, 5) + doors[:3]:
+            expected = [fov.compute(v, 6).is_visible(*target) for v in viewers]
+            assert fov.seen_by(target, viewers, 6) == expected, (seed, target)
+
+
+def test_visibility_grid_bits():
+    """VisibilityGrid packs its square into bits and lists marked tiles."""
+    grid = VisibilityGrid((10, 10), 2)
+    grid.mark(9, 12)
+    grid.mark(12, 8)
+    grid.mark(50, 50)  # outside the square: ignored
+
+    assert len(grid.bits) == 4
+    assert grid.is_visible(9, 12) and not grid.is_visible(10, 10)
+    assert grid.visible_tiles() == [(12, 8), (9, 12)]
@@ -0,0 +1,96 @@
+"""
+Tests for managers.level_streamer.
+
+These unit tests verify:
+- the chunk under the player is loaded first and the rest stream in nearest first,
+- chunks beyond max_resident are unloaded back to rock, with a callback,
+- chunks made by worker processes through shared memory match in-process ones,
+- chunks load in the order they were queued, and wait_for_chunks loads them
+  within the update that queued them.
+"""
+import pytest
+
+from core.levelgen import CHUNK_SIZE, generate_chunk
+from core.tilemap import Tile, TileMap
+from managers.level_streamer import LevelStreamer
+
+MONSTERS = ["Orc", "Goblin"]
+LOOT = ["chest_common"]
+
+
+def make_streamer(tile_map, **kwargs):
+    return LevelStreamer(tile_map, seed=5, monster_names=MONSTERS, loot_tables=LOOT, **kwargs)
+
+
+def test_streams_nearest_chunks_first():
+    tile_map = TileMap(8 * CHUNK_SIZE, 8 * CHUNK_SIZE)
+    loaded = []
+    streamer = make_streamer(tile_map, workers=0, prefetch_radius=1, max_in_flight=2,
+                             on_chunk_loaded=lambda chunk: loaded.append((chunk.cx, chunk.cy)))
+
+    centre = 4 * CHUNK_SIZE + 5
+    streamer.update(centre, centre)
+    assert loaded[0] == (4, 4)
+    assert len(loaded) == 2
+
+    for _ in range(5):
+        streamer.update(centre, centre)
+    assert sorted(loaded) == sorted((cx, cy) for cx in (3, 4, 5) for cy in (3, 4, 5))
+
+    chunk = generate_chunk(5, 4, 4, MONSTERS, LOOT, bounds=(8, 8))
+    assert tile_map.tiles[(4 * CHUNK_SIZE) * tile_map.width + 4 * CHUNK_SIZE:][:CHUNK_SIZE] == chunk.tiles[:CHUNK_SIZE]
+
+
+def test_far_chunks_are_unloaded():
+    tile_map = TileMap(8 * CHUNK_SIZE, CHUNK_SIZE)
+    unloaded = []
+    streamer = make_streamer(tile_map, workers=0, prefetch_radius=0, max_resident=2,
+                             on_chunk_unloaded=lambda chunk: unloaded.append((chunk.cx, chunk.cy)))
+
+    for cx in range(4):
+        streamer.update(cx * CHUNK_SIZE, 0)
+
+    assert list(streamer.loaded) == [(2, 0), (3, 0)]
+    assert unloaded == [(0, 0), (1, 0)]
+    first_chunk = bytes(tile_map.tiles[row * tile_map.width + x]
+                        for row in range(CHUNK_SIZE) for x in range(CHUNK_SIZE))
+    assert set(first_chunk) == {Tile.WALL.code}
+
+
+def test_bad_settings_rejected():
+    with pytest.raises(ValueError):
+        make_streamer(TileMap(CHUNK_SIZE + 1, CHUNK_SIZE), workers=0)
+    with pytest.raises(ValueError):
+        make_streamer(TileMap(CHUNK_SIZE, CHUNK_SIZE), workers=0, prefetch_radius=2, max_resident=9)
+
+
+def test_worker_processes_match_in_process():
+    tile_map = TileMap(4 * CHUNK_SIZE, 4 * CHUNK_SIZE)
+    chunks = {}
+    streamer = make_streamer(tile_map, workers=1, prefetch_radius=1, max_in_flight=4,
+                             on_chunk_loaded=lambda chunk: chunks.setdefault((chunk.cx, chunk.cy), chunk))
+    try:
+        while len(streamer.loaded) < 4:
+            streamer.update(0, 0)
+            streamer.wait()
+    finally:
+        streamer.close()
+
+    assert set(chunks) == {(0, 0), (1, 0), (0, 1), (1, 1)}
+    for (cx, cy), chunk in chunks.items():
+        assert chunk == generate_chunk(5, cx, cy, MONSTERS, LOOT, bounds=(4, 4))
+
+
+def test_chunks_load_in_queued_order():
+    tile_map = TileMap(4 * CHUNK_SIZE, 4 * CHUNK_SIZE)
+    loaded = []
+    streamer = make_streamer(tile_map, workers=2, prefetch_radius=1, max_in_flight=8, wait_for_chunks=True,
+                             on_chunk_loaded=lambda chunk: loaded.append((chunk.cx, chunk.cy)))
+    try:
+        streamer.update(CHUNK_SIZE + 5, CHUNK_SIZE + 5)
+        assert not streamer.pending
+    finally:
+        streamer.close()
+
+    wanted = streamer.wanted_chunks(CHUNK_SIZE + 5, CHUNK_SIZE + 5)
+    assert loaded == wanted[:8]
@@ -0,0 +1,73 @@
+"""
+Tests for core.levelgen.
+
+These unit tests verify:
+- a chunk depends only on the seed and its coordinates,
+- corridors meet up across the edge between neighbouring chunks,
+- no corridor leads out of the level,
+- spawns and loot sit on floor tiles inside their chunk,
+- chunks survive packing into a flat buffer and back.
+"""
+from core.levelgen import (
+    CHUNK_SIZE,
+    chunk_buffer_size,
+    edge_opening,
+    generate_chunk,
+    pack_chunk,
+    unpack_chunk,
+)
+from core.tilemap import Tile
+
+MONSTERS = ["Orc", "Goblin", "Cave Troll"]
+LOOT = ["chest_common"]
+
+
+def tile_at(chunk, x, y):
+    return chunk.tiles[y * chunk.size + x]
+
+
+def test_chunks_are_deterministic():
+    first = generate_chunk(7, 3, 4, MONSTERS, LOOT)
+    assert generate_chunk(7, 3, 4, MONSTERS, LOOT) == first
+    assert generate_chunk(8, 3, 4, MONSTERS, LOOT).tiles != first.tiles
+
+
+def test_corridors_meet_across_edges():
+    floor = Tile.FLOOR.code
+    for seed in range(20):
+        left, right = generate_chunk(seed, 2, 2), generate_chunk(seed, 3, 2)
+        y = edge_opening(seed, "v", 3, 2)
+        assert tile_at(left, CHUNK_SIZE - 1, y) == floor and tile_at(right, 0, y) == floor
+
+        top, bottom = generate_chunk(seed, 2, 2), generate_chunk(seed, 2, 3)
+        x = edge_opening(seed, "h", 2, 3)
+        assert tile_at(top, x, CHUNK_SIZE - 1) == floor and tile_at(bottom, x, 0) == floor
+
+
+def test_no_corridors_out_of_the_level():
+    wall = Tile.WALL.code
+    corner = generate_chunk(1, 0, 0, bounds=(1, 1))
+    edges = ([tile_at(corner, 0, i) for i in range(CHUNK_SIZE)] +
+             [tile_at(corner, CHUNK_SIZE - 1, i) for i in range(CHUNK_SIZE)] +
+             [tile_at(corner, i, 0) for i in range(CHUNK_SIZE)] +
+             [tile_at(corner, i, CHUNK_SIZE - 1) for i in range(CHUNK_SIZE)])
+    assert set(edges) == {wall}
+
+
+def test_spawns_and_loot_on_floor_inside_chunk():
+    for seed in range(20):
+        chunk = generate_chunk(seed, 5, 1, MONSTERS, LOOT)
+        spots = [(x, y) for x, y, _ in chunk.spawns + chunk.loot]
+        assert len(set(spots)) == len(spots)
+        for x, y in spots:
+            assert chunk.contains(x, y)
+            assert tile_at(chunk, x - chunk.x, y - chunk.y) == Tile.FLOOR.code
+        assert all(name in MONSTERS for _, _, name in chunk.spawns)
+
+
+def test_pack_round_trip():
+    for seed in range(10):
+        chunk = generate_chunk(seed, 6, 2, MONSTERS, LOOT)
+        buffer = bytearray(chunk_buffer_size())
+        counts = pack_chunk(chunk, buffer, MONSTERS, LOOT)
+        assert unpack_chunk(memoryview(buffer), 6, 2, counts, MONSTERS, LOOT) == chunk
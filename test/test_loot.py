@@ -0,0 +1,104 @@
+"""
+Tests for core.loot.
+
+These unit tests verify:
+- the alias sampler draws entries in proportion to their weights,
+- shipped loot tables load and only reference known items and tables,
+- roll_loot follows nested tables, rolls quantity dice and builds full stacks,
+- drops are reproducible after Die.seed,
+- bad table data (unknown items, cycles, quantities on nested tables) is
+  rejected when loading.
+"""
+import json
+import random
+from collections import Counter
+
+import pytest
+
+from core.die import Die
+from core.item import load_item_templates
+from core.loot import AliasSampler, LootEntry, LootTable, load_loot_tables, roll_loot
+
+
+@pytest.fixture(scope="module")
+def item_templates():
+    return load_item_templates()
+
+
+def write_tables(tmp_path, tables):
+    path = tmp_path / "loot_tables.json"
+    path.write_text(json.dumps(tables), encoding="utf-8")
+    return str(path)
+
+
+def test_alias_sampler_matches_weights():
+    """Each index comes up about as often as its share of the total weight."""
+    weights = [1, 0, 3, 6]
+    counts = Counter(AliasSampler(weights).sample_many(100_000, random.Random(7)))
+    assert counts[1] == 0
+    for index, weight in enumerate(weights):
+        assert counts[index] / 100_000 == pytest.approx(weight / 10, abs=0.01)
+
+
+def test_alias_sampler_rejects_bad_weights():
+    for weights in ([], [0, 0], [1, -1]):
+        with pytest.raises(ValueError):
+            AliasSampler(weights)
+
+
+def test_shipped_tables_load(item_templates):
+    tables = load_loot_tables(item_templates=item_templates)
+    assert {"chest_common", "weapons_elvish", "boss_orc_captain"} <= set(tables)
+    assert tables["chest_common"].rolls == 2
+
+
+def test_roll_loot_nested_tables_and_stacks(item_templates):
+    """Nested tables are rolled in place, and stackables come out as full stacks."""
+    potion = item_templates["potion_healing_small"]
+    elvish = LootTable("elvish", [LootEntry(weight=1, template=item_templates["dagger_elvish"])])
+    table = LootTable("test", [LootEntry(weight=1, template=potion, quantity="1d1"),
+                               LootEntry(weight=1, table=elvish)], rolls=2)
+
+    items = roll_loot(table, n=30)
+
+    potions = [item for item in items if item.id == "potion_healing_small"]
+    daggers = [item for item in items if item.id == "dagger_elvish"]
+    assert len(daggers) + sum(item.get("stackable").quantity for item in potions) == 60
+    max_stack = potion["stackable"]["max_stack"]
+    assert all(item.get("stackable").quantity == max_stack for item in potions[:-1])
+
+
+def test_roll_loot_is_reproducible(item_templates):
+    tables = load_loot_tables(item_templates=item_templates)
+    Die.seed(42)
+    first = [(item.id, item.get("stackable") and item.get("stackable").quantity)
+             for item in roll_loot(tables["boss_orc_captain"], 5)]
+    Die.seed(42)
+    second = [(item.id, item.get("stackable") and item.get("stackable").quantity)
+              for item in roll_loot(tables["boss_orc_captain"], 5)]
+    assert first == second
+
+
+def test_nothing_entry_drops_nothing(item_templates):
+    table = LootTable("empty", [LootEntry(weight=1)])
+    assert roll_loot(table, 10) == []
+
+
+def test_unknown_item_rejected(tmp_path, item_templates):
+    path = write_tables(tmp_path, [{"id": "bad", "entries": [{"item": "no_such_item", "weight": 1}]}])
+    with pytest.raises(ValueError):
+        load_loot_tables(path, item_templates)
+
+
+def test_cycle_rejected(tmp_path, item_templates):
+    path = write_tables(tmp_path, [{"id": "a", "entries": [{"table": "b", "weight": 1}]},
+                                   {"id": "b", "entries": [{"table": "a", "weight": 1}]}])
+    with pytest.raises(ValueError):
+        load_loot_tables(path, item_templates)
+
+
+def test_quantity_on_nested_table_rejected(tmp_path, item_templates):
+    path = write_tables(tmp_path, [{"id": "a", "entries": [{"table": "b", "weight": 1, "quantity": "1d4"}]},
+                                   {"id": "b", "entries": [{"item": "dagger_elvish", "weight": 1}]}])
+    with pytest.raises(ValueError):
+        load_loot_tables(path, item_templates)
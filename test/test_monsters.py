@@ -0,0 +1,118 @@
+"""
+Tests for core.monsters.
+
+These unit tests verify:
+- templates load from data/monsters.json,
+- spawning rolls HP from the template (with the population's rng or a given
+  one) and reuses dead slots,
+- ticking regenerates HP, counts status timers down and clamps at max HP,
+- movement respects walls, stuns and occupied tiles.
+"""
+import numpy as np
+import pytest
+
+from core.monsters import (
+    MonsterPopulation,
+    Status,
+    load_monster_templates,
+    walkable_grid,
+)
+from core.tilemap import Tile, TileMap
+
+
+@pytest.fixture
+def population():
+    return MonsterPopulation(load_monster_templates(), capacity=2, seed=1234)
+
+
+def test_templates_load():
+    """The shipped monster data includes an Orc with a health die."""
+    templates = {t.name: t for t in load_monster_templates()}
+    assert templates["Orc"].health_die == "2d8"
+    assert templates["Orc"].stats["strength"] == 13
+
+
+def test_spawn_many_grows_and_rolls_hp(population):
+    """Spawning past capacity grows the arrays; HP lands inside the die range."""
+    slots = population.spawn_many("Orc", range(10), [0] * 10)
+
+    assert len(population) == 10
+    assert population.capacity >= 10
+    # 2d8 with +1 constitution modifier
+    hp = population.max_hp[slots]
+    assert ((hp >= 3) & (hp <= 17)).all()
+    assert (population.hp[slots] == hp).all()
+
+    with pytest.raises(KeyError):
+        population.spawn("Balrog", 0, 0)
+
+
+def test_spawn_with_own_rng(population):
+    """HP rolled from a given rng doesn't depend on what the population rolled before."""
+    population.spawn_many("Orc", range(5), [0] * 5)
+    slots = population.spawn_many("Orc", range(4), [1] * 4, rng=np.random.default_rng([7, 1, 2]))
+    fresh = MonsterPopulation(load_monster_templates(), seed=99)
+    expected = fresh.spawn_many("Orc", range(4), [1] * 4, rng=np.random.default_rng([7, 1, 2]))
+
+    assert (population.hp[slots] == fresh.hp[expected]).all()
+
+
+def test_dead_slots_are_reused(population):
+    """Killing a monster frees its slot for the next spawn."""
+    first = population.spawn("Goblin", 1, 1)
+    population.spawn("Goblin", 2, 2)
+    dead = population.damage([first], [1000])
+
+    assert list(dead) == [first]
+    assert len(population) == 1
+    assert population.spawn("Orc", 3, 3) == first
+
+
+def test_tick_regen_and_status(population):
+    """A tick heals by regen (capped at max HP) and counts statuses down."""
+    slots = population.spawn_many("Orc", [0, 1], [0, 0])
+    population.hp[slots] = [1, population.max_hp[slots[1]]]
+    population.status[slots[0], Status.POISONED] = 2
+
+    population.tick()
+
+    assert population.hp[slots[0]] == 2
+    assert population.hp[slots[1]] == population.max_hp[slots[1]]
+    assert population.status[slots[0], Status.POISONED] == 1
+
+
+def test_tick_movement_rules(population):
+    """Walls, stuns and other monsters block movement; intents reset each tick."""
+    tile_map = TileMap(5, 5, fill=Tile.FLOOR)
+    tile_map.set(2, 0, Tile.WALL)
+    walkable = walkable_grid(tile_map)
+
+    into_wall = population.spawn("Orc", 1, 0)
+    stunned = population.spawn("Orc", 0, 2)
+    walker = population.spawn("Orc", 0, 4)
+    rival = population.spawn("Orc", 2, 4)
+    blocked = population.spawn("Orc", 4, 3)
+    population.status[stunned, Status.STUNNED] = 3
+
+    population.set_intents([into_wall, stunned, walker, rival, blocked], [1, 1, 1, -1, 0], [0, 0, 0, 0, 1])
+    population.tick(walkable)
+
+    assert (population.x[into_wall], population.y[into_wall]) == (1, 0)
+    assert (population.x[stunned], population.y[stunned]) == (0, 2)
+    # walker and rival both wanted (1, 4): the lower slot wins
+    assert (population.x[walker], population.y[walker]) == (1, 4)
+    assert (population.x[rival], population.y[rival]) == (2, 4)
+    assert (population.x[blocked], population.y[blocked]) == (4, 4)
+    assert not population.intent.any()
+
+
+def test_walkable_grid_matches_tiles():
+    """walkable_grid is indexed [y, x] and mirrors Tile.walkable."""
+    tile_map = TileMap(3, 2, fill=Tile.FLOOR)
+    tile_map.set(2, 1, Tile.WATER)
+    grid = walkable_grid(tile_map)
+
+    assert grid.shape == (2, 3)
+    assert grid[0, 0]
+    assert not grid[1, 2]
+    assert grid.dtype == np.bool_
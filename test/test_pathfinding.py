@@ -0,0 +1,171 @@
+"""
+Tests for core.pathfinding.
+
+These unit tests verify:
+- jump point search finds legal, shortest paths (checked against a plain
+  Dijkstra on random maps),
+- unreachable goals return None,
+- cached paths are reused and dropped when a tile they cross, or squeeze
+  past diagonally, is blocked,
+- batched requests sharing a goal get shortest paths too.
+"""
+import heapq
+import random
+
+import pytest
+
+from core.pathfinding import NavGrid, Pathfinder, first_step
+from core.tilemap import Tile, TileMap
+
+
+def random_map(seed, width=40, height=30, wall_chance=0.3):
+    rng = random.Random(seed)
+    tile_map = TileMap(width, height, fill=Tile.FLOOR)
+    for y in range(height):
+        for x in range(width):
+            if rng.random() < wall_chance:
+                tile_map.set(x, y, Tile.WALL)
+    return tile_map
+
+
+def dijkstra_cost(grid, start, goal):
+    dist = {start: 0.0}
+    heap = [(0.0, start)]
+    while heap:
+        d, node = heapq.heappop(heap)
+        if node == goal:
+            return d
+        if d > dist[node]:
+            continue
+        for nx, ny, cost in grid.neighbours(*node):
+            if d + cost < dist.get((nx, ny), float("inf")):
+                dist[(nx, ny)] = d + cost
+                heapq.heappush(heap, (d + cost, (nx, ny)))
+    return None
+
+
+def path_cost(grid, path):
+    total = 0.0
+    for (x0, y0), (x1, y1) in zip(path, path[1:]):
+        steps = {(nx, ny): cost for nx, ny, cost in grid.neighbours(x0, y0)}
+        assert (x1, y1) in steps, f"illegal step {(x0, y0)} -> {(x1, y1)}"
+        total += steps[(x1, y1)]
+    return total
+
+
+def test_jump_point_search_matches_dijkstra():
+    """JPS paths are legal and exactly as short as Dijkstra's on random maps."""
+    for seed in range(15):
+        tile_map = random_map(seed)
+        pathfinder = Pathfinder(tile_map)
+        grid = pathfinder.grid
+        rng = random.Random(seed)
+        floor = [(x, y) for y in range(tile_map.height) for x in range(tile_map.width)
+                 if grid.walkable(x, y)]
+        for _ in range(10):
+            start, goal = rng.choice(floor), rng.choice(floor)
+            expected = dijkstra_cost(grid, start, goal)
+            path = pathfinder.find_path(start, goal)
+            if expected is None:
+                assert path is None
+            else:
+                assert path[0] == start and path[-1] == goal
+                assert path_cost(grid, path) == pytest.approx(expected)
+
+
+def test_no_corner_cutting_and_unreachable():
+    """Diagonals can't squeeze between walls; walled-off goals return None."""
+    tile_map = TileMap(3, 3, fill=Tile.FLOOR)
+    tile_map.set(1, 0, Tile.WALL)
+    tile_map.set(0, 1, Tile.WALL)
+    pathfinder = Pathfinder(tile_map)
+
+    assert pathfinder.find_path((1, 1), (0, 0)) is None
+    assert pathfinder.find_path((0, 2), (2, 0)) == [(0, 2), (1, 2), (2, 1), (2, 0)]
+    assert pathfinder.find_path((1, 1), (1, 1)) == [(1, 1)]
+
+
+def test_cache_is_invalidated_by_region():
+    """Blocking a tile drops paths through its region but keeps the others."""
+    tile_map = TileMap(64, 32, fill=Tile.FLOOR)
+    pathfinder = Pathfinder(tile_map, region_size=16)
+
+    through = pathfinder.find_path((0, 5), (40, 5))
+    elsewhere = pathfinder.find_path((0, 25), (10, 25))
+    assert len(pathfinder.cache) == 2
+    assert pathfinder.find_path((0, 5), (40, 5)) is through
+
+    tile_map.set(20, 5, Tile.WALL)
+    assert ((0, 5), (40, 5)) not in pathfinder.cache
+    assert pathfinder.find_path((0, 25), (10, 25)) is elsewhere
+    assert (20, 5) not in pathfinder.find_path((0, 5), (40, 5))
+
+    # Opening a tile clears everything, as shorter routes may now exist
+    tile_map.set(20, 5, Tile.FLOOR)
+    assert len(pathfinder.cache) == 0
+
+
+def test_cache_is_invalidated_by_diagonal_squeeze():
+    """Blocking a tile a cached diagonal squeezes past drops the path, across region boundaries."""
+    tile_map = TileMap(16, 16, fill=Tile.FLOOR)
+    pathfinder = Pathfinder(tile_map, region_size=8)
+
+    # (8, 7) -> (7, 8) squeezes between (7, 7) and (8, 8), neither of which is on the path
+    assert pathfinder.find_path((9, 6), (6, 9)) == [(9, 6), (8, 7), (7, 8), (6, 9)]
+    tile_map.set(7, 7, Tile.WALL)
+    assert ((9, 6), (6, 9)) not in pathfinder.cache
+    path = pathfinder.find_path((9, 6), (6, 9))
+    path_cost(pathfinder.grid, path)
+
+    # Cached paths stay legal as walls go up anywhere
+    for seed in range(5):
+        tile_map = random_map(seed, wall_chance=0.15)
+        pathfinder = Pathfinder(tile_map, region_size=8)
+        rng = random.Random(seed)
+        floor = [(x, y) for y in range(tile_map.height) for x in range(tile_map.width)
+                 if pathfinder.grid.walkable(x, y)]
+        queries = [(rng.choice(floor), rng.choice(floor)) for _ in range(30)]
+        for _ in range(20):
+            for start, goal in queries:
+                path = pathfinder.find_path(start, goal)
+                if path:
+                    path_cost(pathfinder.grid, path)
+            x, y = rng.choice(floor)
+            tile_map.set(x, y, Tile.WALL)
+
+
+def test_resolve_batches_shared_goals():
+    """Many actors chasing one goal all get shortest paths from one resolve()."""
+    tile_map = random_map(99)
+    pathfinder = Pathfinder(tile_map, shared_goal_threshold=2)
+    grid = pathfinder.grid
+    floor = [(x, y) for y in range(tile_map.height) for x in range(tile_map.width) if grid.walkable(x, y)]
+    goal = floor[len(floor) // 2]
+    starts = floor[::37]
+
+    for slot, start in enumerate(starts):
+        pathfinder.request(slot, start, goal)
+    pathfinder.request("loner", floor[0], floor[-1])
+    paths = pathfinder.resolve()
+
+    assert set(paths) == set(range(len(starts))) | {"loner"}
+    for slot, start in enumerate(starts):
+        expected = dijkstra_cost(grid, start, goal)
+        if expected is None:
+            assert paths[slot] is None
+        else:
+            assert paths[slot][0] == start and paths[slot][-1] == goal
+            assert path_cost(grid, paths[slot]) == pytest.approx(expected)
+    assert pathfinder.resolve() == {}
+
+
+def test_nav_grid_and_first_step():
+    """NavGrid mirrors walkability; first_step gives the opening move."""
+    tile_map = TileMap(4, 1, fill=Tile.FLOOR)
+    tile_map.set(3, 0, Tile.WATER)
+    grid = NavGrid(tile_map)
+
+    assert grid.walkable(2, 0) and not grid.walkable(3, 0) and not grid.walkable(-1, 0)
+    assert first_step([(1, 1), (2, 0)]) == (1, -1)
+    assert first_step([(1, 1)]) == (0, 0)
+    assert first_step(None) == (0, 0)
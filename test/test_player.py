@@ -77,4 +77,15 @@ def test_auto_roller():
     assert player.experience == 0, f"Expected experience to be {expected_experience}, but got {player.experience}."
     assert player.level == 1, f"Expected level to be {expected_level}, but got {player.level}."
     assert player.archetype.health_die == '1d10'
-    assert player.archetype.magic_die == '1d8'
\ No newline at end of file
+    assert player.archetype.magic_die == '1d8'
+
+def test_new_player_rolls_hit_and_magic_points():
+    """Each new player gets their own rolled HP/MP, and the Player class isn't modified."""
+    player = Player.new_player(name="Gimli", race="DWARF", character_class="WARRIOR")
+
+    assert player.max_hit_points >= 1
+    assert player.current_hit_points == player.max_hit_points
+    assert player.max_magic_points >= 1
+    assert player.max_carrying_capacity == Player.calculate_max_carry(1, player.strength)
+    assert "max_hit_points" not in vars(Player)
+    assert "level" not in vars(Player)
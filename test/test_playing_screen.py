@@ -0,0 +1,47 @@
+"""
+Tests for scenes.playing_screen.
+
+These unit tests verify:
+- a chunk's monsters are spawned only the first time the chunk loads,
+- closing the scene shuts down the level's worker processes and frees
+  their shared memory.
+"""
+from multiprocessing import shared_memory
+
+import pytest
+
+from scenes.playing_screen import PlayingScreen
+
+
+@pytest.fixture
+def scene():
+    scene = PlayingScreen(screen=None, seed=7, wait_for_chunks=True)
+    yield scene
+    scene.close()
+
+
+def test_chunks_spawn_monsters_once(scene):
+    scene.streamer.update(*scene.start)
+    chunk = next(c for c in scene.streamer.loaded.values() if c.spawns)
+    spawned = len(scene.monsters)
+
+    scene.on_chunk_unloaded(chunk)
+    assert len(scene.monsters) == spawned - len(chunk.spawns)
+    scene.on_chunk_loaded(chunk)
+    assert len(scene.monsters) == spawned - len(chunk.spawns)
+
+
+def test_close_shuts_down_workers(scene):
+    streamer = scene.streamer
+    streamer.update(*scene.start)
+    processes = list(streamer.executor._processes.values())
+    block_names = [block.name for block in streamer._blocks]
+    assert processes and all(process.is_alive() for process in processes)
+
+    scene.close()
+    assert scene.streamer is None
+    assert not any(process.is_alive() for process in processes)
+    for name in block_names:
+        with pytest.raises(FileNotFoundError):
+            shared_memory.SharedMemory(name=name)
+    scene.close()
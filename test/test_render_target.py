@@ -0,0 +1,113 @@
+"""
+Tests for graphics.render_target.
+
+pygame surfaces and transforms are replaced with small fakes.
+These unit tests verify:
+- integer and smooth scaling keep the aspect ratio and centre the image,
+- the scaled surface is allocated once per window size, not once per frame,
+- window positions in events map back to logical pixels.
+"""
+import types
+
+import pytest
+
+from graphics import render_target as render_target_module
+from graphics.render_target import RenderTarget, fit
+
+
+class FakeSurface:
+    def __init__(self, size=(0, 0)):
+        self.size = size
+        self.blitted = []
+        self.fills = 0
+
+    def fill(self, colour):
+        self.fills += 1
+
+    def blit(self, surface, position):
+        self.blitted.append((surface, position))
+
+
+class FakeEvent:
+    def __init__(self, event_type, attributes):
+        self.type = event_type
+        self.dict = attributes
+        for name, value in attributes.items():
+            setattr(self, name, value)
+
+
+@pytest.fixture
+def fake_pygame(monkeypatch):
+    calls = []
+
+    def scale(surface, size, dest):
+        assert dest.size == size
+        calls.append(("scale", dest))
+
+    def smoothscale(surface, size, dest):
+        assert dest.size == size
+        calls.append(("smoothscale", dest))
+
+    monkeypatch.setattr(render_target_module, "pygame", types.SimpleNamespace(
+        Surface=FakeSurface,
+        transform=types.SimpleNamespace(scale=scale, smoothscale=smoothscale),
+        event=types.SimpleNamespace(Event=FakeEvent)))
+    return calls
+
+
+def test_fit_integer_and_smooth():
+    assert fit((320, 180), (1920, 1080), "integer") == ((1920, 1080), (0, 0))
+    # 2.5x fits, so integer scaling rounds down to 2x and letterboxes
+    assert fit((320, 180), (800, 450), "integer") == ((640, 360), (80, 45))
+    assert fit((320, 180), (800, 450), "smooth") == ((800, 450), (0, 0))
+    # Taller window: bars above and below
+    assert fit((1024, 768), (1024, 1000), "smooth") == ((1024, 768), (0, 116))
+    # Smaller than logical: integer mode falls back to shrinking
+    assert fit((1024, 768), (512, 384), "integer") == ((512, 384), (0, 0))
+
+
+def test_present_reuses_scaled_surface(fake_pygame):
+    target = RenderTarget((320, 180), (1280, 720), mode="integer")
+    window = FakeSurface((1280, 720))
+    scaled = target.scaled
+
+    target.present(window)
+    target.present(window)
+
+    assert fake_pygame == [("scale", scaled), ("scale", scaled)]
+    assert window.blitted == [(scaled, (0, 0)), (scaled, (0, 0))]
+    assert window.fills == 1
+
+
+def test_resize_rebuilds_only_scaled_surface(fake_pygame):
+    target = RenderTarget((1024, 768), (1024, 768), mode="smooth")
+    logical = target.surface
+    window = FakeSurface((1024, 768))
+
+    target.present(window)
+    assert target.scaled is None
+    assert window.blitted == [(logical, (0, 0))]
+
+    target.resize((2048, 1536))
+    target.present(window)
+    assert target.surface is logical
+    assert target.scaled.size == (2048, 1536)
+    assert fake_pygame == [("smoothscale", target.scaled)]
+    assert window.fills == 2
+
+
+def test_mouse_events_map_to_logical(fake_pygame):
+    target = RenderTarget((320, 180), (800, 450), mode="integer")  # 2x at offset (80, 45)
+    event = target.map_event(FakeEvent("motion", {"pos": (80 + 21, 45 + 41), "rel": (4, -2)}))
+    assert event.pos == (10, 20)
+    assert event.rel == (2, -1)
+    assert target.to_logical((0, 0)) == (0, 0)
+    assert target.to_logical((799, 449)) == (319, 179)
+
+    key = FakeEvent("key", {"key": 1})
+    assert target.map_event(key) is key
+
+
+def test_unknown_mode_rejected(fake_pygame):
+    with pytest.raises(ValueError):
+        RenderTarget((320, 180), (640, 360), mode="bilinear")
@@ -0,0 +1,89 @@
+"""
+Tests for managers.replay.
+
+pygame events are replaced with a small fake.
+These unit tests verify:
+- a recording round-trips through the gzipped file, keeping only plain attributes,
+- replaying drives the scene manager frame by frame and stops on quit or exit,
+- frame timing statistics are summarised in milliseconds.
+"""
+import types
+
+import pytest
+
+from managers import replay as replay_module
+from managers.replay import Recorder, Replay, frame_stats, run_frames
+
+QUIT = 256
+
+
+class FakeEvent:
+    def __init__(self, event_type, attributes=None):
+        self.type = event_type
+        self.dict = dict(attributes or {})
+        for name, value in self.dict.items():
+            setattr(self, name, value)
+
+
+class FakeSceneManager:
+    def __init__(self, exit_on_frame=None):
+        self.exit_on_frame = exit_on_frame
+        self.frames = []
+
+    def handle_events(self, events):
+        self.frames.append(list(events))
+
+    def update(self):
+        return len(self.frames) != self.exit_on_frame
+
+    def draw(self):
+        pass
+
+
+@pytest.fixture(autouse=True)
+def fake_pygame(monkeypatch):
+    monkeypatch.setattr(replay_module, "pygame",
+                        types.SimpleNamespace(QUIT=QUIT, event=types.SimpleNamespace(Event=FakeEvent)))
+
+
+def test_recording_round_trip(tmp_path):
+    path = str(tmp_path / "session.replay.gz")
+    recorder = Recorder(path, seed=1234)
+    recorder.record_frame([])
+    recorder.record_frame([FakeEvent(1024, {"pos": (10, 20), "buttons": (1, 0, 0), "window": object()})])
+    recorder.save()
+
+    replay = Replay(path)
+    assert replay.seed == 1234
+    assert len(replay) == 2
+    assert replay.frames[0] == []
+    event = replay.frames[1][0]
+    assert event.type == 1024
+    assert event.dict == {"pos": (10, 20), "buttons": (1, 0, 0)}
+
+
+def test_run_frames_stops_on_quit():
+    manager = FakeSceneManager()
+    frames = [[], [FakeEvent(2)], [FakeEvent(QUIT)], [FakeEvent(3)]]
+    presented = []
+
+    times = run_frames(frames, manager, present=lambda: presented.append(True))
+
+    assert len(times) == 3
+    assert [[e.type for e in frame] for frame in manager.frames] == [[], [2], [QUIT]]
+    assert len(presented) == 3
+
+
+def test_run_frames_stops_when_scenes_exit():
+    manager = FakeSceneManager(exit_on_frame=2)
+    assert len(run_frames([[]] * 5, manager)) == 2
+
+
+def test_frame_stats():
+    stats = frame_stats([0.001, 0.002, 0.003, 0.010])
+    assert stats["frames"] == 4
+    assert stats["total_ms"] == pytest.approx(16.0)
+    assert stats["median_ms"] == pytest.approx(2.5)
+    assert stats["max_ms"] == pytest.approx(10.0)
+    assert stats["fps"] == pytest.approx(250.0)
+    assert frame_stats([]) == {"frames": 0}
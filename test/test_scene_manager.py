@@ -1,11 +1,10 @@
 import sys
 import types
 
-# --- fake dependencies inserted BEFORE importing scene_manager ---
-# noop pygame so any imports succeed in tests
-sys.modules.setdefault("pygame", types.ModuleType("pygame"))
+import pytest
 
-# define DummyTitleScreen early and expose as scenes.title_screen.TitleScreen
+# Dummy scenes, installed as scenes.title_screen / scenes.playing_screen by
+# the fixture below for each test only
 class DummyTitleScreen:
     def __init__(self, screen):
         self.screen = screen
@@ -22,10 +21,23 @@ class DummyTitleScreen:
     def draw(self):
         self.draw_called = True
 
-mod = types.ModuleType("scenes.title_screen")
-mod.TitleScreen = DummyTitleScreen
-sys.modules["scenes.title_screen"] = mod
-# -----------------------------------------------------------------
+class DummyPlayingScreen(DummyTitleScreen):
+    def __init__(self, screen, **options):
+        super().__init__(screen)
+        self.options = options
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+@pytest.fixture(autouse=True)
+def dummy_scenes(monkeypatch):
+    title_mod = types.ModuleType("scenes.title_screen")
+    title_mod.TitleScreen = DummyTitleScreen
+    playing_mod = types.ModuleType("scenes.playing_screen")
+    playing_mod.PlayingScreen = DummyPlayingScreen
+    monkeypatch.setitem(sys.modules, "scenes.title_screen", title_mod)
+    monkeypatch.setitem(sys.modules, "scenes.playing_screen", playing_mod)
 
 from managers import scene_manager as scene_manager_module
 from managers.scene_manager import SceneManager, GameState
@@ -86,4 +98,67 @@ def test_draw_delegates_to_scene_draw():
 
     assert not ts.draw_called
     manager.draw()
-    assert ts.draw_called is True
\ No newline at end of file
+    assert ts.draw_called is True
+
+def test_playing_scene_receives_events_and_returns_to_title():
+    screen = DummyScreen()
+    manager = SceneManager(screen)
+    manager.current_state = GameState.PLAYING
+    ps = manager.scenes[GameState.PLAYING]
+
+    manager.handle_events(["key"])
+    manager.draw()
+    assert ps.handled_events == ["key"]
+    assert ps.draw_called is True
+    assert manager.scenes[GameState.TITLE].handled_events == []
+
+    ps.update_action = "title"
+    assert manager.update() is True
+    assert manager.current_state == GameState.TITLE
+
+def test_states_without_a_scene_are_ignored():
+    screen = DummyScreen()
+    manager = SceneManager(screen)
+    manager.current_state = GameState.OPTIONS
+
+    manager.handle_events(["event"])
+    manager.draw()
+    assert manager.update() is True
+
+def test_scenes_are_created_on_first_use():
+    screen = DummyScreen()
+    manager = SceneManager(screen)
+    assert GameState.PLAYING not in manager.scenes
+
+    manager.current_state = GameState.PLAYING
+    manager.draw()
+    assert isinstance(manager.scenes[GameState.PLAYING], DummyPlayingScreen)
+    assert GameState.TITLE not in manager.scenes
+
+def test_scene_options_are_passed_to_their_scene():
+    screen = DummyScreen()
+    manager = SceneManager(screen, scene_options={GameState.PLAYING: {"wait_for_chunks": True}})
+    manager.current_state = GameState.PLAYING
+
+    assert manager.scenes[GameState.PLAYING].options == {"wait_for_chunks": True}
+    assert isinstance(manager.scenes[GameState.TITLE], DummyTitleScreen)
+
+def test_leaving_a_scene_closes_it():
+    screen = DummyScreen()
+    manager = SceneManager(screen)
+    title = manager.scenes[GameState.TITLE]
+    title.update_action = "new_game"
+    manager.update()
+    ps = manager.scenes[GameState.PLAYING]
+
+    ps.update_action = "title"
+    manager.update()
+    assert ps.closed is True
+    assert GameState.PLAYING not in manager.scenes
+    assert manager.scenes[GameState.TITLE] is title
+
+    manager.current_state = GameState.PLAYING
+    second = manager.scenes[GameState.PLAYING]
+    assert second is not ps
+    manager.close()
+    assert second.closed is True
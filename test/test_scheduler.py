@@ -0,0 +1,94 @@
+"""
+Tests for core.scheduler.
+
+These unit tests verify:
+- speed comes from dexterity and archetype bonuses,
+- faster actors act more often,
+- actors sharing a tick are returned together, in scheduling order,
+- reschedule and remove take effect immediately.
+"""
+import pytest
+
+from core.player import Player
+from core.scheduler import (
+    ACTION_COST,
+    TurnScheduler,
+    action_delay,
+    player_speed,
+    speed_from_dexterity,
+)
+
+
+def test_speed_from_dexterity_and_archetype():
+    """Dexterity (with archetype bonus) sets speed; there's a floor."""
+    assert speed_from_dexterity(10) == 100
+    assert speed_from_dexterity(14) == 120
+    assert speed_from_dexterity(10, bonus=4) == 120
+    assert speed_from_dexterity(-50) == 25
+
+    player = Player.new_player(name="Legolas", race="ELF", character_class="RANGER")
+    # Elf +2 and Ranger +3 dexterity
+    assert player_speed(player) == speed_from_dexterity(player.dexterity + 5)
+
+    assert action_delay(100) == ACTION_COST
+    assert action_delay(200) == ACTION_COST // 2
+
+
+def test_faster_actors_act_more_often():
+    """Over the same stretch of time a double-speed actor gets twice the turns."""
+    scheduler = TurnScheduler()
+    scheduler.add("hobbit", 200)
+    scheduler.add("troll", 100)
+
+    turns = {"hobbit": 0, "troll": 0}
+    while scheduler.now < 1000:
+        _, actors = scheduler.next_batch()
+        for actor in actors:
+            turns[actor] += 1
+
+    assert turns == {"hobbit": 20, "troll": 10}
+
+
+def test_batches_share_a_tick():
+    """Everyone due at the same tick comes out in one batch, in order added."""
+    scheduler = TurnScheduler()
+    for slot in range(5):
+        scheduler.add(slot, 100)
+    scheduler.add("quick", 100, delay=40)
+
+    assert scheduler.next_batch() == (40, ["quick"])
+    assert scheduler.next_batch() == (100, [0, 1, 2, 3, 4])
+    assert scheduler.now == 100
+
+
+def test_reschedule_and_remove():
+    """Rescheduling moves a turn; removed actors never come back."""
+    scheduler = TurnScheduler()
+    scheduler.add("player", 100)
+    scheduler.add("orc", 100)
+    scheduler.add("goblin", 100)
+
+    scheduler.reschedule("player", cost=50)
+    scheduler.remove("goblin")
+    assert len(scheduler) == 2
+    assert "goblin" not in scheduler
+
+    assert scheduler.next_batch() == (50, ["player"])
+    scheduler.set_speed("orc", 50)
+    assert scheduler.next_batch() == (100, ["orc"])
+    assert scheduler.next_batch() == (150, ["player"])
+    # the orc's slower speed applies from its last turn on
+    assert scheduler.next_batch() == (250, ["player"])
+    assert scheduler.next_batch() == (300, ["orc"])
+
+    with pytest.raises(ValueError):
+        scheduler.add("orc", 100)
+    with pytest.raises(KeyError):
+        scheduler.remove("goblin")
+
+
+def test_empty_scheduler():
+    """An empty scheduler has no next turn."""
+    scheduler = TurnScheduler()
+    assert scheduler.next_time() is None
+    assert scheduler.next_batch() == (None, [])
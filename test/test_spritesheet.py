@@ -0,0 +1,119 @@
+"""
+Tests for graphics.spritesheet.
+
+These unit tests use dummy surfaces instead of pygame and verify:
+- frames are sliced once per cell and shared across animations,
+- Animation playback for looping and one-shot animations,
+- AnimationState only restarts when the animation changes,
+- FrameCache reuses variants and evicts the least recently used one.
+"""
+import types
+
+from graphics import spritesheet as spritesheet_module
+from graphics.spritesheet import Animation, AnimationState, FrameCache, SpriteSheet
+
+
+class DummySurface:
+    def __init__(self, rect=None):
+        self.rect = rect
+        self.subsurface_calls = []
+
+    def subsurface(self, rect):
+        self.subsurface_calls.append(rect)
+        return DummySurface(rect)
+
+
+LAYOUT = {
+    "frame_width": 32,
+    "frame_height": 16,
+    "animations": {
+        "idle": {"frames": [[0, 0]], "frame_ms": 200},
+        "walk": {"frames": [[0, 1], [0, 0], [0, 2], [0, 0]], "frame_ms": 100},
+        "attack": {"frames": [[1, 3], [2, 3]], "frame_ms": 50, "loop": False},
+    },
+}
+
+
+def test_sheet_slices_each_cell_once():
+    """Cells used by several animations are sliced once and shared."""
+    surface = DummySurface()
+    sheet = SpriteSheet("dummy", surface, LAYOUT)
+
+    assert len(surface.subsurface_calls) == 5
+    assert (32, 48, 32, 16) in surface.subsurface_calls
+    assert sheet.animation("idle").frames[0] is sheet.animation("walk").frames[1]
+
+
+def test_animation_looping_and_one_shot():
+    """Looping animations wrap around; one-shot animations hold the last frame."""
+    sheet = SpriteSheet("dummy", DummySurface(), LAYOUT)
+    walk = sheet.animation("walk")
+    attack = sheet.animation("attack")
+
+    assert walk.frame_index(0) == 0
+    assert walk.frame_index(250) == 2
+    assert walk.frame_index(450) == 0
+    assert attack.frame_index(75) == 1
+    assert attack.frame_index(10_000) == 1
+
+
+def test_animation_state_play_and_finish():
+    """AnimationState keeps progress when replaying the same animation."""
+    sheet = SpriteSheet("dummy", DummySurface(), LAYOUT)
+    state = AnimationState(sheet.animation("attack"))
+
+    state.update(60)
+    state.play(sheet.animation("attack"))
+    assert state.elapsed_ms == 60
+    assert state.frame is sheet.animation("attack").frames[1]
+    assert not state.finished
+
+    state.update(60)
+    assert state.finished
+
+    state.play(sheet.animation("idle"))
+    assert state.elapsed_ms == 0
+
+
+def test_frame_cache_reuses_and_evicts(monkeypatch):
+    """Variants are transformed once and evicted least-recently-used first."""
+    calls = []
+
+    def scale(surface, size):
+        calls.append(("scale", size))
+        return DummySurface(size)
+
+    def flip(surface, flip_x, flip_y):
+        calls.append(("flip", flip_x, flip_y))
+        return DummySurface((flip_x, flip_y))
+
+    fake_pygame = types.SimpleNamespace(transform=types.SimpleNamespace(scale=scale, flip=flip))
+    monkeypatch.setattr(spritesheet_module, "pygame", fake_pygame)
+
+    frame_a = DummySurface()
+    frame_b = DummySurface()
+    cache = FrameCache(max_entries=2)
+
+    assert cache.get(frame_a) is frame_a
+    assert len(cache) == 0
+
+    scaled = cache.get(frame_a, size=(64, 32))
+    assert cache.get(frame_a, size=(64, 32)) is scaled
+    assert calls == [("scale", (64, 32))]
+
+    cache.get(frame_b, flip_x=True)
+    cache.get(frame_a, size=(64, 32))  # refresh frame_a so frame_b is the oldest
+    cache.get(frame_b, size=(16, 8))
+    assert len(cache) == 2
+
+    calls.clear()
+    cache.get(frame_a, size=(64, 32))
+    assert calls == []
+    cache.get(frame_b, flip_x=True)
+    assert calls == [("flip", True, False)]
+
+
+def test_animation_duration():
+    """Animation duration is frame time multiplied by frame count."""
+    anim = Animation(name="x", frames=(1, 2, 3), frame_ms=40)
+    assert anim.duration_ms == 120
@@ -0,0 +1,34 @@
+"""
+Tests for tools.startup_report.
+
+These unit tests verify that -X importtime output is parsed into per-module
+timings with the right nesting depth, and that the report lists the slowest
+imports first.
+"""
+import io
+
+from tools.startup_report import parse_importtime, print_report
+
+SAMPLE = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:       300 |        900 |     pygame.base
+import time:      1500 |       2400 |   pygame
+some unrelated line
+import time:        50 |       2450 | main
+"""
+
+
+def test_parse_importtime():
+    timings = parse_importtime(SAMPLE)
+    assert [t.module for t in timings] == ["_io", "pygame.base", "pygame", "main"]
+    assert [t.depth for t in timings] == [1, 2, 1, 0]
+    assert timings[2].self_us == 1500 and timings[2].cumulative_us == 2400
+
+
+def test_report_sorts_by_cumulative_time():
+    out = io.StringIO()
+    print_report(0.25, parse_importtime(SAMPLE), top=2, out=out)
+    lines = out.getvalue().splitlines()
+    assert lines[0].startswith("Time to first frame: 250.0 ms (imports 2.5 ms")
+    assert lines[-2].endswith("main") and lines[-1].endswith("pygame")
@@ -0,0 +1,67 @@
+"""
+Tests for core.tilemap.
+
+These unit tests verify:
+- Tile lookup by code,
+- get/set bounds checking,
+- listeners are only notified about real changes,
+- fill_rect clipping and write_region bulk copies.
+"""
+import pytest
+
+from core.tilemap import Tile, TileMap
+
+
+def test_tile_from_code():
+    """Every tile can be recovered from its code."""
+    for tile in Tile:
+        assert Tile.from_code(tile.code) is tile
+    assert Tile.WALL.opaque and not Tile.WALL.walkable
+
+
+def test_get_set_and_bounds():
+    """Tiles can be read and written; out of bounds access raises IndexError."""
+    tile_map = TileMap(4, 3)
+    assert tile_map.get(3, 2) is Tile.WALL
+
+    tile_map.set(1, 2, Tile.FLOOR)
+    assert tile_map.get(1, 2) is Tile.FLOOR
+    assert tile_map.tiles[2 * 4 + 1] == Tile.FLOOR.code
+
+    with pytest.raises(IndexError):
+        tile_map.get(4, 0)
+    with pytest.raises(IndexError):
+        tile_map.set(0, -1, Tile.FLOOR)
+    with pytest.raises(ValueError):
+        TileMap(0, 5)
+
+
+def test_listeners_only_hear_about_changes():
+    """Setting a tile to its current value doesn't notify listeners."""
+    tile_map = TileMap(8, 8)
+    changes = []
+    tile_map.add_listener(lambda *rect: changes.append(rect))
+
+    tile_map.set(2, 3, Tile.WALL)
+    tile_map.set(2, 3, Tile.FLOOR)
+    tile_map.fill_rect(6, 6, 5, 5, Tile.WATER)
+    tile_map.fill_rect(20, 20, 2, 2, Tile.WATER)
+
+    assert changes == [(2, 3, 1, 1), (6, 6, 2, 2)]
+    assert tile_map.get(7, 7) is Tile.WATER
+
+
+def test_write_region():
+    """write_region copies a block of codes row by row."""
+    tile_map = TileMap(5, 5)
+    codes = bytes([Tile.FLOOR.code, Tile.DOOR.code, Tile.WATER.code, Tile.FLOOR.code])
+    tile_map.write_region(3, 1, 2, 2, codes)
+
+    assert tile_map.get(3, 1) is Tile.FLOOR
+    assert tile_map.get(4, 1) is Tile.DOOR
+    assert tile_map.get(3, 2) is Tile.WATER
+
+    with pytest.raises(IndexError):
+        tile_map.write_region(4, 4, 2, 2, codes)
+    with pytest.raises(ValueError):
+        tile_map.write_region(0, 0, 3, 3, codes)
@@ -0,0 +1,88 @@
+"""
+Tests for graphics.tilemap_renderer.
+
+pygame surfaces are replaced with a small fake that counts fills and blits.
+These unit tests verify:
+- only chunks overlapping the camera are drawn,
+- chunks are rendered once and re-rendered only after a tile changes,
+- the chunk cache is bounded,
+- the camera stays inside the world.
+"""
+import types
+
+import pytest
+
+from core.tilemap import Tile, TileMap
+from graphics import tilemap_renderer as renderer_module
+from graphics.tilemap_renderer import Camera, ChunkedTileRenderer
+
+
+class FakeSurface:
+    def __init__(self, size=(0, 0)):
+        self.size = size
+        self.fills = 0
+        self.blitted = []
+
+    def fill(self, colour, rect=None):
+        self.fills += 1
+
+    def blits(self, seq, doreturn=True):
+        self.blitted.extend(seq)
+
+
+@pytest.fixture
+def fake_pygame(monkeypatch):
+    monkeypatch.setattr(renderer_module, "pygame", types.SimpleNamespace(Surface=FakeSurface))
+
+
+def test_only_visible_chunks_are_drawn(fake_pygame):
+    """A camera over a large map blits just the chunks it overlaps."""
+    renderer = ChunkedTileRenderer(TileMap(1024, 1024), tile_size=32, chunk_tiles=16)
+    camera = Camera(1024, 768, x=100, y=100)
+    target = FakeSurface()
+
+    renderer.draw(target, camera)
+
+    # 512px chunks: x 100..1123 -> chunks 0..2, y 100..867 -> chunks 0..1
+    assert len(target.blitted) == 6
+    assert target.blitted[0][1] == (-100, -100)
+    assert renderer.chunks_rendered == 6
+
+
+def test_chunks_rerender_only_when_tiles_change(fake_pygame):
+    """Redrawing is free until a tile inside a cached chunk changes."""
+    tile_map = TileMap(64, 64)
+    renderer = ChunkedTileRenderer(tile_map, tile_size=8, chunk_tiles=16)
+    camera = Camera(256, 256)
+
+    renderer.draw(FakeSurface(), camera)
+    renderer.draw(FakeSurface(), camera)
+    assert renderer.chunks_rendered == 4
+
+    tile_map.set(17, 3, Tile.FLOOR)
+    assert renderer.dirty == {(1, 0)}
+    renderer.draw(FakeSurface(), camera)
+    assert renderer.chunks_rendered == 5
+    assert not renderer.dirty
+
+
+def test_chunk_cache_is_bounded(fake_pygame):
+    """Scrolling across the map never keeps more than max_chunks surfaces."""
+    renderer = ChunkedTileRenderer(TileMap(256, 16), tile_size=8, chunk_tiles=16, max_chunks=3)
+    camera = Camera(128, 128)
+
+    for x in range(0, 256 * 8 - 128, 128):
+        camera.x = x
+        renderer.draw(FakeSurface(), camera)
+
+    assert len(renderer.chunks) == 3
+
+
+def test_camera_clamps_to_world():
+    """The camera can't scroll past the edges of the world."""
+    camera = Camera(100, 100)
+    camera.move(-50, 500, 400, 300)
+    assert (camera.x, camera.y) == (0, 200)
+
+    camera.center_on(390, 10, 400, 300)
+    assert (camera.x, camera.y) == (300, 0)
@@ -0,0 +1,279 @@
+"""
+Monte Carlo combat/balance simulator for Thangorodrim.
+
+Every Race x CharacterClass build is rolled fresh with Player.new_player,
+armed with each weapon in data/items.json, and made to fight each monster
+in data/monsters.json until one side drops. Running many trials per
+matchup gives a win rate (with a Wilson confidence interval) and the
+distribution of rounds it took to win (time-to-kill).
+
+Trials are split into batches and fanned out across a ProcessPoolExecutor.
+Each batch seeds its worker's RNG (which is what Die.roll uses) from a
+seed derived from --seed and the batch's position in the run, so results
+are reproducible and don't depend on the number of workers.
+
+Usage:
+python -m tools.balance_sim --trials 2000 --workers 8 --seed 42
+python -m tools.balance_sim --race ELF --class RANGER --monster Orc --csv elf_ranger.csv
+"""
+
+import argparse
+import csv
+import os
+import random
+import statistics
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from itertools import product
+from math import floor, sqrt
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from core.classes import CharacterClass
+from core.die import Die
+from core.item import load_item_templates
+from core.monsters import MonsterTemplate, load_monster_templates
+from core.player import Player
+from core.races import Race
+
+# A fight that isn't over after this many rounds counts as a loss.
+MAX_ROUNDS = 100
+
+# z value for the 95% confidence intervals in the report
+Z_95 = 1.96
+
+ABILITIES = ("strength", "intelligence", "dexterity", "constitution")
+
+
+def modifier(score: int) -> int:
+    return floor((score - 10) / 2)
+
+
+@dataclass(frozen=True)
+class Matchup:
+    """One cell of the balance matrix. Everything a worker needs is in here."""
+    race: str
+    character_class: str
+    weapon_id: str
+    damage_die: str
+    monster: MonsterTemplate
+
+    @property
+    def label(self) -> Tuple[str, str, str, str]:
+        return (self.race, self.character_class, self.weapon_id, self.monster.name)
+
+
+@dataclass
+class MatchupResult:
+    """Aggregated outcome of every trial run for a Matchup.
+
+    Attributes:
+        matchup: The matchup these trials belong to.
+        trials: Number of fights simulated.
+        wins: Fights the player won.
+        kill_rounds: Rounds taken to kill the monster, one entry per win.
+    """
+    matchup: Matchup
+    trials: int = 0
+    wins: int = 0
+    kill_rounds: List[int] = field(default_factory=list)
+
+    def merge(self, other: "MatchupResult"):
+        self.trials += other.trials
+        self.wins += other.wins
+        self.kill_rounds.extend(other.kill_rounds)
+
+    @property
+    def win_rate(self) -> float:
+        return self.wins / self.trials if self.trials else 0.0
+
+    def win_rate_interval(self, z: float = Z_95) -> Tuple[float, float]:
+        """Wilson score interval for the win rate."""
+        if not self.trials:
+            return 0.0, 1.0
+        n, p = self.trials, self.win_rate
+        centre = (p + z * z / (2 * n)) / (1 + z * z / n)
+        half = z * sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / (1 + z * z / n)
+        return max(0.0, centre - half), min(1.0, centre + half)
+
+    def ttk_summary(self, z: float = Z_95) -> Dict[str, Optional[float]]:
+        """Mean (with confidence interval), median and 90th percentile time-to-kill."""
+        rounds = self.kill_rounds
+        if not rounds:
+            return {"mean": None, "mean_low": None, "mean_high": None, "median": None, "p90": None}
+        mean = statistics.fmean(rounds)
+        half = z * statistics.stdev(rounds) / sqrt(len(rounds)) if len(rounds) > 1 else 0.0
+        p90 = statistics.quantiles(rounds, n=10)[-1] if len(rounds) > 1 else float(rounds[0])
+        return {"mean": mean, "mean_low": mean - half, "mean_high": mean + half,
+                "median": statistics.median(rounds), "p90": p90}
+
+
+# --- COMBAT ---
+
+def attack(attack_mod: int, damage_die: str, damage_mod: int, defense: int) -> int:
+    """Roll one attack: 1d20 + attack_mod against defense. Returns damage dealt."""
+    to_hit, _ = Die.roll('1d20')
+    if to_hit + attack_mod < defense:
+        return 0
+    damage, _ = Die.roll(damage_die)
+    return max(1, damage + damage_mod)
+
+
+def fight(matchup: Matchup, max_rounds: int = MAX_ROUNDS) -> Tuple[bool, int]:
+    """Simulate one fight to the death. Returns (player_won, rounds)."""
+    player = Player.new_player(name="Sim", character_class=matchup.character_class, race=matchup.race)
+    bonuses = player.archetype.bonuses
+    abilities = {name: getattr(player, name) + bonuses.get(name, 0) for name in ABILITIES}
+    player_hp = player.max_hit_points
+    player_str, player_dex = modifier(abilities["strength"]), modifier(abilities["dexterity"])
+
+    monster = matchup.monster
+    monster_str = modifier(monster.stats.get("strength", 10))
+    monster_dex = modifier(monster.stats.get("dexterity", 10))
+    monster_hp, _ = Die.roll(monster.health_die)
+    monster_hp = max(1, monster_hp + modifier(monster.stats.get("constitution", 10)))
+
+    player_defense = 10 + player_dex
+    monster_defense = 10 + monster_dex
+    player_first = player_dex >= monster_dex
+
+    for round_number in range(1, max_rounds + 1):
+        if player_first:
+            monster_hp -= attack(player_dex, matchup.damage_die, player_str, monster_defense)
+            if monster_hp <= 0:
+                return True, round_number
+            player_hp -= attack(monster_dex, monster.damage_die, monster_str, player_defense)
+            if player_hp <= 0:
+                return False, round_number
+        else:
+            player_hp -= attack(monster_dex, monster.damage_die, monster_str, player_defense)
+            if player_hp <= 0:
+                return False, round_number
+            monster_hp -= attack(player_dex, matchup.damage_die, player_str, monster_defense)
+            if monster_hp <= 0:
+                return True, round_number
+    return False, max_rounds
+
+
+def run_batch(matchup: Matchup, trials: int, seed: int) -> MatchupResult:
+    """Worker entry point: run `trials` fights with the worker's RNG seeded."""
+    random.seed(seed)
+    result = MatchupResult(matchup)
+    for _ in range(trials):
+        won, rounds = fight(matchup)
+        result.trials += 1
+        if won:
+            result.wins += 1
+            result.kill_rounds.append(rounds)
+    return result
+
+
+# --- RUNNING ---
+
+def build_matchups(races: Sequence[str] = (), classes: Sequence[str] = (),
+                   weapons: Sequence[str] = (), monsters: Sequence[str] = ()) -> List[Matchup]:
+    """Every Race x CharacterClass x weapon x monster combination, optionally filtered."""
+    weapon_templates = {item_id: t for item_id, t in load_item_templates().items() if "weapon" in t}
+    monster_templates = load_monster_templates()
+    return [Matchup(race=race.name,
+                    character_class=char_class.name,
+                    weapon_id=weapon_id,
+                    damage_die=weapon_templates[weapon_id]["weapon"]["damage_die"],
+                    monster=monster)
+            for race, char_class, weapon_id, monster in product(Race, CharacterClass,
+                                                                sorted(weapon_templates),
+                                                                monster_templates)
+            if (not races or race.name in races)
+            and (not classes or char_class.name in classes)
+            and (not weapons or weapon_id in weapons)
+            and (not monsters or monster.name in monsters)]
+
+
+def simulate(matchups: Sequence[Matchup], trials: int, workers: Optional[int] = None,
+             seed: Optional[int] = None, batch_size: int = 250) -> List[MatchupResult]:
+    """Run `trials` fights for every matchup and return one result per matchup.
+
+    With workers=1 everything runs in this process, which is handy for
+    debugging; otherwise batches are spread over a ProcessPoolExecutor.
+    """
+    seeder = random.Random(seed)
+    batches = []
+    for index, matchup in enumerate(matchups):
+        for start in range(0, trials, batch_size):
+            batches.append((index, matchup, min(batch_size, trials - start), seeder.getrandbits(64)))
+
+    results = [MatchupResult(matchup) for matchup in matchups]
+    args = ([m for _, m, _, _ in batches], [n for _, _, n, _ in batches], [s for _, _, _, s in batches])
+    if workers == 1:
+        partials = map(run_batch, *args)
+        for (index, _, _, _), partial in zip(batches, partials):
+            results[index].merge(partial)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunksize = max(1, len(batches) // ((workers or os.cpu_count() or 1) * 4))
+            partials = executor.map(run_batch, *args, chunksize=chunksize)
+            for (index, _, _, _), partial in zip(batches, partials):
+                results[index].merge(partial)
+    return results
+
+
+# --- REPORTING ---
+
+REPORT_COLUMNS = ["race", "class", "weapon", "monster", "trials", "win_rate", "win_low", "win_high",
+                  "ttk_mean", "ttk_mean_low", "ttk_mean_high", "ttk_median", "ttk_p90"]
+
+
+def report_rows(results: Sequence[MatchupResult]) -> List[List]:
+    rows = []
+    for result in results:
+        low, high = result.win_rate_interval()
+        ttk = result.ttk_summary()
+        rows.append([*result.matchup.label, result.trials, result.win_rate, low, high,
+                     ttk["mean"], ttk["mean_low"], ttk["mean_high"], ttk["median"], ttk["p90"]])
+    return rows
+
+
+def print_report(results: Sequence[MatchupResult], out=sys.stdout):
+    header = f"{'Race':<8} {'Class':<8} {'Weapon':<14} {'Monster':<11} {'Win %':>6} {'95% CI':>13} {'TTK':>5} {'p90':>5}"
+    print(header, file=out)
+    print("-" * len(header), file=out)
+    for row in report_rows(results):
+        race, char_class, weapon, monster, _, win, low, high, mean, _, _, _, p90 = row
+        ttk = f"{mean:5.1f}" if mean is not None else "    -"
+        tail = f"{p90:5.1f}" if p90 is not None else "    -"
+        print(f"{race:<8} {char_class:<8} {weapon:<14} {monster:<11} {win * 100:6.1f} "
+              f"{low * 100:5.1f}-{high * 100:5.1f}% {ttk} {tail}", file=out)
+
+
+def write_csv(results: Sequence[MatchupResult], path: str):
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(REPORT_COLUMNS)
+        writer.writerows(report_rows(results))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulate fights for every race/class/weapon/monster matchup.")
+    parser.add_argument("--trials", type=int, default=1000, help="fights per matchup (default 1000)")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: one per CPU)")
+    parser.add_argument("--seed", type=int, default=None, help="seed for reproducible runs")
+    parser.add_argument("--batch-size", type=int, default=250, help="fights per worker task")
+    parser.add_argument("--race", action="append", default=[], help="only simulate this race (repeatable)")
+    parser.add_argument("--class", dest="classes", action="append", default=[],
+                        help="only simulate this class (repeatable)")
+    parser.add_argument("--weapon", action="append", default=[], help="only simulate this weapon id (repeatable)")
+    parser.add_argument("--monster", action="append", default=[], help="only simulate this monster (repeatable)")
+    parser.add_argument("--csv", help="also write the results to this CSV file")
+    args = parser.parse_args(argv)
+
+    matchups = build_matchups(args.race, args.classes, args.weapon, args.monster)
+    if not matchups:
+        parser.error("No matchups left after filtering.")
+    results = simulate(matchups, args.trials, workers=args.workers, seed=args.seed, batch_size=args.batch_size)
+    print_report(results)
+    if args.csv:
+        write_csv(results, args.csv)
+
+
+if __name__ == "__main__":
+    main()
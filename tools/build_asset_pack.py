@@ -0,0 +1,99 @@
+"""
+Build the asset pack for Thangorodrim.
+
+Packs every file under assets/ into one indexed archive (assets.pack by
+default) that managers.asset_manager.AssetManager memory-maps at runtime.
+See that module for the file layout.
+
+With --raw-images, images are decoded now and stored as raw RGBA pixels,
+so the game can use them without decoding anything at startup. Raw images
+are much bigger than the JPEG/PNG files they come from.
+
+Usage:
+python -m tools.build_asset_pack
+python -m tools.build_asset_pack --raw-images --output build/assets.pack
+"""
+
+import argparse
+import json
+import os
+from typing import Dict, List, Tuple
+
+import pygame
+
+from managers.asset_manager import ASSET_PACK_FILE, ASSETS_DIR, PACK_HEADER, PACK_MAGIC, PACK_VERSION
+
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp", ".tga")
+
+# Asset data starts on multiples of this many bytes
+ALIGNMENT = 16
+
+
+def is_hidden(name: str) -> bool:
+    """Dotfiles (.DS_Store, .foo.swp, .git) and editor backups (foo~) aren't assets."""
+    return name.startswith(".") or name.endswith("~")
+
+
+def find_assets(assets_dir: str) -> List[Tuple[str, str]]:
+    """(asset name, file path) for every file under assets_dir, sorted by name.
+
+    Hidden files and directories are skipped (see is_hidden).
+    """
+    found = []
+    for root, dirs, files in os.walk(assets_dir):
+        dirs[:] = [name for name in dirs if not is_hidden(name)]
+        for filename in files:
+            if is_hidden(filename):
+                continue
+            path = os.path.join(root, filename)
+            found.append((os.path.relpath(path, assets_dir).replace(os.sep, "/"), path))
+    return sorted(found)
+
+
+def decode_rgba(path: str) -> Tuple[bytes, int, int]:
+    """Decode an image file to raw RGBA bytes plus its size."""
+    surface = pygame.image.load(path)
+    width, height = surface.get_size()
+    return pygame.image.tobytes(surface, "RGBA"), width, height
+
+
+def build_pack(assets_dir: str = ASSETS_DIR, output: str = ASSET_PACK_FILE,
+               raw_images: bool = False) -> Dict[str, Dict]:
+    """Write the pack and return its index."""
+    index: Dict[str, Dict] = {}
+    with open(output, 'wb') as out:
+        out.write(b"\0" * PACK_HEADER.size)
+        for name, path in find_assets(assets_dir):
+            entry = {"format": "file"}
+            if raw_images and name.lower().endswith(IMAGE_EXTENSIONS):
+                data, width, height = decode_rgba(path)
+                entry.update(format="rgba", width=width, height=height)
+            else:
+                with open(path, 'rb') as f:
+                    data = f.read()
+            out.write(b"\0" * (-out.tell() % ALIGNMENT))
+            entry.update(offset=out.tell(), size=len(data))
+            out.write(data)
+            index[name] = entry
+
+        index_bytes = json.dumps(index, sort_keys=True).encode("utf-8")
+        index_offset = out.tell()
+        out.write(index_bytes)
+        out.seek(0)
+        out.write(PACK_HEADER.pack(PACK_MAGIC, PACK_VERSION, index_offset, len(index_bytes)))
+    return index
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pack assets/ into a single memory-mappable archive.")
+    parser.add_argument("--assets", default=ASSETS_DIR, help=f"directory to pack (default {ASSETS_DIR})")
+    parser.add_argument("--output", default=ASSET_PACK_FILE, help=f"pack file to write (default {ASSET_PACK_FILE})")
+    parser.add_argument("--raw-images", action="store_true", help="store images as decoded RGBA pixels")
+    args = parser.parse_args(argv)
+
+    index = build_pack(args.assets, args.output, raw_images=args.raw_images)
+    print(f"Packed {len(index)} assets into {args.output} ({os.path.getsize(args.output):,} bytes).")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Startup report for Thangorodrim.
+
+Starts the game in a fresh interpreter with `python -X importtime` and a
+headless display, stops as soon as the first title-screen frame has been
+drawn, and reports:
+
+- time to first frame (from the first import to the first display flip),
+- the modules that took longest to import, with their own and cumulative
+  import times as printed by -X importtime.
+
+With --budget-ms it exits with status 1 when the first frame took longer
+than the budget, so it can guard startup time in CI.
+
+Usage:
+python -m tools.startup_report
+python -m tools.startup_report --top 30 --budget-ms 400
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from dataclasses import dataclass
+from typing import List, Tuple
+
+REPO_ROOT = os.path.join(os.path.dirname(__file__), '..')
+
+# Runs in the child interpreter; prints the seconds to the first frame
+FIRST_FRAME_SCRIPT = """
+import time
+start = time.perf_counter()
+import main
+window = main.create_window()
+target = main.create_render_target(window)
+main.SceneManager(target.surface).draw()
+target.present(window)
+main.pygame.display.flip()
+print(time.perf_counter() - start)
+"""
+
+
+@dataclass
+class ImportTiming:
+    """One line of -X importtime output.
+
+    Attributes:
+        module: Fully qualified module name.
+        self_us: Microseconds spent importing the module itself.
+        cumulative_us: Microseconds including everything it imported.
+        depth: Nesting level (0 for modules imported directly by the script).
+    """
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(output: str) -> List[ImportTiming]:
+    """Parse `-X importtime` lines ("import time: self | cumulative | name").
+
+    Lines that aren't import timings (including the header) are skipped.
+    """
+    timings = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue
+        name = fields[2].rstrip()
+        indent = len(name) - len(name.lstrip())
+        timings.append(ImportTiming(module=name.strip(),
+                                    self_us=int(fields[0]),
+                                    cumulative_us=int(fields[1]),
+                                    depth=max(0, (indent - 1) // 2)))
+    return timings
+
+
+def measure_startup(python: str = sys.executable) -> Tuple[float, List[ImportTiming]]:
+    """Run FIRST_FRAME_SCRIPT in a child interpreter; return (seconds, import timings)."""
+    env = dict(os.environ, SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy", PYGAME_HIDE_SUPPORT_PROMPT="1")
+    result = subprocess.run([python, "-X", "importtime", "-c", FIRST_FRAME_SCRIPT],
+                            cwd=REPO_ROOT, env=env, capture_output=True, text=True, check=True)
+    return float(result.stdout.strip().splitlines()[-1]), parse_importtime(result.stderr)
+
+
+def print_report(first_frame: float, timings: List[ImportTiming], top: int = 20, out=sys.stdout):
+    total_us = sum(t.cumulative_us for t in timings if t.depth == 0)
+    print(f"Time to first frame: {first_frame * 1000:.1f} ms "
+          f"(imports {total_us / 1000:.1f} ms, {len(timings)} modules)", file=out)
+    print(file=out)
+    print(f"{'Cumulative ms':>13} {'Self ms':>8}  Module", file=out)
+    for timing in sorted(timings, key=lambda t: t.cumulative_us, reverse=True)[:top]:
+        print(f"{timing.cumulative_us / 1000:13.1f} {timing.self_us / 1000:8.1f}  "
+              f"{'  ' * timing.depth}{timing.module}", file=out)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Report import times and time to the first frame.")
+    parser.add_argument("--top", type=int, default=20, help="how many modules to list (default 20)")
+    parser.add_argument("--budget-ms", type=float, default=None,
+                        help="exit with status 1 if the first frame takes longer than this")
+    args = parser.parse_args(argv)
+
+    first_frame, timings = measure_startup()
+    print_report(first_frame, timings, args.top)
+    if args.budget_ms is not None and first_frame * 1000 > args.budget_ms:
+        print(f"\nOver budget: {first_frame * 1000:.1f} ms > {args.budget_ms:.1f} ms", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())